@@ -1,28 +1,73 @@
+import io
+import os
+
+import altair as alt
+import numpy as np
 import streamlit as st
 import pandas as pd
-import joblib
-
-# Load model and scaler
-model = joblib.load('lda_model.pkl')
-scaler = joblib.load('scaler.pkl')
-
-# Define Z-score weights for each industry
-z_weights_dict = {
-    'Healthcare': {
-        'X1': -0.140792,
-        'X2':  0.140466,
-        'X3':  0.055419,
-        'X4':  0.075092,
-        'X5':  0.121032
-    },
-    'Tech': {
-        'X1': -0.461234,
-        'X2':  0.538634,
-        'X3':  0.043953,
-        'X4':  0.119705,
-        'X5':  0.172948
-    }
-}
+
+from bankruptcy import ModelRegistry, instrument, score_frame
+from bankruptcy.features import FEATURES as feature_columns, INPUT_COLUMNS as input_columns, compute_ratios
+from bankruptcy.peers import DEFAULT_PEER_INDEX_PATH, PeerIndex
+from bankruptcy.quality import RULE_DESCRIPTIONS, describe_flags
+from bankruptcy.sensitivity import INPUT_LABELS, grid_frame, grid_sweep, sensitivities, sweep_range
+
+# Per-industry models, loaded on first use and shared across sessions
+@st.cache_resource
+def get_registry():
+    return ModelRegistry()
+
+registry = get_registry()
+
+# Sorted peer probabilities per (industry, fyear), built by 'bankruptcy peers'
+@st.cache_resource
+def get_peer_index():
+    if not os.path.isfile(DEFAULT_PEER_INDEX_PATH):
+        return None
+    return PeerIndex.load(DEFAULT_PEER_INDEX_PATH)
+
+peer_index = get_peer_index()
+
+# Scoring results memoized on the rounded ratio vector (bounded, least recently used evicted)
+score_cache_size = 4096
+ratio_decimals = 6
+interval_level = 0.90
+
+@st.cache_data(max_entries=score_cache_size, show_spinner=False)
+def score_company(industry, version, ratios):
+    bundle = registry.get(industry, version)
+    z_score = sum(bundle.z_weights[f] * x for f, x in zip(feature_columns, ratios))
+    ml_prob = bundle.model.folded.score_one(*ratios)
+    return z_score, ml_prob, bundle.risk.label(ml_prob)
+
+def read_batch_file(buffer, file_name):
+    with instrument.stage('app_read_upload'):
+        if file_name.endswith('.parquet'):
+            return pd.read_parquet(buffer)
+        return pd.read_csv(buffer)
+
+# Stage timers and counters, shown only when started with BANKRUPTCY_PROFILE=1
+def show_instrumentation():
+    if not instrument.enabled():
+        return
+    with st.sidebar.expander("⏱️ Instrumentation"):
+        st.json(instrument.snapshot())
+        st.code(instrument.to_prometheus(), language="text")
+
+@st.cache_data(max_entries=score_cache_size, show_spinner=False)
+def company_interval(industry, version, ratios):
+    lower, _, upper = registry.get(industry, version).bootstrap.intervals([ratios], interval_level)
+    return float(lower[0]), float(upper[0])
+
+@st.cache_data(max_entries=16, show_spinner="Scoring filings...")
+def score_upload(file_bytes, file_name, industry, with_intervals=False):
+    batch_df = read_batch_file(io.BytesIO(file_bytes), file_name)
+    missing = [c for c in input_columns if c not in batch_df.columns]
+    if missing:
+        return None, missing
+    result_df = score_frame(batch_df, registry, industry=industry,
+                            interval_level=interval_level if with_intervals else None)
+    return result_df, []
 
 # Set page layout
 st.set_page_config(page_title="Bankruptcy Risk Predictor", layout="centered")
@@ -30,17 +75,53 @@ st.title("📊 Industry-Specific Bankruptcy Risk Predictor")
 st.markdown("Use Altman-style Z-Score + ML model to predict risk for **Healthcare** or **Tech** companies.")
 
 # Select Industry
-industry = st.selectbox("🏭 Select Industry", options=["Healthcare", "Tech"])
-z_weights = z_weights_dict[industry]
+industry = st.selectbox("🏭 Select Industry", options=registry.industries())
+bundle = registry.get(industry)
 
-# Display Risk Buckets (same for now)
+# Display Risk Buckets (stored with each model version)
 with st.expander("📌 Risk Bucket Thresholds"):
-    st.markdown("""
-    - 🔴 **Very High Risk**: < `0.49`  
-    - 🟧 **High Risk**: `0.49 – 0.50`  
-    - 🟨 **Medium Risk**: `0.50 – 0.50`  
-    - 🟩 **Very Low Risk**: > `0.50`
-    """)
+    st.markdown("\n".join(
+        f"- {label.split(' ', 1)[0]} **{label.split(' ', 1)[1]}**: `{bounds}`"
+        for label, bounds in bundle.risk.describe()
+    ))
+    st.caption(f"Model version `{bundle.version}`")
+
+# Scoring Mode
+mode = st.radio("🧮 Scoring Mode", options=["Single Company", "Batch File"], horizontal=True)
+
+# Bootstrap intervals, available once 'bankruptcy bootstrap' has been run for this model version
+show_interval = bundle.bootstrap is not None and st.checkbox(
+    f"📏 Show {interval_level:.0%} bootstrap interval ({len(bundle.bootstrap)} models)"
+)
+
+if mode == "Batch File":
+    st.subheader("📂 Upload Filings")
+    st.markdown(
+        "CSV or Parquet with columns: " + ", ".join(f"`{c}`" for c in input_columns) +
+        ". An optional `industry` column overrides the selected industry per row."
+    )
+    uploaded_file = st.file_uploader("Filings file", type=["csv", "parquet"])
+    if uploaded_file is not None:
+        result_df, missing = score_upload(uploaded_file.getvalue(), uploaded_file.name, industry, show_interval)
+        if missing:
+            st.error(f"Missing columns: {', '.join(missing)}")
+        else:
+            st.success(f"✅ Scored {len(result_df):,} rows")
+            quality = result_df.attrs.get('quality', {})
+            if quality.get('imputed') or quality.get('rejected'):
+                st.warning(f"⚠️ Data quality: {quality['imputed']:,} rows imputed from training means, "
+                           f"{quality['rejected']:,} rows not scored (see `DQ_Flags`)")
+            st.dataframe(pd.Series(quality, name="rows"))
+            st.dataframe(result_df['Risk_Level'].value_counts())
+            st.dataframe(result_df.head(1000))
+            st.download_button(
+                "⬇️ Download Results (CSV)",
+                data=result_df.to_csv(index=False).encode('utf-8'),
+                file_name="bankruptcy_risk_scores.csv",
+                mime="text/csv"
+            )
+    show_instrumentation()
+    st.stop()
 
 # Company Info
 tic = st.text_input("🏷️ Company Ticker (tic)", value="ABC123")
@@ -58,58 +139,110 @@ total_liabilities = st.number_input("Total Liabilities", value=1.0)
 stock_price = st.number_input("Stock Price", value=0.0)
 shares_outstanding = st.number_input("Shares Outstanding", value=0.0)
 
-# Risk Classification Function
-def get_risk(prob):
-    if prob < 0.49:
-        return "🔴 Very High Risk"
-    elif prob < 0.50:
-        return "🟧 High Risk"
-    elif prob <= 0.50:
-        return "🟨 Medium Risk"
-    else:
-        return "🟩 Very Low Risk"
+# Raw inputs keyed by their Compustat column
+inputs = {
+    'act': assets_current_total, 'lct': liabilities_current_total, 'at': total_assets,
+    'seq': retained_earnings, 'ebit': ebit, 'sale': total_sales, 'lt': total_liabilities,
+    'prcc_f': stock_price, 'csho': shares_outstanding,
+}
 
 # Predict button
 if st.button("🔍 Predict Bankruptcy Risk"):
-    x1 = (assets_current_total - liabilities_current_total) / total_assets
-    x2 = retained_earnings / total_assets
-    x3 = ebit / total_assets
-    x4 = (stock_price * shares_outstanding) / total_liabilities
-    x5 = total_sales / total_assets
-
-    z_score = (
-        z_weights['X1'] * x1 +
-        z_weights['X2'] * x2 +
-        z_weights['X3'] * x3 +
-        z_weights['X4'] * x4 +
-        z_weights['X5'] * x5
-    )
+    # Same ratio computation and data-quality gate as the batch scorer
+    columns = {c: [v] for c, v in inputs.items()}
+    raw = compute_ratios(columns)
+    report = bundle.quality.check(raw, columns)
+    x1, x2, x3, x4, x5 = raw[0]
+    issues = [RULE_DESCRIPTIONS[rule] for rule in describe_flags(report.flags[0])]
+    if not report.scored[0]:
+        st.error("❌ Cannot score this company: " + "; ".join(issues) + ".")
+        st.stop()
+    if issues:
+        st.warning("⚠️ " + "; ".join(issues) + "." +
+                   (" Undefined ratios were filled with the model's training means." if report.imputed[0] else ""))
 
-    input_df = pd.DataFrame([[x1, x2, x3, x4, x5]], columns=['X1', 'X2', 'X3', 'X4', 'X5'])
-    scaled_input = scaler.transform(input_df)
-    ml_prob = model.predict_proba(scaled_input)[0, 1]
-    ml_risk = get_risk(ml_prob)
+    ratios = tuple(round(float(x), ratio_decimals) for x in report.X[0])
+    with instrument.stage('app_score_company'):
+        z_score, ml_prob, ml_risk = score_company(industry, bundle.version, ratios)
+    instrument.count('app_predictions')
 
     st.success("✅ Prediction Complete")
     st.write("### 📉 Z-Score Components")
     st.json({
-        "X1 (Working Capital / Total Assets)": round(x1, 4),
-        "X2 (Retained Earnings / Total Assets)": round(x2, 4),
-        "X3 (EBIT / Total Assets)": round(x3, 4),
-        "X4 (Market Value of Equity / Total Liabilities)": round(x4, 4),
-        "X5 (Sales / Total Assets)": round(x5, 4),
+        label: round(float(x), 4) if np.isfinite(x) else None
+        for label, x in zip([
+            "X1 (Working Capital / Total Assets)",
+            "X2 (Retained Earnings / Total Assets)",
+            "X3 (EBIT / Total Assets)",
+            "X4 (Market Value of Equity / Total Liabilities)",
+            "X5 (Sales / Total Assets)",
+        ], (x1, x2, x3, x4, x5))
     })
 
     st.metric("📊 Z-Score", f"{z_score:.4f}")
     st.metric("🤖 ML Probability", f"{ml_prob:.4f}")
+    if show_interval:
+        lower, upper = company_interval(industry, bundle.version, ratios)
+        st.markdown(f"**📏 {interval_level:.0%} Interval**: `{lower:.4f}` – `{upper:.4f}`")
     st.markdown(f"**📌 Risk Zone**: {ml_risk}")
 
-    result_df = pd.DataFrame([{
-        "tic": tic, "fyear": fyear, "industry": industry,
-        "X1": x1, "X2": x2, "X3": x3, "X4": x4, "X5": x5,
-        "Z_Score": z_score,
-        "ML_Probability": ml_prob,
-        "Risk_Level": ml_risk
-    }])
+    # Peer probabilities are only comparable when the index was scored by this version
+    peer_rank = (peer_index.rank(industry, int(fyear), ml_prob, exclude=tic)
+                 if peer_index and peer_index.versions.get(industry) == bundle.version else None)
+    if peer_rank:
+        year_note = "" if peer_rank['fyear'] == fyear else f" (closest indexed year to {fyear})"
+        st.markdown(
+            f"**👥 Peer Percentile**: `{peer_rank['percentile']:.1f}` — higher probability than "
+            f"{peer_rank['percentile']:.0f}% of {peer_rank['peers']:,} {industry} filers in "
+            f"{peer_rank['fyear']}{year_note}"
+        )
+        st.dataframe(pd.DataFrame(peer_rank['nearest']).rename(columns={'tic': 'Nearest Peers'}))
+
+    with instrument.stage('app_result_frame'):
+        result_df = pd.DataFrame([{
+            "tic": tic, "fyear": fyear, "industry": industry,
+            "X1": x1, "X2": x2, "X3": x3, "X4": x4, "X5": x5,
+            "Z_Score": z_score,
+            "ML_Probability": ml_prob,
+            "Risk_Level": ml_risk,
+            "DQ_Flags": int(report.flags[0]),
+        }])
+        if peer_rank:
+            result_df["Peer_Percentile"] = peer_rank['percentile']
+        if show_interval:
+            result_df["ML_Prob_Lower"], result_df["ML_Prob_Upper"] = lower, upper
     st.dataframe(result_df)
 
+# What-if Sensitivity (closed-form gradients and a vectorized two-input sweep)
+with st.expander("🎛️ What-if Sensitivity"):
+    if total_assets == 0 or total_liabilities == 0:
+        st.warning("Total Assets and Total Liabilities must be non-zero to compute sensitivities.")
+    else:
+        sens = sensitivities(bundle.model.folded, inputs, bundle.z_weights)
+        st.markdown("Change in ML probability and Z-score per unit (and per +1%) change of each input:")
+        st.dataframe(sens.set_index('input').style.format("{:.4g}"))
+
+        names = list(INPUT_LABELS)
+        col_x, col_y = st.columns(2)
+        x_input = col_x.selectbox("X axis", names, index=names.index('at'), format_func=INPUT_LABELS.get)
+        y_names = [n for n in names if n != x_input]
+        y_input = col_y.selectbox("Y axis", y_names, index=y_names.index('ebit') if 'ebit' in y_names else 0,
+                                  format_func=INPUT_LABELS.get)
+        span = st.slider("Sweep ±% around current values", 10, 200, 50, step=10) / 100
+        x_values = sweep_range(inputs[x_input], span)
+        y_values = sweep_range(inputs[y_input], span)
+        with instrument.stage('app_grid_sweep'):
+            prob = grid_sweep(bundle.model.folded, inputs, x_input, x_values, y_input, y_values)
+        grid = grid_frame(x_input, x_values, y_input, y_values, prob)
+        heatmap = alt.Chart(grid).mark_rect().encode(
+            x=alt.X('x0:Q', title=INPUT_LABELS[x_input]), x2='x1',
+            y=alt.Y('y0:Q', title=INPUT_LABELS[y_input]), y2='y1',
+            color=alt.Color('ML_Probability:Q', scale=alt.Scale(scheme='redyellowgreen')),
+            tooltip=[alt.Tooltip(x_input, format='.4g'), alt.Tooltip(y_input, format='.4g'),
+                     alt.Tooltip('ML_Probability:Q', format='.4f')],
+        )
+        current = alt.Chart(pd.DataFrame({'x': [inputs[x_input]], 'y': [inputs[y_input]]})).mark_point(
+            color='black', size=80, filled=True).encode(x='x:Q', y='y:Q')
+        st.altair_chart(heatmap + current, width='stretch')
+
+show_instrumentation()
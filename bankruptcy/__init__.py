@@ -0,0 +1,17 @@
+"""Headless bankruptcy risk scoring: no Streamlit or matplotlib imports."""
+from .features import (
+    FEATURES, INPUT_COLUMNS, compute_ratios, engineer_features, filter_post_bankruptcy, z_scores
+)
+from . import instrument
+from .artifact import ModelArtifact
+from .bootstrap import BootstrapEnsemble, fit_bootstrap
+from .drift import DriftBaseline, DriftMonitor
+from .folded import FoldedLDA, check_parity
+from .model import Z_WEIGHTS, ScoringModel, load_model, weight_vector
+from .peers import PeerIndex
+from .quality import QualityGate, QualityReport, describe_flags
+from .registry import ModelBundle, ModelRegistry
+from .risk import RiskBuckets, get_risk, risk_levels
+from .scoring import iter_score_csv, score_frame
+from .trajectory import risk_trajectories, trajectory_features
+from .universe import score_universe
@@ -0,0 +1,128 @@
+"""Versioned JSON model artifact: folded LDA weights plus everything the scorer needs.
+
+``model.json`` replaces the joblib pickles for scoring. It stores the folded
+coefficients and intercept, the scaler mean/scale, Z-weights, risk thresholds,
+training fill means and metadata, with floats written at full precision so the
+weights round-trip exactly. Loading it is one ``json.load``; sklearn is never
+imported and nothing is unpickled.
+
+    {"format": "bankruptcy-lda", "format_version": 1, "features": ["X1", ...],
+     "folded": {"coef": [...], "intercept": ...},
+     "scaler": {"mean": [...], "scale": [...]},
+     "z_weights": {"X1": ...} | null, "thresholds": {...} | null, "fill_means": {...} | null,
+     "metadata": {"industry": ..., "version": ..., "trained_at": ..., ...}}
+
+Pickled artifacts convert with ``convert_pickles``, which refuses to write the
+file unless the folded weights reproduce sklearn's ``predict_proba``.
+"""
+import json
+import os
+
+import numpy as np
+
+from .features import FEATURES
+from .folded import FoldedLDA
+
+ARTIFACT_FILE = 'model.json'
+FORMAT = 'bankruptcy-lda'
+FORMAT_VERSION = 1
+
+
+class ModelArtifact:
+    """A loaded ``model.json``; scores like ``ScoringModel`` through ``folded``."""
+
+    __slots__ = ('folded', 'scaler_mean', 'scaler_scale', 'z_weights', 'thresholds', 'fill_means', 'metadata')
+
+    def __init__(self, folded, scaler_mean, scaler_scale, z_weights=None, thresholds=None, fill_means=None,
+                 metadata=None):
+        self.folded = folded
+        self.scaler_mean = np.asarray(scaler_mean, dtype=float)
+        self.scaler_scale = np.asarray(scaler_scale, dtype=float)
+        self.z_weights = z_weights
+        self.thresholds = thresholds
+        self.fill_means = fill_means
+        self.metadata = metadata or {}
+
+    @classmethod
+    def from_sklearn(cls, model, scaler, **fields):
+        """Fold a fitted StandardScaler + two-class LDA; ``fields`` are the remaining constructor arguments."""
+        mean = scaler.mean_ if scaler.with_mean else np.zeros(len(FEATURES))
+        scale = scaler.scale_ if scaler.with_std else np.ones(len(FEATURES))
+        return cls(FoldedLDA.from_sklearn(model, scaler), mean, scale, **fields)
+
+    def predict_proba(self, X):
+        return self.folded.predict_proba(X)
+
+    def to_dict(self):
+        return {
+            'format': FORMAT,
+            'format_version': FORMAT_VERSION,
+            'features': list(FEATURES),
+            'folded': {'coef': self.folded.coef.tolist(), 'intercept': self.folded.intercept},
+            'scaler': {'mean': self.scaler_mean.tolist(), 'scale': self.scaler_scale.tolist()},
+            'z_weights': self.z_weights,
+            'thresholds': self.thresholds,
+            'fill_means': self.fill_means,
+            'metadata': self.metadata,
+        }
+
+    def save(self, path):
+        tmp = f'{path}.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write('\n')
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def from_dict(cls, data, source='<dict>'):
+        if data.get('format') != FORMAT:
+            raise ValueError(f"{source}: not a {FORMAT} artifact")
+        if data.get('format_version', 0) > FORMAT_VERSION:
+            raise ValueError(f"{source}: format_version {data['format_version']} is newer than "
+                             f"supported ({FORMAT_VERSION}); upgrade the bankruptcy package")
+        if data.get('features') != FEATURES:
+            raise ValueError(f"{source}: feature order {data.get('features')} does not match {FEATURES}")
+        folded = FoldedLDA(data['folded']['coef'], data['folded']['intercept'])
+        return cls(folded, data['scaler']['mean'], data['scaler']['scale'], data.get('z_weights'),
+                   data.get('thresholds'), data.get('fill_means'), data.get('metadata'))
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_dict(json.load(f), source=path)
+
+    def __repr__(self):
+        meta = self.metadata
+        return f"ModelArtifact({meta.get('industry')!r}, {meta.get('version')!r})"
+
+
+def convert_pickles(model_path, scaler_path, out_path, atol=1e-12, **fields):
+    """Convert a joblib LDA/scaler pair to ``out_path`` after checking parity; returns (artifact, max diff).
+
+    Raises ValueError (and writes nothing) if the folded weights differ from
+    sklearn's ``predict_proba`` by more than ``atol``, or if the written file
+    does not load back to identical weights.
+    """
+    import warnings
+
+    import joblib
+    import sklearn
+
+    from .folded import check_parity
+
+    with warnings.catch_warnings():
+        # The repo-level pickles were written by an older sklearn; parity below is the real check
+        warnings.simplefilter('ignore')
+        model, scaler = joblib.load(model_path), joblib.load(scaler_path)
+    metadata = {'source': {'model': os.path.basename(model_path), 'scaler': os.path.basename(scaler_path)},
+                'sklearn_version': sklearn.__version__, **fields.pop('metadata', {})}
+    artifact = ModelArtifact.from_sklearn(model, scaler, metadata=metadata, **fields)
+    diff = check_parity(artifact.folded, model, scaler, atol=atol)
+    artifact.save(out_path)
+    loaded = ModelArtifact.load(out_path)
+    if not (np.array_equal(loaded.folded.coef, artifact.folded.coef)
+            and loaded.folded.intercept == artifact.folded.intercept):
+        os.remove(out_path)
+        raise ValueError(f"{out_path}: weights did not round-trip exactly")
+    return loaded, diff
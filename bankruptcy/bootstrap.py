@@ -0,0 +1,106 @@
+"""Bootstrap confidence intervals for LDA probabilities.
+
+B scaler + LDA pairs are fitted on class-stratified resamples of the balanced
+training set (in parallel, one seed per model from ``SeedSequence.spawn`` so the
+result does not depend on the worker count) and folded into a (B, 5) weight
+matrix. Scoring n companies against every model is then one ``X @ coef.T``
+and a percentile over the B columns.
+
+The training rows come from the ``stats.npz`` reservoir saved with each model
+version, which holds every balanced training row unless the version has been
+refreshed past the reservoir size.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .features import FEATURES
+from .instrument import collect, enabled, stage, worker_call
+
+BOOTSTRAP_FILE = 'bootstrap.npz'
+DEFAULT_MODELS = 200
+DEFAULT_LEVEL = 0.90
+SCORE_CHUNK = 20_000  # rows per (rows, B) probability block
+
+
+class BootstrapEnsemble:
+    """B folded LDA models stacked as ``coef`` (B, 5) and ``intercept`` (B,)."""
+
+    __slots__ = ('coef', 'intercept')
+
+    def __init__(self, coef, intercept):
+        self.coef = np.asarray(coef, dtype=float).reshape(-1, len(FEATURES))
+        self.intercept = np.asarray(intercept, dtype=float).reshape(len(self.coef))
+
+    def __len__(self):
+        return len(self.coef)
+
+    def predict_proba(self, X):
+        """(n, B) positive-class probabilities, one column per bootstrap model."""
+        z = np.asarray(X, dtype=float).reshape(-1, len(FEATURES)) @ self.coef.T + self.intercept
+        with np.errstate(over='ignore'):
+            return 1.0 / (1.0 + np.exp(-z))
+
+    def intervals(self, X, level=DEFAULT_LEVEL):
+        """(lower, median, upper) arrays of the central ``level`` percentile interval per row.
+
+        Rows with non-finite ratios get NaN bounds.
+        """
+        X = np.asarray(X, dtype=float).reshape(-1, len(FEATURES))
+        tail = (1.0 - level) / 2 * 100
+        out = np.full((3, len(X)), np.nan)
+        rows = np.flatnonzero(np.isfinite(X).all(axis=1))
+        for start in range(0, len(rows), SCORE_CHUNK):
+            idx = rows[start:start + SCORE_CHUNK]
+            out[:, idx] = np.percentile(self.predict_proba(X[idx]), [tail, 50.0, 100.0 - tail], axis=1)
+        return out[0], out[1], out[2]
+
+    def save(self, path):
+        np.savez(path, coef=self.coef, intercept=self.intercept, features=np.array(FEATURES))
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            if list(data['features']) != FEATURES:
+                raise ValueError(f"{path}: feature order {list(data['features'])} does not match {FEATURES}")
+            return cls(data['coef'], data['intercept'])
+
+
+def _fit_models(X, y, seeds):
+    """Fit one scaler + LDA per seed on a class-stratified resample; return folded weights."""
+    from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
+    from sklearn.preprocessing import StandardScaler
+
+    from .folded import FoldedLDA
+
+    classes = [np.flatnonzero(y == c) for c in np.unique(y)]
+    coef = np.empty((len(seeds), len(FEATURES)))
+    intercept = np.empty(len(seeds))
+    for i, seed in enumerate(seeds):
+        rng = np.random.default_rng(seed)
+        rows = np.concatenate([rng.choice(members, size=len(members)) for members in classes])
+        with stage('bootstrap_fit'):
+            scaler = StandardScaler().fit(X[rows])
+            lda = LinearDiscriminantAnalysis().fit(scaler.transform(X[rows]), y[rows])
+        folded = FoldedLDA.from_sklearn(lda, scaler)
+        coef[i], intercept[i] = folded.coef, folded.intercept
+    return coef, intercept
+
+
+def fit_bootstrap(X, y, n_models=DEFAULT_MODELS, seed=0, max_workers=None):
+    """Fit ``n_models`` bootstrap LDAs across processes and return a BootstrapEnsemble."""
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y).astype(int)
+    if len(np.unique(y)) != 2:
+        raise ValueError(f"bootstrap needs both classes, got labels {np.unique(y).tolist()}")
+    seeds = np.random.SeedSequence(seed).spawn(n_models)
+    n_chunks = min(n_models, max_workers or os.cpu_count() or 1)
+    chunks = [list(part) for part in np.array_split(np.array(seeds, dtype=object), n_chunks)]
+    if n_chunks == 1:
+        coef, intercept = _fit_models(X, y, chunks[0])
+        return BootstrapEnsemble(coef, intercept)
+    with ProcessPoolExecutor(max_workers=n_chunks) as executor:
+        futures = [executor.submit(worker_call, enabled(), _fit_models, X, y, chunk) for chunk in chunks]
+        parts = [collect(f) for f in futures]
+    return BootstrapEnsemble(np.vstack([c for c, _ in parts]), np.concatenate([b for _, b in parts]))
@@ -0,0 +1,516 @@
+"""Command line entry point: ``python -m bankruptcy score [FILE ...]``."""
+import argparse
+import json
+import os
+import sys
+from contextlib import nullcontext
+
+from . import drift
+from .features import FEATURES, INPUT_COLUMNS
+from .evaluate import DEFAULT_CACHE_DIR, MODELS
+from .folded import check_parity
+from . import instrument
+from .ingest import DEFAULT_CHUNK_SIZE as INGEST_CHUNK_SIZE, ingest_csv
+from .industries import INDUSTRIES
+from .model import DEFAULT_MODEL_PATH, DEFAULT_SCALER_PATH, load_model
+from .peers import DEFAULT_PEER_INDEX_PATH
+from .quality import merge_counts
+from .registry import DEFAULT_MODELS_DIR, ModelRegistry
+from .scoring import DEFAULT_CHUNK_SIZE, iter_score_csv, score_frame
+from .trajectory import DEFAULT_WINDOW, risk_trajectories, trajectory_features
+
+
+def _score_feature_store(args, quality):
+    import numpy as np
+    import pandas as pd
+
+    from .feature_store import FeatureStore, score_store
+
+    store = FeatureStore(args.feature_store)
+    probs = score_store(store, ModelRegistry(args.models_dir), quality=quality)
+    industries = np.asarray(store.industries, dtype=object)
+    for start in range(0, len(store), args.chunksize):
+        rows = slice(start, start + args.chunksize)
+        chunk = pd.DataFrame({'tic': store.tickers[store.tic[rows]], 'fyear': store.fyear[rows],
+                              'industry': industries[store.industry[rows]]})
+        chunk[FEATURES] = store.X[rows]
+        chunk['ML_Probability'] = probs[rows]
+        chunk.to_csv(sys.stdout, index=False, header=start == 0)
+
+
+def cmd_score(args):
+    quality = {}
+    if args.feature_store:
+        if args.files or args.model or args.scaler:
+            print("--feature-store cannot be combined with input files or --model/--scaler", file=sys.stderr)
+            return 2
+        _score_feature_store(args, quality)
+        return _report_score(quality)
+    if args.model or args.scaler:
+        model = load_model(args.model or DEFAULT_MODEL_PATH, args.scaler or DEFAULT_SCALER_PATH)
+    else:
+        model = ModelRegistry(args.models_dir)
+    header = True
+    for path in args.files or ['-']:
+        source = sys.stdin if path == '-' else path
+        for scored in iter_score_csv(source, model, industry=args.industry, chunk_size=args.chunksize):
+            scored.to_csv(sys.stdout, index=False, header=header)
+            header = False
+            merge_counts(quality, scored.attrs['quality'])
+    return _report_score(quality)
+
+
+def _report_score(quality):
+    print(f"data quality: {json.dumps(quality)}", file=sys.stderr)
+    for line in drift.alerts():
+        print(f"drift alert: {line}", file=sys.stderr)
+    return 0
+
+
+def cmd_trajectory(args):
+    import pandas as pd
+
+    frame = pd.concat([pd.read_csv(sys.stdin if path == '-' else path) for path in args.files or ['-']],
+                      ignore_index=True)
+    scored = score_frame(frame, ModelRegistry(args.models_dir), industry=args.industry)
+    X = scored[FEATURES].to_numpy()
+    prob = scored['ML_Probability'].to_numpy()
+    if args.per_year:
+        result = trajectory_features(scored['tic'], scored['fyear'], X, prob, window=args.window)
+    else:
+        result = risk_trajectories(scored['tic'], scored['fyear'], prob, window=args.window,
+                                   risk=scored['Risk_Level'])
+    result.to_csv(sys.stdout, index=False)
+    return 0
+
+
+def cmd_export(args):
+    model = load_model(args.model, args.scaler)
+    diff = check_parity(model.folded, model.model, model.scaler, atol=args.atol)
+    model.folded.save(args.output)
+    print(f"wrote {args.output} (max |p - sklearn p| = {diff:.2e})", file=sys.stderr)
+    return 0
+
+
+def cmd_convert(args):
+    from .artifact import ARTIFACT_FILE, convert_pickles
+    from .model import DEFAULT_ARTIFACT_PATH
+    from .registry import industry_slug
+
+    jobs = []
+    if not args.skip_legacy:
+        jobs.append((DEFAULT_MODEL_PATH, DEFAULT_SCALER_PATH, DEFAULT_ARTIFACT_PATH,
+                     {'metadata': {'version': 'legacy'}}))
+    registry = ModelRegistry(args.models_dir, legacy=False)
+    for industry in registry.industries():
+        for version in registry.versions(industry):
+            path = os.path.join(args.models_dir, industry_slug(industry), version)
+            report, z_weights = {}, None
+            if os.path.isfile(os.path.join(path, 'training.json')):
+                with open(os.path.join(path, 'training.json')) as f:
+                    report = json.load(f)
+            if os.path.isfile(os.path.join(path, 'z_weights.json')):
+                with open(os.path.join(path, 'z_weights.json')) as f:
+                    z_weights = json.load(f)
+            jobs.append((os.path.join(path, 'lda_model.pkl'), os.path.join(path, 'scaler.pkl'),
+                         os.path.join(path, ARTIFACT_FILE), {
+                             'z_weights': z_weights, 'thresholds': report.get('thresholds'),
+                             'fill_means': report.get('fill_means'),
+                             'metadata': {'industry': industry, 'version': version,
+                                          'trained_at': report.get('trained_at')},
+                         }))
+
+    failed = 0
+    for model_path, scaler_path, out_path, fields in jobs:
+        if os.path.isfile(out_path) and not args.force:
+            print(f"skip {out_path} (exists)", file=sys.stderr)
+            continue
+        try:
+            _, diff = convert_pickles(model_path, scaler_path, out_path, atol=args.atol, **fields)
+        except (OSError, ValueError) as e:
+            print(f"FAILED {out_path}: {e}", file=sys.stderr)
+            failed += 1
+            continue
+        print(f"wrote {out_path} (max |p - sklearn p| = {diff:.2e})", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def cmd_ingest(args):
+    summary = ingest_csv(args.source, args.store, chunk_size=args.chunksize, overwrite=args.overwrite)
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+def cmd_universe(args):
+    from .universe import get_backend, scaling_sweep, score_universe
+
+    options = dict(industries=args.industry, years=args.year)
+    if len(args.workers) > 1:
+        results = scaling_sweep(args.store, args.out, args.workers, args.models_dir, backend=args.backend, **options)
+        print(f"{'workers':>8}{'seconds':>10}{'rows/s':>14}{'speedup':>9}{'efficiency':>12}", file=sys.stderr)
+        for r in results:
+            print(f"{r['workers']:>8}{r['seconds']:>10.2f}{r['rows_per_second']:>14,.0f}"
+                  f"{r['speedup']:>9.2f}{r['efficiency']:>12.0%}", file=sys.stderr)
+    else:
+        backend = get_backend(args.backend, args.workers[0] if args.workers else None,
+                              **({'address': args.scheduler} if args.scheduler else {}))
+        results = score_universe(args.store, args.out, args.models_dir, backend=backend,
+                                 overwrite=args.overwrite, **options)
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+def cmd_peers(args):
+    from .peers import PeerIndex
+
+    index = PeerIndex.from_parquet(args.scored)
+    index.save(args.out)
+    print(json.dumps({'path': args.out, 'rows': len(index), 'groups': len(index.groups),
+                      'versions': index.versions, 'bytes': os.path.getsize(args.out)}, indent=2))
+    if not index.versions:
+        print(f"{args.scored} has no Model_Version column; rescore it with 'universe' so the app "
+              "can check the index against the model in use", file=sys.stderr)
+    return 0
+
+
+def cmd_train(args):
+    from .train import load_bankrupt, load_non_bankrupt, train_all, train_store
+
+    options = dict(out_dir=args.out, industries=args.industry, version=args.version,
+                   max_workers=args.workers, seed=args.seed, match_seed=args.match_seed)
+    if args.feature_store:
+        results = train_store(args.feature_store, **options)
+    elif args.bankrupt and args.non_bankrupt:
+        bankrupt = load_bankrupt(args.bankrupt, last_fyear=args.last_fyear)
+        non_bankrupt = load_non_bankrupt(args.non_bankrupt)
+        results = train_all(bankrupt, non_bankrupt, **options)
+    else:
+        print("train needs --feature-store, or both --bankrupt and --non-bankrupt", file=sys.stderr)
+        return 2
+    print(json.dumps(results, indent=2))
+    return 0 if any(r['status'] == 'trained' for r in results) else 1
+
+
+def cmd_features(args):
+    import pandas as pd
+
+    from .feature_store import write_feature_store
+    from .train import load_bankrupt, load_non_bankrupt
+
+    frame = pd.concat([
+        load_bankrupt(args.bankrupt, last_fyear=args.last_fyear).assign(label=1),
+        load_non_bankrupt(args.non_bankrupt).assign(label=0),
+    ], ignore_index=True)
+    store = write_feature_store(frame, args.store)
+    print(json.dumps({'path': store.path, 'rows': len(store),
+                      'partitions': len(store.index['start']), 'tickers': len(store.tickers)}, indent=2))
+    return 0
+
+
+def cmd_evaluate(args):
+    from .evaluate import evaluate_frame, write_report
+    from .train import balanced_sample, load_bankrupt, load_non_bankrupt
+
+    bankrupt = load_bankrupt(args.bankrupt, last_fyear=args.last_fyear)
+    non_bankrupt = load_non_bankrupt(args.non_bankrupt)
+    balanced = balanced_sample(
+        bankrupt[bankrupt['industry'] == args.industry].assign(label=1),
+        non_bankrupt[non_bankrupt['industry'] == args.industry].assign(label=0),
+        seed=args.seed,
+    )
+    report = evaluate_frame(balanced, models=args.model or MODELS, n_splits=args.folds,
+                            cache_dir=args.cache_dir, max_workers=args.workers)
+    report['industry'] = args.industry
+    if args.out:
+        write_report(report, args.out)
+    else:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+def cmd_refresh(args):
+    import pandas as pd
+
+    from .features import engineer_features
+    from .incremental import SufficientStats, refresh
+    from .registry import industry_slug
+    from .train import new_version
+
+    registry = ModelRegistry(args.models_dir, legacy=False)
+    base = registry.resolve(args.industry, args.from_version)
+    state = os.path.join(args.models_dir, industry_slug(args.industry), base, 'stats.npz')
+    if not os.path.isfile(state):
+        print(f"{state} not found; retrain with 'bankruptcy train' to create it", file=sys.stderr)
+        return 1
+    batch = engineer_features(pd.read_csv(args.batch))
+    # The base version's training fill means, so filled batch rows match how its history was filled
+    fill_means = registry.get(args.industry, base).quality.fill
+    path, report = refresh(SufficientStats.load(state), batch, args.industry, args.models_dir,
+                           args.version or new_version(), fill_means)
+    print(json.dumps({**report, 'base_version': base, 'path': path}, indent=2))
+    return 0
+
+
+def cmd_bootstrap(args):
+    import time
+
+    from .bootstrap import BOOTSTRAP_FILE, fit_bootstrap
+    from .incremental import SufficientStats
+    from .registry import industry_slug
+
+    registry = ModelRegistry(args.models_dir, legacy=False)
+    version = registry.resolve(args.industry, args.version)
+    path = os.path.join(args.models_dir, industry_slug(args.industry), version)
+    state = os.path.join(path, 'stats.npz')
+    if not os.path.isfile(state):
+        print(f"{state} not found; retrain with 'bankruptcy train' to create it", file=sys.stderr)
+        return 1
+    stats = SufficientStats.load(state)
+    X, y = stats.reservoir()
+    t0 = time.perf_counter()
+    ensemble = fit_bootstrap(X, y, n_models=args.models, seed=args.seed, max_workers=args.workers)
+    ensemble.save(os.path.join(path, BOOTSTRAP_FILE))
+    print(json.dumps({
+        'industry': args.industry, 'version': version, 'models': len(ensemble), 'rows': int(len(y)),
+        'rows_exact': bool(stats.rows_seen <= stats.reservoir_size), 'seconds': time.perf_counter() - t0,
+        'path': os.path.join(path, BOOTSTRAP_FILE),
+    }, indent=2))
+    return 0
+
+
+def cmd_drift_baseline(args):
+    from .registry import LEGACY_VERSION, industry_slug
+
+    registry = ModelRegistry(args.models_dir)
+    bundle = registry.get(args.industry, args.version)
+    if args.reference:
+        import pandas as pd
+
+        from .features import compute_ratios
+
+        X = compute_ratios(pd.read_csv(args.reference))
+    elif bundle.version == LEGACY_VERSION:
+        print("the repo-level model has no saved training rows; pass --reference", file=sys.stderr)
+        return 1
+    else:
+        from .incremental import SufficientStats
+
+        state = os.path.join(args.models_dir, industry_slug(args.industry), bundle.version, 'stats.npz')
+        if not os.path.isfile(state):
+            print(f"{state} not found; pass --reference or retrain with 'bankruptcy train'", file=sys.stderr)
+            return 1
+        X = SufficientStats.load(state).reservoir()[0]
+    baseline = drift.DriftBaseline.from_sample(bundle.model, X, bundle.quality.mean, bundle.quality.scale)
+    if bundle.version == LEGACY_VERSION:
+        path = drift.LEGACY_BASELINE_PATH
+    else:
+        path = os.path.join(args.models_dir, industry_slug(args.industry), bundle.version, drift.DRIFT_FILE)
+    baseline.save(path)
+    print(json.dumps({'industry': args.industry, 'version': bundle.version, 'rows': baseline.rows, 'path': path},
+                     indent=2))
+    return 0
+
+
+def cmd_serve(args):
+    import asyncio
+
+    from .service import serve
+
+    try:
+        asyncio.run(serve(args.host, args.port, ModelRegistry(args.models_dir), args.industry,
+                          args.max_batch, args.max_wait_ms / 1000))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='bankruptcy', description="Bankruptcy risk scoring tools")
+    parser.add_argument('--metrics', metavar='PATH',
+                        help="record stage timers/counters and write them here (.prom for Prometheus text, else JSON)")
+    parser.add_argument('--profile', metavar='PATH',
+                        help="profile the command: cProfile stats, or pyinstrument HTML for *.html")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    score = commands.add_parser(
+        'score', help="score CSV filings and write results to stdout",
+        description="Columns required: " + ", ".join(INPUT_COLUMNS) + " (optional: industry)."
+    )
+    score.add_argument('files', nargs='*', help="CSV files to score; '-' or none reads stdin")
+    score.add_argument('--industry', default='Healthcare', choices=INDUSTRIES,
+                       help="industry for rows without (or with an unknown) industry column")
+    score.add_argument('--chunksize', type=int, default=DEFAULT_CHUNK_SIZE)
+    score.add_argument('--models-dir', default=DEFAULT_MODELS_DIR,
+                       help="per-industry model registry (default: %(default)s)")
+    score.add_argument('--model', help="score every row with this LDA pickle instead of the registry")
+    score.add_argument('--scaler', help="scaler pickle to pair with --model")
+    score.add_argument('--feature-store',
+                       help="score every row of a feature store (written by 'features') instead of CSV files")
+    score.set_defaults(func=cmd_score)
+
+    trajectory = commands.add_parser(
+        'trajectory', help="score multi-year filings and summarise each ticker's risk trajectory",
+        description="Columns required: " + ", ".join(INPUT_COLUMNS) + " (optional: industry)."
+    )
+    trajectory.add_argument('files', nargs='*', help="CSV files; '-' or none reads stdin")
+    trajectory.add_argument('--industry', default='Healthcare', choices=INDUSTRIES,
+                            help="industry for rows without (or with an unknown) industry column")
+    trajectory.add_argument('--window', type=int, default=DEFAULT_WINDOW, help="rolling window in years")
+    trajectory.add_argument('--per-year', action='store_true',
+                            help="write firm-year deltas and rolling means instead of one row per ticker")
+    trajectory.add_argument('--models-dir', default=DEFAULT_MODELS_DIR)
+    trajectory.set_defaults(func=cmd_trajectory)
+
+    export = commands.add_parser(
+        'export', help="fold scaler + LDA into one weight vector and save it as .npz",
+        description="The export is refused unless it matches sklearn predict_proba within --atol."
+    )
+    export.add_argument('output', nargs='?', default='lda_folded.npz')
+    export.add_argument('--atol', type=float, default=1e-9)
+    export.add_argument('--model', default=DEFAULT_MODEL_PATH)
+    export.add_argument('--scaler', default=DEFAULT_SCALER_PATH)
+    export.set_defaults(func=cmd_export)
+
+    convert = commands.add_parser(
+        'convert', help="convert joblib pickles to model.json artifacts (refused unless they match sklearn)",
+        description="Converts the repo-level lda_model.pkl/scaler.pkl to lda_model.json and every "
+                    "registry version without a model.json."
+    )
+    convert.add_argument('--models-dir', default=DEFAULT_MODELS_DIR)
+    convert.add_argument('--skip-legacy', action='store_true', help="leave the repo-level pickles alone")
+    convert.add_argument('--force', action='store_true', help="overwrite existing model.json files")
+    convert.add_argument('--atol', type=float, default=1e-12)
+    convert.set_defaults(func=cmd_convert)
+
+    ingest = commands.add_parser(
+        'ingest', help="stream a Compustat funda CSV into a Parquet store partitioned by industry/fyear"
+    )
+    ingest.add_argument('source', help="CSV extract (may be compressed)")
+    ingest.add_argument('store', help="output directory")
+    ingest.add_argument('--chunksize', type=int, default=INGEST_CHUNK_SIZE)
+    ingest.add_argument('--overwrite', action='store_true', help="replace an existing store")
+    ingest.set_defaults(func=cmd_ingest)
+
+    universe = commands.add_parser(
+        'universe', help="score every (industry, fyear) partition of an ingested store in parallel",
+        description="Reads a store from 'ingest' and writes scored rows as Parquet partitioned by "
+                    "industry/fyear. Several --workers values rerun the job once per count and "
+                    "report throughput, speedup and efficiency (the output keeps the last run)."
+    )
+    universe.add_argument('store', help="Parquet store written by 'ingest'")
+    universe.add_argument('out', help="output directory for the scored Parquet dataset")
+    universe.add_argument('--models-dir', default=DEFAULT_MODELS_DIR)
+    universe.add_argument('--backend', default='process', choices=['process', 'dask'])
+    universe.add_argument('--workers', type=lambda v: [int(w) for w in v.split(',')], default=[],
+                          help="worker count, or a comma-separated list for a scaling sweep (default: all cores)")
+    universe.add_argument('--scheduler', help="address of a running dask scheduler (--backend dask)")
+    universe.add_argument('--industry', action='append', choices=INDUSTRIES, help="repeatable; default: all")
+    universe.add_argument('--year', action='append', type=int, help="repeatable; default: all")
+    universe.add_argument('--overwrite', action='store_true', help="replace an existing output directory")
+    universe.set_defaults(func=cmd_universe)
+
+    peers = commands.add_parser(
+        'peers', help="build the peer-percentile index from a scored universe",
+        description="Sorts probabilities per (industry, fyear) so the app ranks a company against its "
+                    "peers with a binary search. Rebuild after retraining."
+    )
+    peers.add_argument('scored', help="Parquet output of 'universe' (tic, industry, fyear, ML_Probability)")
+    peers.add_argument('--out', default=DEFAULT_PEER_INDEX_PATH, help="index path (default: %(default)s)")
+    peers.set_defaults(func=cmd_peers)
+
+    train = commands.add_parser(
+        'train', help="train scaler + LDA for every industry in parallel and write versioned artifacts"
+    )
+    train.add_argument('--bankrupt', help="WRDS export of bankrupt companies (CSV with industry)")
+    train.add_argument('--non-bankrupt', help="Parquet store from 'ingest' or a raw funda CSV")
+    train.add_argument('--feature-store', help="train from a store built by 'bankruptcy features' instead")
+    train.add_argument('--last-fyear', help="CSV with tic,last_fyear to drop post-bankruptcy years")
+    train.add_argument('--industry', action='append', choices=INDUSTRIES, help="repeatable; default: all")
+    train.add_argument('--out', default=DEFAULT_MODELS_DIR)
+    train.add_argument('--version', help="artifact version (default: UTC timestamp)")
+    train.add_argument('--workers', type=int, help="worker processes (default: all cores)")
+    train.add_argument('--seed', type=int, default=42)
+    train.add_argument('--match-seed', type=int,
+                       help="draw row-count matches at random with this seed instead of taking the first n")
+    train.set_defaults(func=cmd_train)
+
+    features = commands.add_parser(
+        'features', help="build the memory-mapped feature store of labelled firm-year ratios"
+    )
+    features.add_argument('store', help="output directory")
+    features.add_argument('--bankrupt', required=True)
+    features.add_argument('--non-bankrupt', required=True)
+    features.add_argument('--last-fyear')
+    features.set_defaults(func=cmd_features)
+
+    evaluate = commands.add_parser(
+        'evaluate', help="grouped k-fold CV by tic with cached folds; writes a JSON metrics report"
+    )
+    evaluate.add_argument('--bankrupt', required=True)
+    evaluate.add_argument('--non-bankrupt', required=True)
+    evaluate.add_argument('--last-fyear')
+    evaluate.add_argument('--industry', default='Healthcare', choices=INDUSTRIES)
+    evaluate.add_argument('--model', action='append', choices=MODELS, help="repeatable; default: all")
+    evaluate.add_argument('--folds', type=int, default=5)
+    evaluate.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR)
+    evaluate.add_argument('--workers', type=int)
+    evaluate.add_argument('--seed', type=int, default=42)
+    evaluate.add_argument('--out', help="report path (default: stdout)")
+    evaluate.set_defaults(func=cmd_evaluate)
+
+    refresh = commands.add_parser(
+        'refresh', help="merge new labelled firm-years into an industry's model without refitting history"
+    )
+    refresh.add_argument('batch', help="CSV of new firm-years with Compustat columns and a 0/1 label column")
+    refresh.add_argument('--industry', required=True, choices=INDUSTRIES)
+    refresh.add_argument('--models-dir', default=DEFAULT_MODELS_DIR)
+    refresh.add_argument('--from-version', help="version to extend (default: newest)")
+    refresh.add_argument('--version', help="new version name (default: UTC timestamp)")
+    refresh.set_defaults(func=cmd_refresh)
+
+    bootstrap = commands.add_parser(
+        'bootstrap', help="fit B bootstrap LDAs in parallel for probability intervals in the app",
+        description="Resamples the balanced training rows saved in the version's stats.npz."
+    )
+    bootstrap.add_argument('--industry', required=True, choices=INDUSTRIES)
+    bootstrap.add_argument('--models-dir', default=DEFAULT_MODELS_DIR)
+    bootstrap.add_argument('--version', help="model version (default: newest)")
+    bootstrap.add_argument('--models', type=int, default=200, help="number of bootstrap fits")
+    bootstrap.add_argument('--seed', type=int, default=0)
+    bootstrap.add_argument('--workers', type=int, help="worker processes (default: all cores)")
+    bootstrap.set_defaults(func=cmd_bootstrap)
+
+    drift_baseline = commands.add_parser(
+        'drift-baseline', help="write the training histograms the drift monitor compares scored batches with",
+        description="Uses the version's stats.npz training rows, or --reference filings (required for the "
+                    "repo-level model, whose baseline is shared by every legacy industry). Drift PSI/KS "
+                    "gauges appear in --metrics output and the service's /metrics when instrumentation is on."
+    )
+    drift_baseline.add_argument('--industry', required=True, choices=INDUSTRIES)
+    drift_baseline.add_argument('--models-dir', default=DEFAULT_MODELS_DIR)
+    drift_baseline.add_argument('--version', help="model version (default: newest)")
+    drift_baseline.add_argument('--reference', help="CSV of training-era filings with Compustat columns")
+    drift_baseline.set_defaults(func=cmd_drift_baseline)
+
+    serve = commands.add_parser('serve', help="HTTP scoring service with request micro-batching")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8000)
+    serve.add_argument('--industry', default='Healthcare', choices=INDUSTRIES,
+                       help="industry for requests without a known one")
+    serve.add_argument('--models-dir', default=DEFAULT_MODELS_DIR)
+    serve.add_argument('--max-batch', type=int, default=256)
+    serve.add_argument('--max-wait-ms', type=float, default=2.0)
+    serve.set_defaults(func=cmd_serve)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.metrics:
+        instrument.enable()
+    try:
+        with instrument.profile(args.profile) if args.profile else nullcontext():
+            return args.func(args)
+    finally:
+        if args.metrics:
+            instrument.write_metrics(args.metrics)
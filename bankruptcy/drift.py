@@ -0,0 +1,236 @@
+"""Drift monitor: streaming histograms of X1-X5 and probabilities against the training baseline.
+
+Every channel (X1-X5 and ML_Probability) has fixed bins: the features span the
+training mean +/- ``FEATURE_SPAN`` scaler SDs in ``DEFAULT_BINS`` steps with an
+underflow and an overflow bin, the probability covers [0, 1]. A scored batch
+only adds to per-bin counts, so a monitor holds a (6, bins + 2) count matrix
+however many rows it sees, and PSI and binned KS against the baseline are
+recomputed from the counts on demand::
+
+    PSI = sum((a - e) * ln(a / e))        a, e = current / baseline bin shares
+    KS  = max |cumsum(a) - cumsum(e)|     (at bin resolution)
+
+The baseline histogram is ``drift.npz`` in a model version (written by
+``train`` from the stats.npz reservoir, or by ``bankruptcy drift-baseline``);
+the repo-level model's is ``lda_drift.npz``. Monitoring is part of the opt-in
+instrumentation: ``observe`` is a no-op unless it is enabled, monitors travel
+with ``instrument.snapshot()`` across worker processes, and PSI/KS/status
+gauges appear in the metrics output.
+"""
+import os
+import threading
+
+import numpy as np
+
+from . import instrument
+from .features import FEATURES
+from .model import REPO_ROOT
+
+DRIFT_FILE = 'drift.npz'
+LEGACY_BASELINE_PATH = os.path.join(REPO_ROOT, 'lda_drift.npz')
+CHANNELS = FEATURES + ['ML_Probability']
+DEFAULT_BINS = 10
+FEATURE_SPAN = 3.0
+PSI_WARN = 0.10
+PSI_ALERT = 0.25
+KS_ALERT = 0.20
+MIN_ROWS = 500
+STATUS_LEVELS = {'no_baseline': -2, 'insufficient': -1, 'ok': 0, 'warn': 1, 'alert': 2}
+_EPS = 1e-4  # floor for empty bins so PSI stays finite
+
+
+def channel_edges(mean, scale, bins=DEFAULT_BINS, span=FEATURE_SPAN):
+    """(6, bins + 1) edges: mean +/- span training SDs for X1-X5, then [0, 1] for the probability."""
+    steps = np.linspace(-span, span, bins + 1)
+    features = np.asarray(mean, dtype=float)[:, None] + np.asarray(scale, dtype=float)[:, None] * steps
+    return np.vstack([features, np.linspace(0.0, 1.0, bins + 1)])
+
+
+def histograms(edges, X, prob):
+    """(6, bins + 2) counts of X1-X5 and ``prob``; NaN values are skipped, +/-inf land in the end bins.
+
+    Same bins as ``searchsorted(edges[i], v, side='right')``, but since every
+    channel's edges are evenly spaced the bin is computed arithmetically for
+    all six channels at once.
+    """
+    columns = np.column_stack([np.asarray(X, dtype=float).reshape(-1, len(FEATURES)), np.asarray(prob, dtype=float)])
+    bins = edges.shape[1] - 1
+    width = (edges[:, -1] - edges[:, 0]) / bins
+    idx = columns - edges[:, 0]
+    idx /= width
+    np.floor(idx, out=idx)
+    idx += 1
+    np.clip(idx, 0, bins + 1, out=idx)
+    # NaN goes to a discard bin past the overflow bin
+    idx[np.isnan(idx)] = bins + 2
+    flat = idx.astype(np.int64) + np.arange(len(CHANNELS)) * (bins + 3)
+    counts = np.bincount(flat.ravel(), minlength=len(CHANNELS) * (bins + 3)).reshape(len(CHANNELS), bins + 3)
+    return counts[:, :-1]
+
+
+def psi(expected, actual):
+    """Population stability index per row of two count matrices."""
+    e = np.maximum(expected / np.maximum(expected.sum(axis=1, keepdims=True), 1), _EPS)
+    a = np.maximum(actual / np.maximum(actual.sum(axis=1, keepdims=True), 1), _EPS)
+    return ((a - e) * np.log(a / e)).sum(axis=1)
+
+
+def ks(expected, actual):
+    """Largest gap between the binned CDFs, per row."""
+    e = np.cumsum(expected, axis=1) / np.maximum(expected.sum(axis=1, keepdims=True), 1)
+    a = np.cumsum(actual, axis=1) / np.maximum(actual.sum(axis=1, keepdims=True), 1)
+    return np.abs(a - e).max(axis=1)
+
+
+class DriftBaseline:
+    """Training-set histogram of every channel over fixed ``edges``."""
+
+    __slots__ = ('edges', 'counts')
+
+    def __init__(self, edges, counts):
+        self.edges = np.asarray(edges, dtype=float)
+        self.counts = np.asarray(counts, dtype=np.int64)
+
+    @classmethod
+    def from_sample(cls, model, X, mean, scale, bins=DEFAULT_BINS):
+        """Baseline from training rows: bins from the scaler ``mean``/``scale``, probabilities from ``model``."""
+        X = np.asarray(X, dtype=float).reshape(-1, len(FEATURES))
+        X = X[np.isfinite(X).all(axis=1)]
+        edges = channel_edges(mean, scale, bins)
+        return cls(edges, histograms(edges, X, model.predict_proba(X)))
+
+    @property
+    def rows(self):
+        return int(self.counts[-1].sum())
+
+    def save(self, path):
+        np.savez(path, edges=self.edges, counts=self.counts, channels=np.array(CHANNELS))
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            if list(data['channels']) != CHANNELS:
+                raise ValueError(f"{path}: channels {list(data['channels'])} do not match {CHANNELS}")
+            return cls(data['edges'], data['counts'])
+
+
+class DriftMonitor:
+    """Running histograms for one model version, compared with its baseline on ``report``."""
+
+    __slots__ = ('industry', 'version', 'edges', 'counts', 'baseline')
+
+    def __init__(self, industry, version, edges, baseline=None):
+        self.industry = industry
+        self.version = version
+        self.edges = np.asarray(edges, dtype=float)
+        self.counts = np.zeros((len(CHANNELS), self.edges.shape[1] + 1), dtype=np.int64)
+        self.baseline = baseline
+
+    @classmethod
+    def for_bundle(cls, bundle):
+        """Monitor over the baseline's bins, or bins from the quality gate's scaler stats if there is none."""
+        if bundle.drift is not None:
+            return cls(bundle.industry, bundle.version, bundle.drift.edges, bundle.drift)
+        return cls(bundle.industry, bundle.version, channel_edges(bundle.quality.mean, bundle.quality.scale))
+
+    @property
+    def rows(self):
+        return int(self.counts[-1].sum())
+
+    def update(self, X, prob):
+        self.counts += histograms(self.edges, X, prob)
+
+    def report(self, min_rows=MIN_ROWS):
+        """PSI, KS and status per channel; the overall status is the worst channel's."""
+        result = {'industry': self.industry, 'version': self.version, 'rows': self.rows,
+                  'baseline_rows': None if self.baseline is None else self.baseline.rows}
+        if self.baseline is None:
+            return {**result, 'status': 'no_baseline', 'channels': {}, 'alerts': []}
+        psi_values = psi(self.baseline.counts, self.counts)
+        ks_values = ks(self.baseline.counts, self.counts)
+        channels = {}
+        for name, p, k in zip(CHANNELS, psi_values, ks_values):
+            if self.rows < min_rows:
+                status = 'insufficient'
+            elif p >= PSI_ALERT or k >= KS_ALERT:
+                status = 'alert'
+            elif p >= PSI_WARN:
+                status = 'warn'
+            else:
+                status = 'ok'
+            channels[name] = {'psi': float(p), 'ks': float(k), 'status': status}
+        status = max((c['status'] for c in channels.values()), key=STATUS_LEVELS.get)
+        alerts = [f"{self.industry}@{self.version} {name}: PSI {c['psi']:.3f}, KS {c['ks']:.3f}"
+                  for name, c in channels.items() if c['status'] == 'alert']
+        return {**result, 'status': status, 'channels': channels, 'alerts': alerts}
+
+
+# Process-wide monitors keyed 'industry@version', filled by ``observe``
+_lock = threading.Lock()
+_monitors = {}
+
+
+def observe(bundle, X, prob):
+    """Add one scored batch (raw X1-X5 and probabilities) to the bundle's monitor."""
+    if not instrument.enabled():
+        return
+    key = f'{bundle.industry}@{bundle.version}'
+    with _lock:
+        monitor = _monitors.get(key)
+        if monitor is None:
+            monitor = _monitors[key] = DriftMonitor.for_bundle(bundle)
+        monitor.update(X, prob)
+
+
+def monitors():
+    with _lock:
+        return dict(_monitors)
+
+
+def alerts():
+    """Alert lines across every monitor."""
+    return [line for monitor in monitors().values() for line in monitor.report()['alerts']]
+
+
+def _snapshot():
+    with _lock:
+        return {
+            key: {**m.report(), 'edges': m.edges.tolist(), 'counts': m.counts.tolist(),
+                  'baseline_counts': None if m.baseline is None else m.baseline.counts.tolist()}
+            for key, m in _monitors.items()
+        }
+
+
+def _merge(section):
+    with _lock:
+        for key, other in section.items():
+            monitor = _monitors.get(key)
+            if monitor is None:
+                baseline = (None if other['baseline_counts'] is None
+                            else DriftBaseline(other['edges'], other['baseline_counts']))
+                monitor = _monitors[key] = DriftMonitor(other['industry'], other['version'], other['edges'], baseline)
+            monitor.counts += np.asarray(other['counts'], dtype=np.int64)
+
+
+def _reset():
+    with _lock:
+        _monitors.clear()
+
+
+def _prometheus(section):
+    prefix = f'{instrument.PREFIX}_drift'
+    lines = [f'# TYPE {prefix}_rows gauge']
+    lines += [f'{prefix}_rows{{industry="{m["industry"]}",version="{m["version"]}"}} {m["rows"]}'
+              for m in section.values()]
+    for metric, key in (('psi', 'psi'), ('ks', 'ks'), ('status', 'status')):
+        lines.append(f'# TYPE {prefix}_{metric} gauge')
+        for m in section.values():
+            for name, channel in m['channels'].items():
+                value = STATUS_LEVELS[channel[key]] if key == 'status' else channel[key]
+                lines.append(f'{prefix}_{metric}{{industry="{m["industry"]}",version="{m["version"]}",'
+                             f'channel="{name}"}} {value}')
+    return lines
+
+
+instrument.register_section('drift', _snapshot, _merge, _reset, _prometheus)
@@ -0,0 +1,169 @@
+"""Grouped k-fold evaluation with an on-disk cache of the preprocessed folds.
+
+Folds are grouped by ``tic`` so a company's firm-years never sit on both sides
+of a split. Each fold's inf/NaN fill and StandardScaler are fit on its training
+part only, and the scaled matrices are saved under ``cache_dir`` keyed by a
+hash of the data, so sweeping thresholds or adding a model reuses them.
+"""
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .features import FEATURES
+from .instrument import collect, enabled, stage, worker_call
+
+DEFAULT_CACHE_DIR = os.path.join('.cache', 'folds')
+DEFAULT_FOLDS = 5
+DEFAULT_THRESHOLDS = np.round(np.linspace(0.30, 0.70, 41), 4)
+MODELS = ['lda', 'logreg']
+
+
+def make_estimator(name):
+    from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
+    from sklearn.linear_model import LogisticRegression
+
+    estimators = {
+        'lda': LinearDiscriminantAnalysis,
+        'logreg': lambda: LogisticRegression(max_iter=1000),
+    }
+    if name not in estimators:
+        raise ValueError(f"unknown model {name!r}; choose from {sorted(estimators)}")
+    return estimators[name]()
+
+
+def data_key(X, y, groups, n_splits):
+    digest = hashlib.sha1()
+    for part in (np.ascontiguousarray(X, dtype=float), np.asarray(y, dtype=np.int8)):
+        digest.update(part.tobytes())
+    digest.update('\0'.join(map(str, groups)).encode())
+    digest.update(str(n_splits).encode())
+    return digest.hexdigest()[:16]
+
+
+def _preprocess(X_train, X_test):
+    from sklearn.preprocessing import StandardScaler
+
+    X_train = np.where(np.isfinite(X_train), X_train, np.nan)
+    X_test = np.where(np.isfinite(X_test), X_test, np.nan)
+    fill = np.nanmean(X_train, axis=0)
+    X_train = np.where(np.isnan(X_train), fill, X_train)
+    X_test = np.where(np.isnan(X_test), fill, X_test)
+    scaler = StandardScaler().fit(X_train)
+    return scaler.transform(X_train), scaler.transform(X_test)
+
+
+def prepare_folds(X, y, groups, n_splits=DEFAULT_FOLDS, cache_dir=DEFAULT_CACHE_DIR):
+    """Write (or reuse) one ``fold{i}.npz`` per split and return their paths."""
+    from sklearn.model_selection import GroupKFold
+
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=int)
+    groups = np.asarray(groups).astype(str)
+    fold_dir = os.path.join(cache_dir, data_key(X, y, groups, n_splits))
+    paths = [os.path.join(fold_dir, f'fold{i}.npz') for i in range(n_splits)]
+    if all(os.path.isfile(p) for p in paths):
+        return paths
+
+    os.makedirs(fold_dir, exist_ok=True)
+    for path, (train_idx, test_idx) in zip(paths, GroupKFold(n_splits=n_splits).split(X, y, groups)):
+        X_train, X_test = _preprocess(X[train_idx], X[test_idx])
+        tmp = path + '.tmp.npz'
+        np.savez(tmp, X_train=X_train, y_train=y[train_idx], X_test=X_test, y_test=y[test_idx], test_idx=test_idx)
+        os.replace(tmp, path)
+    return paths
+
+
+def _youden(y, proba):
+    from sklearn.metrics import roc_curve
+
+    fpr, tpr, thresholds = roc_curve(y, proba)
+    return float(thresholds[(tpr - fpr).argmax()])
+
+
+def _fit_fold(path, model_name):
+    from sklearn.metrics import accuracy_score, roc_auc_score
+
+    with np.load(path) as fold:
+        X_train, y_train = fold['X_train'], fold['y_train']
+        X_test, y_test, test_idx = fold['X_test'], fold['y_test'], fold['test_idx']
+    with stage(f'cv_fit_{model_name}'):
+        estimator = make_estimator(model_name).fit(X_train, y_train)
+    threshold = _youden(y_train, estimator.predict_proba(X_train)[:, 1])
+    proba = estimator.predict_proba(X_test)[:, 1]
+    return {
+        'model': model_name,
+        'fold': os.path.basename(path),
+        'n_test': int(len(y_test)),
+        'auc': float(roc_auc_score(y_test, proba)) if len(np.unique(y_test)) == 2 else None,
+        'accuracy': float(accuracy_score(y_test, estimator.predict(X_test))),
+        'youden_threshold': threshold,
+        'accuracy_at_youden': float(np.mean((proba >= threshold) == y_test)),
+        'test_idx': test_idx,
+        'proba': proba,
+    }
+
+
+def threshold_sweep(y, proba, thresholds=DEFAULT_THRESHOLDS):
+    """Confusion counts and rates at every threshold in one broadcast."""
+    y = np.asarray(y, dtype=bool)
+    flagged = np.asarray(proba)[None, :] >= np.asarray(thresholds)[:, None]
+    tp = (flagged & y).sum(axis=1)
+    fp = (flagged & ~y).sum(axis=1)
+    fn = y.sum() - tp
+    tn = (~y).sum() - fp
+    with np.errstate(invalid='ignore', divide='ignore'):
+        precision = tp / (tp + fp)
+        recall = tp / (tp + fn)
+        fpr = fp / (fp + tn)
+    return [
+        {'threshold': float(t), 'tp': int(a), 'fp': int(b), 'tn': int(c), 'fn': int(d),
+         'precision': None if np.isnan(p) else float(p), 'recall': float(r), 'fpr': float(f),
+         'youden_j': float(r - f)}
+        for t, a, b, c, d, p, r, f in zip(thresholds, tp, fp, tn, fn, precision, recall, fpr)
+    ]
+
+
+def evaluate(X, y, groups, models=MODELS, n_splits=DEFAULT_FOLDS, cache_dir=DEFAULT_CACHE_DIR,
+             thresholds=DEFAULT_THRESHOLDS, max_workers=None):
+    """Grouped CV for each model, folds fit in parallel; returns a JSON-ready report."""
+    from sklearn.metrics import roc_auc_score
+
+    y = np.asarray(y, dtype=int)
+    paths = prepare_folds(X, y, groups, n_splits=n_splits, cache_dir=cache_dir)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(worker_call, enabled(), _fit_fold, path, name)
+                   for name in models for path in paths]
+        results = [collect(f) for f in futures]
+
+    report = {'n_rows': int(len(y)), 'n_groups': int(len(np.unique(np.asarray(groups).astype(str)))),
+              'n_splits': n_splits, 'cache': os.path.dirname(paths[0]), 'models': {}}
+    for name in models:
+        folds = [r for r in results if r['model'] == name]
+        oof = np.full(len(y), np.nan)
+        for r in folds:
+            oof[r['test_idx']] = r['proba']
+        aucs = [r['auc'] for r in folds if r['auc'] is not None]
+        report['models'][name] = {
+            'auc_mean': float(np.mean(aucs)) if aucs else None,
+            'auc_std': float(np.std(aucs)) if aucs else None,
+            'accuracy_mean': float(np.mean([r['accuracy'] for r in folds])),
+            'oof_auc': float(roc_auc_score(y, oof)),
+            'oof_youden_threshold': _youden(y, oof),
+            'folds': [{k: v for k, v in r.items() if k not in ('test_idx', 'proba', 'model')} for r in folds],
+            'threshold_sweep': threshold_sweep(y, oof, thresholds),
+        }
+    return report
+
+
+def evaluate_frame(balanced, **kwargs):
+    """``evaluate`` on a balanced frame with X1-X5, ``label`` and ``tic``."""
+    return evaluate(balanced[FEATURES].to_numpy(dtype=float), balanced['label'].to_numpy(),
+                    balanced['tic'].to_numpy(), **kwargs)
+
+
+def write_report(report, path):
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
@@ -0,0 +1,171 @@
+"""Columnar, memory-mapped store of historical firm-year features.
+
+A store is a directory of ``.npy`` columns opened with ``mmap_mode='r'``::
+
+    X.npy         float32 (n, 5)   X1-X5
+    label.npy     int8             1 bankrupt, 0 non-bankrupt, -1 unlabelled
+    industry.npy  int8             code into INDUSTRIES
+    fyear.npy     int16
+    tic.npy       int32            code into tickers.json
+    index.npz     (industry, fyear) -> [start, stop) row ranges
+    meta.json
+
+Rows are sorted by industry, fyear and tic, so every industry and every
+(industry, fyear) is a contiguous range and slicing returns views, never
+copies or pandas object columns.
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from .drift import observe
+from .features import FEATURES
+from .industries import INDUSTRIES
+from .quality import merge_counts
+
+FORMAT_VERSION = 1
+_COLUMNS = {'X': np.float32, 'label': np.int8, 'industry': np.int8, 'fyear': np.int16, 'tic': np.int32}
+
+
+def write_feature_store(frame, path):
+    """Write an engineered frame (tic, fyear, industry, X1-X5, optional label) to ``path``."""
+    os.makedirs(path, exist_ok=True)
+    industry = pd.Categorical(frame['industry'], categories=INDUSTRIES).codes.astype(np.int8)
+    keep = industry >= 0
+    tic_codes, tickers = pd.factorize(np.asarray(frame['tic'])[keep], sort=True)
+    fyear = np.asarray(frame['fyear'])[keep].astype(np.int16)
+    industry = industry[keep]
+    label = (np.asarray(frame['label'])[keep].astype(np.int8) if 'label' in frame
+             else np.full(keep.sum(), -1, dtype=np.int8))
+    X = np.asarray(frame[FEATURES], dtype=np.float32)[keep]
+
+    order = np.lexsort((tic_codes, fyear, industry))
+    columns = {'X': X[order], 'label': label[order], 'industry': industry[order],
+               'fyear': fyear[order], 'tic': tic_codes[order].astype(np.int32)}
+    for name, values in columns.items():
+        out = np.lib.format.open_memmap(os.path.join(path, f'{name}.npy'), mode='w+',
+                                        dtype=_COLUMNS[name], shape=values.shape)
+        out[:] = values
+        out.flush()
+        del out
+
+    # One entry per (industry, fyear) run in the sorted order
+    ind, yr = columns['industry'], columns['fyear']
+    boundaries = np.flatnonzero((np.diff(ind) != 0) | (np.diff(yr) != 0)) + 1
+    starts = np.concatenate([[0], boundaries]).astype(np.int64)
+    stops = np.concatenate([boundaries, [len(ind)]]).astype(np.int64)
+    np.savez(os.path.join(path, 'index.npz'), industry=ind[starts], fyear=yr[starts], start=starts, stop=stops)
+
+    with open(os.path.join(path, 'tickers.json'), 'w') as f:
+        json.dump([str(t) for t in tickers], f)
+    with open(os.path.join(path, 'meta.json'), 'w') as f:
+        json.dump({'format_version': FORMAT_VERSION, 'n_rows': int(len(ind)),
+                   'features': FEATURES, 'industries': INDUSTRIES}, f, indent=2)
+    return FeatureStore(path)
+
+
+class FeatureStore:
+    """Read-only, zero-copy view of a store written by ``write_feature_store``."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, 'meta.json')) as f:
+            self.meta = json.load(f)
+        if self.meta['format_version'] != FORMAT_VERSION or self.meta['features'] != FEATURES:
+            raise ValueError(f"{path}: unsupported feature store format {self.meta['format_version']}")
+        self.industries = self.meta['industries']
+        for name in _COLUMNS:
+            setattr(self, name, np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r'))
+        with np.load(os.path.join(path, 'index.npz')) as index:
+            self.index = {k: index[k] for k in index.files}
+        self._tickers = None
+
+    def __len__(self):
+        return len(self.label)
+
+    @property
+    def tickers(self):
+        """Ticker dictionary, loaded on first use."""
+        if self._tickers is None:
+            with open(os.path.join(self.path, 'tickers.json')) as f:
+                self._tickers = np.array(json.load(f), dtype=object)
+        return self._tickers
+
+    def industry_code(self, industry):
+        return self.industries.index(industry)
+
+    def row_range(self, industry, fyear=None):
+        """[start, stop) rows of an industry, or of one (industry, fyear)."""
+        mask = self.index['industry'] == self.industry_code(industry)
+        if fyear is not None:
+            mask &= self.index['fyear'] == fyear
+        if not mask.any():
+            return 0, 0
+        hits = np.flatnonzero(mask)
+        return int(self.index['start'][hits[0]]), int(self.index['stop'][hits[-1]])
+
+    def partitions(self):
+        """(industry, fyear, start, stop) for every non-empty partition."""
+        for code, year, start, stop in zip(self.index['industry'], self.index['fyear'],
+                                           self.index['start'], self.index['stop']):
+            yield self.industries[code], int(year), int(start), int(stop)
+
+    def select(self, industry, years=None):
+        """Column views for an industry, optionally only rows whose fyear is in ``years``.
+
+        Views when the requested years that are stored are adjacent in the
+        index, copies otherwise.
+        """
+        if years is None:
+            start, stop = self.row_range(industry)
+            hits = None
+        else:
+            mask = self.index['industry'] == self.industry_code(industry)
+            mask &= np.isin(self.index['fyear'], list(years))
+            hits = np.flatnonzero(mask)
+            if len(hits):
+                start, stop = int(self.index['start'][hits[0]]), int(self.index['stop'][hits[-1]])
+            else:
+                start = stop = 0
+        rows = slice(start, stop)
+        out = {name: getattr(self, name)[rows] for name in _COLUMNS}
+        if hits is not None and len(hits) and hits[-1] - hits[0] + 1 != len(hits):
+            keep = np.isin(out['fyear'], list(years))
+            out = {name: values[keep] for name, values in out.items()}
+        return out
+
+    def training_frames(self, industry):
+        """Bankrupt and non-bankrupt frames for ``train``; ``tic`` holds integer codes."""
+        cols = self.select(industry)
+        frame = pd.DataFrame(cols['X'], columns=FEATURES, copy=False)
+        frame['tic'] = cols['tic']
+        frame['fyear'] = cols['fyear']
+        frame['industry'] = industry
+        label = cols['label']
+        return frame[label == 1], frame[label == 0]
+
+
+def score_store(store, registry, out=None, quality=None):
+    """Probability for every row, one vectorized call per industry slice.
+
+    Each slice passes the industry's QualityGate; rows it rejects stay NaN and
+    per-rule counts are merged into ``quality`` when given. Returns a float32
+    array aligned with the store (written to ``out`` when given, e.g. an
+    ``open_memmap``).
+    """
+    probs = out if out is not None else np.empty(len(store), dtype=np.float32)
+    probs[:] = np.nan
+    available = set(registry.industries())
+    for industry in store.industries:
+        start, stop = store.row_range(industry)
+        if start == stop or industry not in available:
+            continue
+        bundle = registry.get(industry)
+        report = bundle.quality.check(store.X[start:stop])
+        probs[start:stop][report.scored] = bundle.model.predict_proba(report.X[report.scored])
+        if quality is not None:
+            merge_counts(quality, report.counts)
+        observe(bundle, store.X[start:stop], probs[start:stop])
+    return probs
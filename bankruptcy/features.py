@@ -0,0 +1,73 @@
+"""Altman-style ratio features computed from Compustat funda columns."""
+import numpy as np
+import pandas as pd
+
+# Compustat columns needed to score a filing
+INPUT_COLUMNS = ['tic', 'fyear', 'act', 'lct', 'at', 'seq', 'ebit', 'sale', 'lt', 'prcc_f', 'csho']
+FINANCIAL_COLUMNS = ['act', 'lct', 'at', 'seq', 'ebit', 'sale', 'lt', 'prcc_f', 'csho']
+FEATURES = ['X1', 'X2', 'X3', 'X4', 'X5']
+
+
+def compute_ratios(frame):
+    """Return an (n, 5) float array of X1-X5 for every row of ``frame``.
+
+    ``frame`` can be a DataFrame or any mapping of column name to array.
+    A zero ``at`` or ``lt`` yields NaN for the ratios that divide by it
+    instead of +/-inf.
+    """
+    col = {c: np.asarray(frame[c], dtype=float) for c in FINANCIAL_COLUMNS}
+    at = np.where(col['at'] == 0, np.nan, col['at'])
+    lt = np.where(col['lt'] == 0, np.nan, col['lt'])
+    with np.errstate(invalid='ignore'):
+        return np.column_stack([
+            (col['act'] - col['lct']) / at,             # Working Capital / Total Assets
+            col['seq'] / at,                            # Retained Earnings / Total Assets
+            col['ebit'] / at,                           # EBIT / Total Assets
+            (col['prcc_f'] * col['csho']) / lt,         # Market Value of Equity / Total Liabilities
+            col['sale'] / at,                           # Sales / Total Assets
+        ])
+
+
+def last_fyear_lookup(last_fyear):
+    """Normalize a ticker -> final fiscal year lookup to a Series indexed by tic.
+
+    Accepts a dict, a Series, or a frame with ``tic`` and ``last_fyear`` columns
+    such as ``bankrupt_companies``; for duplicated tickers the last entry wins,
+    as with ``set_index('tic')['last_fyear'].to_dict()``.
+    """
+    if isinstance(last_fyear, pd.DataFrame):
+        last_fyear = last_fyear.set_index('tic')['last_fyear']
+    elif not isinstance(last_fyear, pd.Series):
+        last_fyear = pd.Series(last_fyear, dtype='float64')
+    return last_fyear.groupby(level=0).last()
+
+
+def filter_post_bankruptcy(frame, last_fyear):
+    """Drop firm-years after each company's final fiscal year.
+
+    Tickers without an entry are kept, matching ``last_fyear.get(tic, 9999)``.
+    """
+    cutoff = frame['tic'].map(last_fyear_lookup(last_fyear)).fillna(np.inf)
+    return frame[frame['fyear'] <= cutoff]
+
+
+def engineer_features(frame, last_fyear=None, label=None):
+    """Cutoff, null drop and X1-X5 for every industry in ``frame`` in one pass.
+
+    Returns a new frame (no chained assignment on slices) with X1-X5 appended,
+    and a ``label`` column when ``label`` is given.
+    """
+    if last_fyear is not None:
+        frame = filter_post_bankruptcy(frame, last_fyear)
+    frame = frame.dropna(subset=FINANCIAL_COLUMNS)
+    features = pd.DataFrame(compute_ratios(frame), columns=FEATURES, index=frame.index)
+    frame = pd.concat([frame.drop(columns=FEATURES, errors='ignore'), features], axis=1)
+    if label is not None:
+        frame['label'] = label
+    return frame
+
+
+def z_scores(X, weights):
+    """Weighted Z-score sum for each row; ``weights`` is (5,) or (n, 5)."""
+    with np.errstate(invalid='ignore'):
+        return (np.asarray(X) * np.asarray(weights)).sum(axis=1)
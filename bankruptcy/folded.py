@@ -0,0 +1,78 @@
+"""StandardScaler + binary LDA folded into one affine map and a sigmoid.
+
+For two classes sklearn's ``predict_proba`` is ``expit(((X - mean) / scale) @ coef + intercept)``,
+so the scaler can be folded into the weights once and scoring becomes a dot product.
+"""
+import math
+
+import numpy as np
+
+from .features import FEATURES
+
+
+class FoldedLDA:
+    """Scores raw X1-X5 with ``sigmoid(X @ coef + intercept)``."""
+
+    __slots__ = ('coef', 'intercept', '_coef_list')
+
+    def __init__(self, coef, intercept):
+        self.coef = np.asarray(coef, dtype=float).reshape(len(FEATURES))
+        self.intercept = float(intercept)
+        self._coef_list = self.coef.tolist()
+
+    @classmethod
+    def from_sklearn(cls, model, scaler):
+        """Fold a fitted StandardScaler and two-class LinearDiscriminantAnalysis."""
+        if len(model.classes_) != 2:
+            raise ValueError(f"only two-class LDA can be folded, got classes {model.classes_!r}")
+        coef = np.asarray(model.coef_, dtype=float)[0]
+        mean = scaler.mean_ if scaler.with_mean else np.zeros_like(coef)
+        scale = scaler.scale_ if scaler.with_std else np.ones_like(coef)
+        folded = coef / scale
+        return cls(folded, float(model.intercept_[0]) - float(folded @ mean))
+
+    def decision_function(self, X):
+        return np.asarray(X, dtype=float).reshape(-1, len(FEATURES)) @ self.coef + self.intercept
+
+    def predict_proba(self, X):
+        """Positive-class probability for an (n, 5) array of raw ratios."""
+        z = self.decision_function(X)
+        with np.errstate(over='ignore'):
+            return 1.0 / (1.0 + np.exp(-z))
+
+    def score_one(self, x1, x2, x3, x4, x5):
+        """Single-company probability in plain Python floats, with no array allocation."""
+        w = self._coef_list
+        z = w[0] * x1 + w[1] * x2 + w[2] * x3 + w[3] * x4 + w[4] * x5 + self.intercept
+        if z < -700.0:
+            return 0.0
+        return 1.0 / (1.0 + math.exp(-z))
+
+    def save(self, path):
+        np.savez(path, coef=self.coef, intercept=np.array(self.intercept), features=np.array(FEATURES))
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            if list(data['features']) != FEATURES:
+                raise ValueError(f"{path}: feature order {list(data['features'])} does not match {FEATURES}")
+            return cls(data['coef'], data['intercept'])
+
+
+def check_parity(folded, model, scaler, X=None, n_samples=10000, atol=1e-9, seed=0):
+    """Compare ``folded`` with sklearn on ``X`` and return the max absolute difference.
+
+    Without ``X`` the check samples points around the scaler's training mean.
+    Raises ValueError if any probability differs by more than ``atol``.
+    """
+    import pandas as pd
+
+    if X is None:
+        rng = np.random.default_rng(seed)
+        X = scaler.mean_ + rng.standard_normal((n_samples, len(FEATURES))) * scaler.scale_
+    X = np.asarray(X, dtype=float)
+    expected = model.predict_proba(scaler.transform(pd.DataFrame(X, columns=FEATURES)))[:, 1]
+    diff = float(np.max(np.abs(folded.predict_proba(X) - expected)))
+    if diff > atol:
+        raise ValueError(f"folded LDA differs from sklearn predict_proba by {diff:.3g} (atol={atol:g})")
+    return diff
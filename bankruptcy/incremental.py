@@ -0,0 +1,253 @@
+"""Incremental StandardScaler + two-class LDA refresh from sufficient statistics.
+
+Both models are fully determined by per-class counts, means and scatter
+matrices of X1-X5, which merge exactly (Chan et al.'s pairwise update), so a
+new fiscal year costs O(batch) and no historical rows are re-read. The LDA is
+rebuilt with the same closed form sklearn's default ``svd`` solver reduces to
+for two classes::
+
+    coef      = inv(S_w / n) @ (mu_1 - mu_0)                (in scaled space)
+    intercept = -0.5 * (mu_0 + mu_1) @ coef + log(n_1 / n_0)
+
+Youden/quantile thresholds need scores of historical rows under the new
+weights, so a fixed-size reservoir sample of (X, y) is kept for them; they are
+exact while the total row count fits in the reservoir.
+"""
+import numpy as np
+
+from .features import FEATURES
+
+DEFAULT_RESERVOIR_SIZE = 100_000
+N_FEATURES = len(FEATURES)
+
+
+class SufficientStats:
+    """Running per-class statistics plus a reservoir sample for thresholds."""
+
+    def __init__(self, reservoir_size=DEFAULT_RESERVOIR_SIZE, seed=0):
+        self.count = np.zeros(2, dtype=np.int64)
+        self.mean = np.zeros((2, N_FEATURES))
+        self.scatter = np.zeros((2, N_FEATURES, N_FEATURES))
+        self.reservoir_X = np.empty((reservoir_size, N_FEATURES))
+        self.reservoir_y = np.empty(reservoir_size, dtype=np.int8)
+        self.rows_seen = 0
+        self.rows_dropped = 0
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def reservoir_size(self):
+        return len(self.reservoir_y)
+
+    def update(self, X, y):
+        """Merge a batch of raw X1-X5 rows with 0/1 labels; non-finite rows are dropped."""
+        X = np.asarray(X, dtype=float).reshape(-1, N_FEATURES)
+        y = np.asarray(y).astype(int)
+        finite = np.isfinite(X).all(axis=1)
+        self.rows_dropped += int((~finite).sum())
+        X, y = X[finite], y[finite]
+
+        for c in (0, 1):
+            Xc = X[y == c]
+            n_b = len(Xc)
+            if n_b == 0:
+                continue
+            mean_b = Xc.mean(axis=0)
+            centered = Xc - mean_b
+            scatter_b = centered.T @ centered
+            n_a = self.count[c]
+            n = n_a + n_b
+            delta = mean_b - self.mean[c]
+            self.scatter[c] += scatter_b + np.outer(delta, delta) * (n_a * n_b / n)
+            self.mean[c] += delta * (n_b / n)
+            self.count[c] = n
+
+        self._sample(X, y)
+        return self
+
+    def _sample(self, X, y):
+        # Algorithm R for a whole batch: the g-th row overall lands in slot g while
+        # the reservoir fills, afterwards in a uniform slot in [0, g] if that is < k
+        k = self.reservoir_size
+        g = self.rows_seen + np.arange(len(y))
+        slots = np.where(g < k, g, self._rng.integers(0, g + 1))
+        rows = np.flatnonzero(slots < k)
+        # when two rows hit the same slot the later one wins
+        _, last = np.unique(slots[rows][::-1], return_index=True)
+        rows = rows[::-1][last]
+        self.reservoir_X[slots[rows]] = X[rows]
+        self.reservoir_y[slots[rows]] = y[rows]
+        self.rows_seen += len(y)
+
+    def merge(self, other):
+        """Combine with statistics gathered elsewhere (e.g. another worker)."""
+        for c in (0, 1):
+            n_a, n_b = self.count[c], other.count[c]
+            if n_b == 0:
+                continue
+            n = n_a + n_b
+            delta = other.mean[c] - self.mean[c]
+            self.scatter[c] += other.scatter[c] + np.outer(delta, delta) * (n_a * n_b / n)
+            self.mean[c] += delta * (n_b / n)
+            self.count[c] = n
+        # other's reservoir is replayed as a stream, which is exact while it has
+        # not overflowed and an approximation of a uniform sample afterwards
+        X, y = other.reservoir()
+        self._sample(X, y)
+        self.rows_seen += other.rows_seen - len(y)
+        self.rows_dropped += other.rows_dropped
+        return self
+
+    def reservoir(self):
+        n = min(self.rows_seen, self.reservoir_size)
+        return self.reservoir_X[:n], self.reservoir_y[:n]
+
+    # --- model regeneration ---
+
+    def scaler_stats(self):
+        """Overall mean, variance (ddof=0) and scale, as StandardScaler computes them."""
+        n = self.count.sum()
+        mean = (self.count[:, None] * self.mean).sum(axis=0) / n
+        diff = self.mean[1] - self.mean[0]
+        total_scatter = self.scatter.sum(axis=0) + np.outer(diff, diff) * (self.count[0] * self.count[1] / n)
+        var = np.diag(total_scatter) / n
+        scale = np.where(var == 0, 1.0, np.sqrt(var))
+        return mean, var, scale
+
+    def lda_coefficients(self):
+        """(coef, intercept) of the LDA fit on standardized features."""
+        if (self.count < 2).any():
+            raise ValueError(f"need at least two rows per class, have {self.count.tolist()}")
+        mean, _, scale = self.scaler_stats()
+        means_scaled = (self.mean - mean) / scale
+        within = self.scatter.sum(axis=0) / np.outer(scale, scale) / self.count.sum()
+        coef = np.linalg.solve(within, means_scaled[1] - means_scaled[0])
+        intercept = -0.5 * (means_scaled[0] + means_scaled[1]) @ coef + np.log(self.count[1] / self.count[0])
+        return coef, float(intercept)
+
+    def to_sklearn(self):
+        """Fitted-equivalent StandardScaler and LinearDiscriminantAnalysis objects."""
+        from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
+        from sklearn.preprocessing import StandardScaler
+
+        mean, var, scale = self.scaler_stats()
+        scaler = StandardScaler()
+        scaler.mean_, scaler.var_, scaler.scale_ = mean, var, scale
+        scaler.n_samples_seen_ = np.int64(self.count.sum())
+        scaler.n_features_in_ = N_FEATURES
+        scaler.feature_names_in_ = np.array(FEATURES, dtype=object)
+
+        coef, intercept = self.lda_coefficients()
+        lda = LinearDiscriminantAnalysis()
+        lda.classes_ = np.array([0, 1])
+        lda.priors_ = self.count / self.count.sum()
+        lda.means_ = (self.mean - mean) / scale
+        lda.coef_ = coef[None, :]
+        lda.intercept_ = np.array([intercept])
+        lda.n_features_in_ = N_FEATURES
+        lda._max_components = 1
+        return scaler, lda
+
+    def thresholds(self):
+        """Youden's J and q25/q50/q75 of the reservoir's probabilities under the current model."""
+        from sklearn.metrics import roc_curve
+
+        from .folded import FoldedLDA
+
+        scaler, lda = self.to_sklearn()
+        X, y = self.reservoir()
+        proba = FoldedLDA.from_sklearn(lda, scaler).predict_proba(X)
+        fpr, tpr, thresholds = roc_curve(y, proba)
+        q25, q50, q75 = np.quantile(proba, [0.25, 0.50, 0.75])
+        return {'youden': float(thresholds[(tpr - fpr).argmax()]),
+                'q25': float(q25), 'q50': float(q50), 'q75': float(q75),
+                'exact': bool(self.rows_seen <= self.reservoir_size)}
+
+    # --- persistence ---
+
+    def save(self, path):
+        X, y = self.reservoir()
+        np.savez(path, count=self.count, mean=self.mean, scatter=self.scatter,
+                 reservoir_X=X, reservoir_y=y, reservoir_size=self.reservoir_size,
+                 rows_seen=self.rows_seen, rows_dropped=self.rows_dropped,
+                 rng_state=np.array(str(self._rng.bit_generator.state)))
+
+    @classmethod
+    def load(cls, path):
+        import ast
+
+        with np.load(path) as data:
+            stats = cls(reservoir_size=int(data['reservoir_size']))
+            stats.count = data['count'].copy()
+            stats.mean = data['mean'].copy()
+            stats.scatter = data['scatter'].copy()
+            n = len(data['reservoir_y'])
+            stats.reservoir_X[:n] = data['reservoir_X']
+            stats.reservoir_y[:n] = data['reservoir_y']
+            stats.rows_seen = int(data['rows_seen'])
+            stats.rows_dropped = int(data['rows_dropped'])
+            stats._rng.bit_generator.state = ast.literal_eval(str(data['rng_state']))
+        return stats
+
+
+def fill_non_finite(X, fill_means):
+    """Raw X1-X5 with inf/NaN replaced by ``fill_means`` (a dict by feature or a 5-vector)."""
+    if isinstance(fill_means, dict):
+        fill_means = [fill_means[f] for f in FEATURES]
+    X = np.asarray(X, dtype=float).reshape(-1, N_FEATURES)
+    return np.where(np.isfinite(X), X, np.asarray(fill_means, dtype=float))
+
+
+def refit_parity(stats, X, y, fill_means=None):
+    """Max absolute probability difference between ``stats`` and a full sklearn refit on (X, y).
+
+    Non-finite ratios are filled as ``fit_industry`` fills them: with
+    ``fill_means``, or by default the column means of the finite values.
+    """
+    from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
+    from sklearn.preprocessing import StandardScaler
+
+    from .folded import FoldedLDA
+
+    X = np.asarray(X, dtype=float).reshape(-1, N_FEATURES)
+    y = np.asarray(y).astype(int)
+    if fill_means is None:
+        with np.errstate(invalid='ignore'):
+            fill_means = np.nanmean(np.where(np.isfinite(X), X, np.nan), axis=0)
+    X = fill_non_finite(X, fill_means)
+    scaler = StandardScaler().fit(X)
+    lda = LinearDiscriminantAnalysis().fit(scaler.transform(X), y)
+    full = FoldedLDA.from_sklearn(lda, scaler).predict_proba(X)
+    scaler_i, lda_i = stats.to_sklearn()
+    incremental = FoldedLDA.from_sklearn(lda_i, scaler_i).predict_proba(X)
+    return float(np.max(np.abs(full - incremental)))
+
+
+def refresh(stats, batch, industry, out_dir, version, fill_means):
+    """Merge an engineered ``batch`` (X1-X5, ``label``) into ``stats`` and write a new model version.
+
+    Non-finite ratios are filled with the base version's ``fill_means``, as
+    ``fit_industry`` filled the training rows, and the new version keeps them.
+    """
+    from sklearn.metrics import roc_auc_score
+
+    from .folded import FoldedLDA
+    from .train import write_artifacts
+
+    if 'industry' in batch:
+        batch = batch[batch['industry'] == industry]
+    fill = fill_non_finite(np.full(N_FEATURES, np.nan), fill_means)[0]
+    stats.update(fill_non_finite(batch[FEATURES].to_numpy(dtype=float), fill), batch['label'].to_numpy())
+    scaler, lda = stats.to_sklearn()
+    X, y = stats.reservoir()
+    report = {
+        'industry': industry,
+        'rows': int(stats.count.sum()),
+        'rows_by_label': {'bankrupt': int(stats.count[1]), 'non_bankrupt': int(stats.count[0])},
+        'batch_rows': int(len(batch)),
+        'rows_dropped': stats.rows_dropped,
+        'auc': float(roc_auc_score(y, FoldedLDA.from_sklearn(lda, scaler).predict_proba(X))),
+        'thresholds': stats.thresholds(),
+        'fill_means': {f: float(v) for f, v in zip(FEATURES, fill)},
+        'refreshed': True,
+    }
+    return write_artifacts(out_dir, version, scaler, lda, report, stats=stats), report
@@ -0,0 +1,34 @@
+"""SIC code to industry mapping used throughout the notebook."""
+
+# In the notebook's dict literal 3841 and 2833 appear under both Healthcare and
+# Manufacturing; the later Manufacturing entries win, so they are listed there only.
+SIC_TO_INDUSTRY = {
+    # ✅ Healthcare
+    8011: 'Healthcare', 8021: 'Healthcare', 8051: 'Healthcare', 8062: 'Healthcare',
+    2834: 'Healthcare', 3826: 'Healthcare', 3829: 'Healthcare', 3845: 'Healthcare',
+
+    # ✅ Finance & Banking
+    6020: 'Finance & Banking', 6021: 'Finance & Banking', 6035: 'Finance & Banking',
+    6036: 'Finance & Banking', 6111: 'Finance & Banking', 6141: 'Finance & Banking',
+
+    # ✅ Tech
+    3571: 'Tech', 3674: 'Tech', 7370: 'Tech', 7371: 'Tech', 7372: 'Tech', 7373: 'Tech',
+    7374: 'Tech', 3577: 'Tech', 3572: 'Tech', 5045: 'Tech', 5065: 'Tech',
+
+    # ✅ Manufacturing
+    3711: 'Manufacturing', 3721: 'Manufacturing', 3761: 'Manufacturing', 3841: 'Manufacturing',
+    3441: 'Manufacturing', 3561: 'Manufacturing', 2833: 'Manufacturing',
+
+    # ✅ Retail
+    5411: 'Retail', 5331: 'Retail', 5311: 'Retail', 5999: 'Retail', 5621: 'Retail',
+
+    # ✅ Energy, Oil & Gas
+    1311: 'Energy, Oil & Gas', 1389: 'Energy, Oil & Gas', 2911: 'Energy, Oil & Gas',
+    4922: 'Energy, Oil & Gas', 4932: 'Energy, Oil & Gas', 4931: 'Energy, Oil & Gas',
+
+    # ✅ Misc/Other
+    2836: 'Chemicals', 2040: 'Consumer Products', 2086: 'Consumer Products',
+}
+
+# Industries in first-appearance order
+INDUSTRIES = list(dict.fromkeys(SIC_TO_INDUSTRY.values()))
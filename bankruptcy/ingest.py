@@ -0,0 +1,121 @@
+"""Chunked ingestion of a Compustat funda extract into a partitioned Parquet store.
+
+Only ``COLUMNS_TO_KEEP`` are parsed, with compact dtypes, and the SIC filter and
+null drop run per chunk, so peak memory is bounded by ``chunk_size`` rather than
+by the size of the extract.
+"""
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from .features import FINANCIAL_COLUMNS
+from .industries import INDUSTRIES, SIC_TO_INDUSTRY
+from .instrument import count, stage
+
+COLUMNS_TO_KEEP = [
+    'tic', 'fyear', 'act', 'lct', 'at', 'seq',
+    'ebit', 'sale', 'lt', 'prcc_f', 'csho', 'sic'
+]
+
+# fyear and sic can be missing in the raw extract, so they are parsed as floats
+# and narrowed once the nulls are gone
+READ_DTYPES = {'tic': 'category', 'fyear': 'float32', 'sic': 'float32',
+               **{c: 'float32' for c in FINANCIAL_COLUMNS}}
+
+DEFAULT_CHUNK_SIZE = 500_000
+
+
+def clean_chunk(chunk):
+    """Map SIC to industry, drop unmapped and incomplete rows, narrow dtypes."""
+    chunk = chunk.assign(industry=chunk['sic'].map(SIC_TO_INDUSTRY))
+    chunk = chunk.dropna()
+    return chunk.astype({
+        'fyear': 'int16',
+        'sic': 'int16',
+        'tic': 'category',
+        'industry': pd.CategoricalDtype(INDUSTRIES),
+    })
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as exc:
+        raise ImportError("writing the Parquet store requires pyarrow (pip install pyarrow)") from exc
+
+
+def store_schema():
+    """Arrow schema of every chunk written to the store.
+
+    pandas categoricals otherwise become dictionaries with the narrowest index
+    type for each chunk's categories (int8 for a chunk with few tickers, int16
+    for one with more), and files with mixed index widths in one partition
+    cannot be read back together.
+    """
+    import pyarrow as pa
+
+    return pa.schema(
+        [('tic', pa.dictionary(pa.int32(), pa.string())), ('fyear', pa.int16())]
+        + [(c, pa.float32()) for c in FINANCIAL_COLUMNS]
+        + [('sic', pa.int16()), ('industry', pa.dictionary(pa.int32(), pa.string()))]
+    )
+
+
+def ingest_csv(source, store_dir, chunk_size=DEFAULT_CHUNK_SIZE, overwrite=False):
+    """Stream ``source`` into ``store_dir`` partitioned by industry and fyear.
+
+    Returns a dict with ``rows_read``, ``rows_written`` and per-industry row counts.
+    """
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if os.path.isdir(store_dir) and os.listdir(store_dir):
+        if not overwrite:
+            raise FileExistsError(f"{store_dir} is not empty; pass overwrite=True to replace it")
+        import shutil
+        shutil.rmtree(store_dir)
+    os.makedirs(store_dir, exist_ok=True)
+
+    run_id = uuid.uuid4().hex[:8]
+    schema = store_schema()
+    rows_read = 0
+    per_industry = pd.Series(0, index=INDUSTRIES, dtype='int64')
+    reader = pd.read_csv(source, usecols=COLUMNS_TO_KEEP, dtype=READ_DTYPES, chunksize=chunk_size)
+    for i, chunk in enumerate(reader):
+        rows_read += len(chunk)
+        count('ingest_rows_read', len(chunk))
+        with stage('ingest_clean_chunk'):
+            chunk = clean_chunk(chunk)
+        if chunk.empty:
+            continue
+        per_industry += chunk['industry'].value_counts().reindex(INDUSTRIES, fill_value=0)
+        with stage('ingest_write_parquet'):
+            table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            pq.write_to_dataset(
+                table, store_dir, partition_cols=['industry', 'fyear'],
+                basename_template=f'part-{run_id}-{i:05d}-{{i}}.parquet',
+            )
+
+    return {
+        'rows_read': rows_read,
+        'rows_written': int(per_industry.sum()),
+        'industries': {k: int(v) for k, v in per_industry.items() if v},
+    }
+
+
+def read_store(store_dir, industries=None, years=None, columns=None):
+    """Load (a slice of) the store; filters are pushed down to the partitions."""
+    _require_pyarrow()
+    filters = []
+    if industries is not None:
+        filters.append(('industry', 'in', list(industries)))
+    if years is not None:
+        filters.append(('fyear', 'in', [int(y) for y in years]))
+    frame = pd.read_parquet(store_dir, columns=columns, filters=filters or None)
+    if 'fyear' in frame:
+        frame['fyear'] = np.asarray(frame['fyear'], dtype='int16')
+    return frame
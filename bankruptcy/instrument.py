@@ -0,0 +1,229 @@
+"""Opt-in stage timers, counters and memory high-water marks.
+
+Disabled by default: ``stage()`` then returns a shared no-op context manager
+and ``count()`` returns immediately, so instrumented hot paths cost one
+function call. Enable with ``enable()`` or ``BANKRUPTCY_PROFILE=1``.
+
+    with stage('predict_proba'):
+        ...
+    count('rows_scored', len(X))
+    print(to_prometheus())
+
+Other modules can attach state that travels with snapshots (and so across
+worker processes) through ``register_section``; ``drift`` uses it for its
+streaming histograms.
+"""
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ENV_VAR = 'BANKRUPTCY_PROFILE'
+PREFIX = 'bankruptcy'
+
+_enabled = os.environ.get(ENV_VAR, '').lower() not in ('', '0', 'false', 'no')
+_lock = threading.Lock()
+_stages = {}
+_counters = {}
+_sections = {}
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+def _max_rss_bytes():
+    if resource is None:
+        return None
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+class _Stage:
+    __slots__ = ('name', 't0')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.t0
+        rss = _max_rss_bytes()
+        with _lock:
+            entry = _stages.get(self.name)
+            if entry is None:
+                entry = _stages[self.name] = {'calls': 0, 'total_s': 0.0, 'max_s': 0.0, 'max_rss_bytes': None}
+            entry['calls'] += 1
+            entry['total_s'] += elapsed
+            entry['max_s'] = max(entry['max_s'], elapsed)
+            entry['max_rss_bytes'] = rss
+        return False
+
+
+def enable(on=True):
+    global _enabled
+    _enabled = bool(on)
+
+
+def enabled():
+    return _enabled
+
+
+def register_section(name, snapshot, merge, reset, prometheus=None):
+    """Include ``snapshot()`` under ``name`` in every snapshot.
+
+    ``merge(section)`` folds another process's section in, ``reset()`` clears
+    it and ``prometheus(section)`` returns exposition lines for it.
+    """
+    _sections[name] = (snapshot, merge, reset, prometheus)
+
+
+def reset():
+    with _lock:
+        _stages.clear()
+        _counters.clear()
+    for _, _, reset_section, _ in _sections.values():
+        reset_section()
+
+
+def stage(name):
+    """Context manager timing one pass through ``name``."""
+    if not _enabled:
+        return _NULL_STAGE
+    return _Stage(name)
+
+
+def count(name, n=1):
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def snapshot():
+    with _lock:
+        stages = {name: dict(entry) for name, entry in _stages.items()}
+        counters = dict(_counters)
+    for entry in stages.values():
+        entry['mean_s'] = entry['total_s'] / entry['calls']
+    snap = {'enabled': _enabled, 'max_rss_bytes': _max_rss_bytes(), 'stages': stages, 'counters': counters}
+    for name, (section, _, _, _) in _sections.items():
+        snap[name] = section()
+    return snap
+
+
+def merge(snap):
+    """Fold a ``snapshot()`` taken in another process into this one."""
+    with _lock:
+        for name, other in snap['stages'].items():
+            entry = _stages.setdefault(name, {'calls': 0, 'total_s': 0.0, 'max_s': 0.0, 'max_rss_bytes': None})
+            entry['calls'] += other['calls']
+            entry['total_s'] += other['total_s']
+            entry['max_s'] = max(entry['max_s'], other['max_s'])
+            entry['max_rss_bytes'] = max(entry['max_rss_bytes'] or 0, other['max_rss_bytes'] or 0) or None
+        for name, value in snap['counters'].items():
+            _counters[name] = _counters.get(name, 0) + value
+    for name, (_, merge_section, _, _) in _sections.items():
+        if snap.get(name):
+            merge_section(snap[name])
+
+
+def worker_call(on, func, *args):
+    """Run ``func`` in a pool worker with instrumentation ``on``; returns ``(result, snapshot or None)``."""
+    enable(on)
+    if not on:
+        return func(*args), None
+    reset()
+    return func(*args), snapshot()
+
+
+def collect(future):
+    """Result of a ``worker_call`` future, merging the worker's snapshot."""
+    result, snap = future.result()
+    if snap is not None:
+        merge(snap)
+    return result
+
+
+def to_json(indent=2):
+    return json.dumps(snapshot(), indent=indent)
+
+
+def _metric_name(name):
+    return ''.join(c if c.isalnum() else '_' for c in name)
+
+
+def to_prometheus():
+    """Prometheus text exposition of ``snapshot()``."""
+    snap = snapshot()
+    lines = []
+    if snap['max_rss_bytes'] is not None:
+        lines += [f'# TYPE {PREFIX}_max_rss_bytes gauge', f"{PREFIX}_max_rss_bytes {snap['max_rss_bytes']}"]
+    if snap['stages']:
+        for metric, key, kind in (('stage_calls_total', 'calls', 'counter'),
+                                  ('stage_seconds_total', 'total_s', 'counter'),
+                                  ('stage_seconds_max', 'max_s', 'gauge')):
+            lines.append(f'# TYPE {PREFIX}_{metric} {kind}')
+            for name, entry in sorted(snap['stages'].items()):
+                lines.append(f'{PREFIX}_{metric}{{stage="{name}"}} {entry[key]}')
+    for name, value in sorted(snap['counters'].items()):
+        metric = f'{PREFIX}_{_metric_name(name)}_total'
+        lines += [f'# TYPE {metric} counter', f'{metric} {value}']
+    for name, (_, _, _, prometheus) in _sections.items():
+        if prometheus is not None and snap.get(name):
+            lines += prometheus(snap[name])
+    return '\n'.join(lines) + '\n'
+
+
+def write_metrics(path):
+    """Write the snapshot as Prometheus text for ``*.prom``/``*.txt``, JSON otherwise."""
+    text = to_prometheus() if str(path).endswith(('.prom', '.txt')) else to_json()
+    with open(path, 'w') as f:
+        f.write(text)
+
+
+@contextmanager
+def profile(path):
+    """Capture a profile of the block: pyinstrument HTML for ``*.html``, cProfile stats otherwise."""
+    if str(path).endswith('.html'):
+        try:
+            from pyinstrument import Profiler
+        except ImportError as exc:
+            raise RuntimeError("HTML profiles need pyinstrument (pip install pyinstrument)") from exc
+        profiler = Profiler()
+        profiler.start()
+        try:
+            yield profiler
+        finally:
+            profiler.stop()
+            with open(path, 'w') as f:
+                f.write(profiler.output_html())
+    else:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield profiler
+        finally:
+            profiler.disable()
+            profiler.dump_stats(path)
@@ -0,0 +1,43 @@
+"""Row-count matching of bankrupt and non-bankrupt companies (notebook "Final Model" step).
+
+Companies are paired when they have the same number of firm-years. Instead of
+bucketing tickers into per-count Python lists, each side's ``value_counts`` is
+ranked within its row count and the two sides are joined on (row count, rank),
+which keeps ``min(n_bankrupt, n_non_bankrupt)`` companies per count.
+"""
+import numpy as np
+import pandas as pd
+
+
+def _ranked_counts(frame, rng):
+    counts = frame['tic'].value_counts(sort=False)
+    ranked = pd.DataFrame({'tic': counts.index.to_numpy(), 'rows': counts.to_numpy()})
+    if rng is None:
+        # Same order as iterating value_counts() in the notebook's invert_counts
+        ranked = ranked.iloc[np.argsort(-ranked['rows'].to_numpy(), kind='stable')]
+    else:
+        ranked = ranked.iloc[rng.permutation(len(ranked))]
+    ranked['rank'] = ranked.groupby('rows').cumcount()
+    return ranked
+
+
+def match_pairs(bankrupt, non_bankrupt, seed=None):
+    """(bankrupt tic, non-bankrupt tic, row count) pairs as a DataFrame.
+
+    With ``seed=None`` the first ``n`` companies per row count are taken, as in the
+    notebook; otherwise each side is drawn at random with that seed.
+    """
+    rng = None if seed is None else np.random.default_rng(seed)
+    pairs = _ranked_counts(bankrupt, rng).merge(
+        _ranked_counts(non_bankrupt, rng), on=['rows', 'rank'], suffixes=('_bankrupt', '_non_bankrupt')
+    )
+    return pairs[['tic_bankrupt', 'tic_non_bankrupt', 'rows']]
+
+
+def match_row_counts(bankrupt, non_bankrupt, seed=None):
+    """Rows of both groups restricted to matched companies, bankrupt rows first."""
+    pairs = match_pairs(bankrupt, non_bankrupt, seed=seed)
+    return pd.concat([
+        bankrupt[bankrupt['tic'].isin(pairs['tic_bankrupt'])],
+        non_bankrupt[non_bankrupt['tic'].isin(pairs['tic_non_bankrupt'])],
+    ], ignore_index=True)
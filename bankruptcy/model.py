@@ -0,0 +1,66 @@
+"""Loading the trained scaler/LDA pair and the industry Z-score weights."""
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from .features import FEATURES
+from .folded import FoldedLDA
+from .instrument import stage
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_MODEL_PATH = os.path.join(REPO_ROOT, 'lda_model.pkl')
+DEFAULT_SCALER_PATH = os.path.join(REPO_ROOT, 'scaler.pkl')
+# The same pair converted by 'bankruptcy convert'; preferred by the registry when present
+DEFAULT_ARTIFACT_PATH = os.path.join(REPO_ROOT, 'lda_model.json')
+
+# Z-score weights for each industry
+Z_WEIGHTS = {
+    'Healthcare': {
+        'X1': -0.140792,
+        'X2':  0.140466,
+        'X3':  0.055419,
+        'X4':  0.075092,
+        'X5':  0.121032
+    },
+    'Tech': {
+        'X1': -0.461234,
+        'X2':  0.538634,
+        'X3':  0.043953,
+        'X4':  0.119705,
+        'X5':  0.172948
+    }
+}
+
+
+def weight_vector(industry):
+    """Z-score weights for ``industry`` as an array ordered like FEATURES."""
+    return np.array([Z_WEIGHTS[industry][f] for f in FEATURES])
+
+
+class ScoringModel:
+    """A fitted StandardScaler + LinearDiscriminantAnalysis pair.
+
+    Scoring goes through the folded weights; ``sklearn_predict_proba`` keeps the
+    original pipeline for parity checks.
+    """
+
+    def __init__(self, model, scaler):
+        self.model = model
+        self.scaler = scaler
+        self.folded = FoldedLDA.from_sklearn(model, scaler)
+
+    def predict_proba(self, X):
+        """Probability of the positive class for an (n, 5) array of raw X1-X5."""
+        return self.folded.predict_proba(X)
+
+    def sklearn_predict_proba(self, X):
+        scaled = self.scaler.transform(pd.DataFrame(np.asarray(X, dtype=float).reshape(-1, len(FEATURES)), columns=FEATURES))
+        return self.model.predict_proba(scaled)[:, 1]
+
+
+def load_model(model_path=DEFAULT_MODEL_PATH, scaler_path=DEFAULT_SCALER_PATH):
+    """Load the joblib-pickled LDA model and scaler."""
+    with stage('joblib_load'):
+        return ScoringModel(joblib.load(model_path), joblib.load(scaler_path))
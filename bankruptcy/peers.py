@@ -0,0 +1,193 @@
+"""Precomputed peer index: sorted probabilities per (industry, fyear).
+
+Built once from a scored universe (the Parquet output of ``universe``, or any
+frame with tic/industry/fyear/ML_Probability), the index keeps each peer
+group's probabilities sorted in one flat array, with tickers aligned::
+
+    prob      float64 (n,)   sorted within each group
+    tic       int32   (n,)   code into ``tickers``
+    tic_rows  int64   (n,)   within each group, its rows ordered by ticker code
+    industry / fyear / start / stop   one entry per group, [start, stop) rows
+    version   str     one per group: the model version that scored it
+
+Ranking a probability is then two ``searchsorted`` calls on its group's
+slice for the percentile, plus a look at the few rows either side of the
+insertion point for the nearest peers; the company's own rows, left out of
+its ranking, are found by one more ``searchsorted`` on the group's slice of
+``tic_rows``. Nothing is rescanned per query.
+Probabilities are only comparable within one model version, so the index
+records the version per industry (the ``Model_Version`` column written by
+``universe``) and callers should not rank against it once that version is
+no longer the one scoring; rebuild the index after retraining.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from .industries import INDUSTRIES
+from .registry import DEFAULT_MODELS_DIR
+
+PEER_INDEX_FILE = 'peers.npz'
+DEFAULT_PEER_INDEX_PATH = os.path.join(DEFAULT_MODELS_DIR, PEER_INDEX_FILE)
+DEFAULT_NEAREST = 5
+SCORED_COLUMNS = ['tic', 'industry', 'fyear', 'ML_Probability']
+VERSION_COLUMN = 'Model_Version'
+_NO_ROWS = np.empty(0, dtype=np.int64)
+
+
+class PeerIndex:
+    """Sorted peer probabilities with O(log n) percentile and nearest-peer lookups."""
+
+    __slots__ = ('prob', 'tic', 'tickers', 'groups', 'versions', 'tic_rows', '_tic_sorted')
+
+    def __init__(self, prob, tic, tickers, industry, fyear, start, stop, versions=None, tic_rows=None):
+        self.prob = np.asarray(prob, dtype=float)
+        self.tic = np.asarray(tic, dtype=np.int32)
+        self.tickers = np.asarray(tickers)
+        self.groups = {(INDUSTRIES[i], int(y)): (int(a), int(b))
+                       for i, y, a, b in zip(industry, fyear, start, stop)}
+        self.versions = dict(versions or {})
+        if tic_rows is None:
+            tic_rows = np.arange(len(self.tic), dtype=np.int64)
+            for a, b in self.groups.values():
+                tic_rows[a:b] = a + np.argsort(self.tic[a:b], kind='stable')
+        self.tic_rows = np.asarray(tic_rows, dtype=np.int64)
+        self._tic_sorted = self.tic[self.tic_rows]
+
+    @classmethod
+    def from_frame(cls, scored, versions=None):
+        """Index a scored frame; unscored rows and unknown industries are left out.
+
+        Model versions per industry come from its ``Model_Version`` column, or
+        from ``versions`` for frames without one; an industry scored by more
+        than one version cannot be indexed.
+        """
+        if VERSION_COLUMN in scored:
+            found = scored.groupby(scored['industry'].astype(str), observed=True)[VERSION_COLUMN].unique()
+            mixed = {i: sorted(map(str, v)) for i, v in found.items() if len(v) > 1}
+            if mixed:
+                raise ValueError(f"scored by more than one model version, rescore first: {mixed}")
+            versions = {**{i: str(v[0]) for i, v in found.items()}, **(versions or {})}
+        industry = pd.Categorical(scored['industry'].astype(str), categories=INDUSTRIES).codes.astype(np.int8)
+        prob = np.asarray(scored['ML_Probability'], dtype=float)
+        keep = (industry >= 0) & np.isfinite(prob)
+        fyear = np.asarray(scored['fyear']).astype(np.int16)[keep]
+        tic_codes, tickers = pd.factorize(np.asarray(scored['tic'].astype(str))[keep], sort=True)
+        industry, prob = industry[keep], prob[keep]
+
+        order = np.lexsort((prob, fyear, industry))
+        industry, fyear, prob, tic_codes = industry[order], fyear[order], prob[order], tic_codes[order]
+        boundaries = np.flatnonzero((np.diff(industry) != 0) | (np.diff(fyear) != 0)) + 1
+        start = np.concatenate([[0], boundaries]).astype(np.int64)
+        stop = np.concatenate([boundaries, [len(prob)]]).astype(np.int64)
+        industries = {INDUSTRIES[i] for i in industry[start]}
+        versions = {i: v for i, v in (versions or {}).items() if i in industries}
+        return cls(prob, tic_codes, np.asarray(tickers, dtype=str), industry[start], fyear[start], start, stop,
+                   versions)
+
+    @classmethod
+    def from_parquet(cls, path):
+        """Index the scored Parquet dataset written by ``score_universe``."""
+        import pyarrow.dataset as ds
+
+        names = ds.dataset(path, format='parquet', partitioning='hive').schema.names
+        columns = SCORED_COLUMNS + [VERSION_COLUMN] * (VERSION_COLUMN in names)
+        return cls.from_frame(pd.read_parquet(path, columns=columns))
+
+    def save(self, path):
+        keys = list(self.groups)
+        bounds = np.array([self.groups[k] for k in keys], dtype=np.int64).reshape(-1, 2)
+        tmp = f'{path}.tmp.npz'
+        np.savez(tmp, prob=self.prob, tic=self.tic, tickers=self.tickers,
+                 industry=np.array([INDUSTRIES.index(i) for i, _ in keys], dtype=np.int8),
+                 fyear=np.array([y for _, y in keys], dtype=np.int16), start=bounds[:, 0], stop=bounds[:, 1],
+                 version=np.array([self.versions.get(i, '') for i, _ in keys], dtype=str), tic_rows=self.tic_rows)
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            # Indexes saved without versions load with none, so no version matches them
+            version = data['version'] if 'version' in data.files else [''] * len(data['industry'])
+            versions = {INDUSTRIES[i]: str(v) for i, v in zip(data['industry'], version) if v}
+            return cls(data['prob'], data['tic'], data['tickers'], data['industry'], data['fyear'],
+                       data['start'], data['stop'], versions,
+                       data['tic_rows'] if 'tic_rows' in data.files else None)
+
+    def __len__(self):
+        return len(self.prob)
+
+    def years(self, industry):
+        return sorted(y for i, y in self.groups if i == industry)
+
+    def resolve_year(self, industry, fyear):
+        """``fyear`` if indexed for the industry, else the closest indexed year (None if the industry is absent)."""
+        if (industry, fyear) in self.groups:
+            return fyear
+        years = self.years(industry)
+        if not years:
+            return None
+        return min(years, key=lambda y: (abs(y - fyear), -y))
+
+    def peers(self, industry, fyear):
+        """(sorted probabilities, tickers) of one group; views into the index."""
+        start, stop = self.groups.get((industry, int(fyear)), (0, 0))
+        return self.prob[start:stop], self.tickers[self.tic[start:stop]]
+
+    def rank(self, industry, fyear, prob, nearest=DEFAULT_NEAREST, exclude=None):
+        """Percentile of ``prob`` among the group's peers and the ``nearest`` peers by probability.
+
+        The percentile is the mid-rank share of peers below ``prob`` (ties count
+        half). ``fyear`` falls back to the closest indexed year; ``exclude`` is a
+        ticker (the company itself) left out of the percentile, the peer count
+        and the nearest peers. Returns None if the industry is not indexed or
+        has no other peers.
+        """
+        year = self.resolve_year(industry, int(fyear))
+        if year is None:
+            return None
+        start, stop = self.groups[industry, year]
+        group = self.prob[start:stop]
+        below = np.searchsorted(group, prob, side='left')
+        at_or_below = np.searchsorted(group, prob, side='right')
+
+        size, n_below, n_at_or_below = len(group), below, at_or_below
+        own = self._ticker_rows(exclude, start, stop)
+        if len(own):
+            own_prob = self.prob[own]
+            size -= len(own)
+            n_below -= int((own_prob < prob).sum())
+            n_at_or_below -= int((own_prob <= prob).sum())
+        if size == 0:
+            return None
+        percentile = 100.0 * (n_below + n_at_or_below) / (2 * size)
+
+        # Nearest peers sit within ``nearest`` (+ the excluded rows) of the insertion point
+        reach = nearest + len(own)
+        lo, hi = max(below - reach, 0), min(at_or_below + reach, len(group))
+        rows = np.arange(start + lo, start + hi)
+        if len(own):
+            rows = rows[~np.isin(rows, own)]
+        tickers = self.tickers[self.tic[rows]]
+        closest = np.argsort(np.abs(self.prob[rows] - prob), kind='stable')[:nearest]
+        return {
+            'industry': industry, 'fyear': year, 'version': self.versions.get(industry), 'peers': int(size),
+            'percentile': float(percentile),
+            'nearest': [{'tic': str(t), 'ML_Probability': float(p)}
+                        for t, p in zip(tickers[closest], self.prob[rows[closest]])],
+        }
+
+    def _ticker_rows(self, ticker, start, stop):
+        """Index rows of ``ticker`` within the group [start, stop); ``tickers`` is sorted."""
+        if ticker is None:
+            return _NO_ROWS
+        # Keys in the arrays' own dtypes: a mismatched one makes searchsorted convert the whole array
+        code = np.searchsorted(self.tickers, np.asarray(ticker, dtype=self.tickers.dtype))
+        if code == len(self.tickers) or self.tickers[code] != ticker:
+            return _NO_ROWS
+        code = self.tic.dtype.type(code)
+        codes = self._tic_sorted[start:stop]
+        lo, hi = np.searchsorted(codes, code, side='left'), np.searchsorted(codes, code, side='right')
+        return self.tic_rows[start + lo:start + hi]
@@ -0,0 +1,131 @@
+"""Data-quality gate applied to whole batches of X1-X5 before scoring.
+
+Each rule is a boolean mask over the batch and sets one bit of a per-row flag:
+
+    missing_input      a financial input is NaN
+    zero_assets        ``at`` is 0, so X1/X2/X3/X5 are undefined
+    zero_liabilities   ``lt`` is 0, so X4 is undefined
+    non_finite         a ratio is +/-inf or NaN for any other reason
+    outlier            a ratio lies more than ``outlier_z`` training SDs from the training mean
+    unknown_industry   the row's industry has no model (set by the registry scorers, which
+                       leave the row unscored, not by the gate itself)
+
+Undefined ratios are imputed with the training fill means persisted in the
+model artifact (the notebook's ``fillna(X.mean())``, without needing the
+training frame in memory). Rows that would need more than ``max_imputed`` of
+the five ratios imputed are rejected and left unscored; outliers are only
+flagged unless ``clip_outliers`` is set.
+"""
+import numpy as np
+
+from .features import FEATURES, FINANCIAL_COLUMNS
+from .instrument import count
+
+RULES = ('missing_input', 'zero_assets', 'zero_liabilities', 'non_finite', 'outlier', 'unknown_industry')
+RULE_BITS = {rule: 1 << i for i, rule in enumerate(RULES)}
+RULE_DESCRIPTIONS = {
+    'missing_input': "a financial input is missing",
+    'zero_assets': "Total Assets is 0 (X1, X2, X3 and X5 are undefined)",
+    'zero_liabilities': "Total Liabilities is 0 (X4 is undefined)",
+    'non_finite': "a ratio is infinite or undefined",
+    'outlier': "a ratio is far outside the training range",
+    'unknown_industry': "no model is available for the industry",
+}
+DEFAULT_OUTLIER_Z = 10.0
+DEFAULT_MAX_IMPUTED = 2
+
+
+def describe_flags(flags):
+    """Rule names set in one row's flag value."""
+    return [rule for rule in RULES if int(flags) & RULE_BITS[rule]]
+
+
+class QualityReport:
+    """Outcome of ``QualityGate.check`` for one batch."""
+
+    __slots__ = ('X', 'flags', 'scored', 'imputed', 'counts')
+
+    def __init__(self, X, flags, scored, imputed, counts):
+        self.X = X                # (n, 5) ratios with imputations/clipping applied; NaN rows are rejected
+        self.flags = flags        # (n,) uint8 bitmask of RULES
+        self.scored = scored      # (n,) rows that passed the gate
+        self.imputed = imputed    # (n,) rows with at least one imputed ratio
+        self.counts = counts      # rows hitting each rule, plus rows/imputed/rejected totals
+
+    def __repr__(self):
+        return f"QualityReport({self.counts})"
+
+
+class QualityGate:
+    """Vectorized screening and imputation against one model's training statistics."""
+
+    __slots__ = ('fill', 'mean', 'scale', 'outlier_z', 'max_imputed', 'clip_outliers')
+
+    def __init__(self, fill, mean, scale, outlier_z=DEFAULT_OUTLIER_Z, max_imputed=DEFAULT_MAX_IMPUTED,
+                 clip_outliers=False):
+        self.fill = np.asarray(fill, dtype=float).reshape(len(FEATURES))
+        self.mean = np.asarray(mean, dtype=float).reshape(len(FEATURES))
+        self.scale = np.asarray(scale, dtype=float).reshape(len(FEATURES))
+        self.outlier_z = outlier_z
+        self.max_imputed = max_imputed
+        self.clip_outliers = clip_outliers
+
+    @classmethod
+    def for_model(cls, model, **options):
+        """Gate from a ModelArtifact or ScoringModel.
+
+        Without persisted fill means the scaler mean is used: the scaler was fit
+        on the mean-filled training X, whose column means equal the fill means.
+        """
+        if hasattr(model, 'scaler_mean'):
+            mean, scale, fill_means = model.scaler_mean, model.scaler_scale, model.fill_means
+        else:
+            mean, scale, fill_means = model.scaler.mean_, model.scaler.scale_, None
+        fill = [fill_means[f] for f in FEATURES] if fill_means else mean
+        return cls(fill, mean, scale, **options)
+
+    def check(self, X, inputs=None):
+        """Screen an (n, 5) ratio array; ``inputs`` (raw columns) lets zero/missing inputs be told apart."""
+        X = np.asarray(X, dtype=float).reshape(-1, len(FEATURES))
+        finite = np.isfinite(X)
+        masks = {}
+        if inputs is not None:
+            masks['missing_input'] = np.zeros(len(X), dtype=bool)
+            for c in FINANCIAL_COLUMNS:
+                masks['missing_input'] |= np.isnan(np.asarray(inputs[c], dtype=float))
+            masks['zero_assets'] = np.asarray(inputs['at'], dtype=float) == 0
+            masks['zero_liabilities'] = np.asarray(inputs['lt'], dtype=float) == 0
+            explained = masks['missing_input'] | masks['zero_assets'] | masks['zero_liabilities']
+            masks['non_finite'] = ~finite.all(axis=1) & ~explained
+        else:
+            masks['non_finite'] = ~finite.all(axis=1)
+        with np.errstate(invalid='ignore'):
+            z = np.abs(X - self.mean) / self.scale
+        outlier_cells = finite & (z > self.outlier_z)
+        masks['outlier'] = outlier_cells.any(axis=1)
+
+        flags = np.zeros(len(X), dtype=np.uint8)
+        for rule, mask in masks.items():
+            flags |= mask.astype(np.uint8) * np.uint8(RULE_BITS[rule])
+
+        bad_cells = ~finite
+        n_bad = bad_cells.sum(axis=1)
+        scored = n_bad <= self.max_imputed
+        imputed = scored & (n_bad > 0)
+        clean = np.where(bad_cells, self.fill, X)
+        if self.clip_outliers:
+            clean = np.clip(clean, self.mean - self.outlier_z * self.scale, self.mean + self.outlier_z * self.scale)
+        clean[~scored] = np.nan
+
+        counts = {rule: int(masks[rule].sum()) if rule in masks else 0 for rule in RULES}
+        counts.update(rows=int(len(X)), imputed=int(imputed.sum()), rejected=int((~scored).sum()))
+        for key, value in counts.items():
+            count(f'dq_{key}', value)
+        return QualityReport(clean, flags, scored, imputed, counts)
+
+
+def merge_counts(counts, other):
+    """Add one batch's counts into a running total."""
+    for key, value in other.items():
+        counts[key] = counts.get(key, 0) + value
+    return counts
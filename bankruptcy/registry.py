@@ -0,0 +1,184 @@
+"""Per-industry model registry with lazy loading and a bounded LRU cache.
+
+Artifacts live under ``<root>/<industry-slug>/<version>/``::
+
+    models/healthcare/20250101T000000/model.json      (preferred; see artifact.py)
+                                      lda_model.pkl
+                                      scaler.pkl
+                                      z_weights.json
+                                      training.json   (risk-bucket thresholds)
+                                      bootstrap.npz   (optional, from 'bankruptcy bootstrap')
+                                      drift.npz       (training histograms for the drift monitor)
+
+A version with ``model.json`` loads without unpickling or importing sklearn; the
+pickles and side files are only read for versions that have not been converted.
+
+Versions sort lexicographically, so timestamped names make the newest one the
+default. Industries without a directory fall back to the repo-level
+``lda_model.pkl``/``scaler.pkl`` and the hardcoded ``Z_WEIGHTS`` (version
+``legacy``), which is what ``app.py`` has always used.
+"""
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+
+import joblib
+
+from .artifact import ARTIFACT_FILE, ModelArtifact
+from .bootstrap import BOOTSTRAP_FILE, BootstrapEnsemble
+from .drift import DRIFT_FILE, LEGACY_BASELINE_PATH, DriftBaseline
+from .features import FEATURES
+from .industries import INDUSTRIES
+from .instrument import stage
+from .model import (
+    DEFAULT_ARTIFACT_PATH, DEFAULT_MODEL_PATH, DEFAULT_SCALER_PATH, REPO_ROOT, Z_WEIGHTS, ScoringModel
+)
+from .quality import QualityGate
+from .risk import LEGACY_BUCKETS, RiskBuckets
+
+DEFAULT_MODELS_DIR = os.path.join(REPO_ROOT, 'models')
+DEFAULT_CACHE_SIZE = 4
+LEGACY_VERSION = 'legacy'
+
+
+def industry_slug(industry):
+    """'Energy, Oil & Gas' -> 'energy_oil_gas'."""
+    return re.sub(r'[^a-z0-9]+', '_', industry.lower()).strip('_')
+
+
+class ModelBundle:
+    """Everything needed to score one industry: scaler/LDA pair, Z-weights, risk buckets, the
+    data-quality gate built from its training statistics and, when they exist, the bootstrap
+    ensemble and the drift baseline."""
+
+    __slots__ = ('industry', 'version', 'model', 'z_weights', 'risk', 'bootstrap', 'quality', 'drift')
+
+    def __init__(self, industry, version, model, z_weights, risk=LEGACY_BUCKETS, bootstrap=None, quality=None,
+                 drift=None):
+        self.industry = industry
+        self.version = version
+        self.model = model
+        self.z_weights = z_weights
+        self.risk = risk
+        self.bootstrap = bootstrap
+        self.quality = quality or QualityGate.for_model(model)
+        self.drift = drift
+
+    def __repr__(self):
+        return f"ModelBundle({self.industry!r}, {self.version!r})"
+
+
+class ModelRegistry:
+    """Loads industry bundles on first use and keeps at most ``maxsize`` in memory."""
+
+    def __init__(self, root=DEFAULT_MODELS_DIR, maxsize=DEFAULT_CACHE_SIZE, legacy=True):
+        self.root = root
+        self.maxsize = maxsize
+        self.legacy = legacy
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def industries(self):
+        """Industries that can be scored: trained ones plus the legacy fallbacks."""
+        found = set(Z_WEIGHTS) if self.legacy else set()
+        found.update(i for i in INDUSTRIES if os.path.isdir(os.path.join(self.root, industry_slug(i))))
+        return [i for i in INDUSTRIES if i in found]
+
+    def versions(self, industry):
+        path = os.path.join(self.root, industry_slug(industry))
+        versions = sorted(d for d in os.listdir(path) if os.path.isdir(os.path.join(path, d))) if os.path.isdir(path) else []
+        if not versions and self.legacy and industry in Z_WEIGHTS:
+            versions = [LEGACY_VERSION]
+        return versions
+
+    def resolve(self, industry, version=None):
+        """The concrete version ``get`` would load (newest when ``version`` is None)."""
+        versions = self.versions(industry)
+        if not versions:
+            raise KeyError(f"no model for industry {industry!r} under {self.root}")
+        if version is None:
+            return versions[-1]
+        if version not in versions:
+            raise KeyError(f"no version {version!r} for industry {industry!r}; available: {versions}")
+        return version
+
+    def get(self, industry, version=None):
+        key = (industry, self.resolve(industry, version))
+        with self._lock:
+            bundle = self._cache.get(key)
+            if bundle is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return bundle
+            self.misses += 1
+
+        # Load outside the lock so other industries can still be served
+        bundle = self._load(*key)
+        with self._lock:
+            self._cache[key] = bundle
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+        return bundle
+
+    def _load(self, industry, version):
+        with stage('registry_load'):
+            return self._read_bundle(industry, version)
+
+    def _read_bundle(self, industry, version):
+        if version == LEGACY_VERSION:
+            if os.path.isfile(DEFAULT_ARTIFACT_PATH):
+                model = ModelArtifact.load(DEFAULT_ARTIFACT_PATH)
+            else:
+                model = ScoringModel(joblib.load(DEFAULT_MODEL_PATH), joblib.load(DEFAULT_SCALER_PATH))
+            drift = DriftBaseline.load(LEGACY_BASELINE_PATH) if os.path.isfile(LEGACY_BASELINE_PATH) else None
+            return ModelBundle(industry, version, model, dict(Z_WEIGHTS[industry]), drift=drift)
+
+        path = os.path.join(self.root, industry_slug(industry), version)
+        bootstrap_path = os.path.join(path, BOOTSTRAP_FILE)
+        bootstrap = BootstrapEnsemble.load(bootstrap_path) if os.path.isfile(bootstrap_path) else None
+        drift_path = os.path.join(path, DRIFT_FILE)
+        drift = DriftBaseline.load(drift_path) if os.path.isfile(drift_path) else None
+        artifact_path = os.path.join(path, ARTIFACT_FILE)
+        if os.path.isfile(artifact_path):
+            artifact = ModelArtifact.load(artifact_path)
+            z_weights = artifact.z_weights or dict(zip(FEATURES, artifact.folded.coef.tolist()))
+            return ModelBundle(industry, version, artifact, z_weights,
+                               RiskBuckets.from_thresholds(artifact.thresholds), bootstrap, drift=drift)
+
+        model = ScoringModel(joblib.load(os.path.join(path, 'lda_model.pkl')),
+                             joblib.load(os.path.join(path, 'scaler.pkl')))
+        weights_path = os.path.join(path, 'z_weights.json')
+        if os.path.isfile(weights_path):
+            with open(weights_path) as f:
+                z_weights = json.load(f)
+        else:
+            # The notebook reports lda.coef_ as the Altman-style Z-score weights
+            z_weights = dict(zip(FEATURES, model.model.coef_[0].tolist()))
+        training_path = os.path.join(path, 'training.json')
+        risk = LEGACY_BUCKETS
+        if os.path.isfile(training_path):
+            with open(training_path) as f:
+                risk = RiskBuckets.from_thresholds(json.load(f).get('thresholds'))
+        return ModelBundle(industry, version, model, z_weights, risk, bootstrap, drift=drift)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._cache),
+                'maxsize': self.maxsize,
+                'cached': [f'{i}@{v}' for i, v in self._cache],
+            }
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
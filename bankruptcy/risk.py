@@ -0,0 +1,79 @@
+"""Risk buckets for LDA probabilities.
+
+Buckets are defined by three ascending cut points::
+
+    p <  c1         Very High Risk
+    c1 <= p <  c2   High Risk
+    c2 <= p <= c3   Medium Risk
+    p >  c3         Very Low Risk
+
+The repo-level model uses the app's original 0.49/0.50/0.50 cuts. Trained
+artifacts carry their own cuts, taken from the q25/q50/q75 of the training
+probabilities recorded in ``training.json``. Scalars and arrays go through the
+same vectorized comparisons, so the app and the batch scorers always agree.
+"""
+import numpy as np
+
+NOT_SCORED = "⚪ Not Scored"
+RISK_LABELS = ("🔴 Very High Risk", "🟧 High Risk", "🟨 Medium Risk", "🟩 Very Low Risk")
+LEGACY_CUTS = (0.49, 0.50, 0.50)
+QUANTILE_KEYS = ('q25', 'q50', 'q75')
+
+
+class RiskBuckets:
+    """Cut points plus labels; ``bucket`` labels whole arrays without a Python loop over rows."""
+
+    __slots__ = ('cuts', '_labels')
+
+    def __init__(self, cuts=LEGACY_CUTS):
+        cuts = np.asarray(cuts, dtype=float)
+        if cuts.shape != (len(RISK_LABELS) - 1,) or np.any(np.diff(cuts) < 0) or not np.isfinite(cuts).all():
+            raise ValueError(f"need {len(RISK_LABELS) - 1} ascending finite cut points, got {cuts.tolist()}")
+        self.cuts = cuts
+        # Index len(RISK_LABELS) is where NaN probabilities land
+        self._labels = np.array(RISK_LABELS + (NOT_SCORED,), dtype=object)
+
+    @classmethod
+    def from_thresholds(cls, thresholds):
+        """Buckets from a training report's ``thresholds``; legacy cuts if the quantiles are missing."""
+        if not thresholds or any(thresholds.get(k) is None for k in QUANTILE_KEYS):
+            return cls()
+        return cls([thresholds[k] for k in QUANTILE_KEYS])
+
+    def index(self, probs):
+        """Bucket number per probability (0 = Very High Risk); NaN maps to ``len(RISK_LABELS)``."""
+        probs = np.asarray(probs, dtype=float)
+        # Equivalent to searchsorted(cuts[:-1], side='right') plus a strict top cut,
+        # but a few comparisons beat a binary search over three cuts
+        idx = np.zeros(probs.shape, dtype=np.int8)
+        for cut in self.cuts[:-1]:
+            idx += probs >= cut
+        idx += probs > self.cuts[-1]
+        idx[np.isnan(probs)] = len(RISK_LABELS)
+        return idx
+
+    def bucket(self, probs):
+        return self._labels[self.index(probs)]
+
+    def label(self, prob):
+        return self._labels[self.index(prob)]
+
+    def describe(self):
+        """(label, range text) rows for display."""
+        c1, c2, c3 = (f'{c:.4g}' for c in self.cuts)
+        return list(zip(RISK_LABELS, (f'< {c1}', f'{c1} – {c2}', f'{c2} – {c3}', f'> {c3}')))
+
+    def __repr__(self):
+        return f"RiskBuckets({self.cuts.tolist()})"
+
+
+LEGACY_BUCKETS = RiskBuckets()
+
+
+def get_risk(prob, buckets=LEGACY_BUCKETS):
+    return buckets.label(prob)
+
+
+def risk_levels(probs, buckets=LEGACY_BUCKETS):
+    """Label an array of probabilities; NaN probabilities are labelled as not scored."""
+    return buckets.bucket(probs)
@@ -0,0 +1,124 @@
+"""Vectorized scoring of Compustat-style filings."""
+import numpy as np
+import pandas as pd
+
+from .drift import observe
+from .features import FEATURES, FINANCIAL_COLUMNS, compute_ratios, z_scores
+from .instrument import count, stage
+from .quality import RULE_BITS, QualityGate, merge_counts
+from .model import Z_WEIGHTS
+from .registry import ModelRegistry
+from .risk import LEGACY_BUCKETS, NOT_SCORED, risk_levels
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def industry_weights(industries, default_industry):
+    """(n, 5) Z-score weight rows; unknown industries fall back to the default."""
+    weights = pd.DataFrame(Z_WEIGHTS).T[FEATURES]
+    return weights.reindex(industries).fillna(weights.loc[default_industry]).to_numpy()
+
+
+def _predict_chunked(model, X, rows, out, chunk_size):
+    # One predict_proba call per chunk of finite rows
+    rows = rows[np.isfinite(X[rows]).all(axis=1)]
+    count('rows_scored', len(rows))
+    for start in range(0, len(rows), chunk_size):
+        idx = rows[start:start + chunk_size]
+        with stage('predict_proba'):
+            out[idx] = model.predict_proba(X[idx])
+
+
+def score_frame(frame, model, industry='Healthcare', chunk_size=DEFAULT_CHUNK_SIZE, interval_level=None):
+    """Score every row of ``frame`` and return tic/fyear/X1-X5/Z/probability/risk/DQ_Flags.
+
+    ``model`` is a ScoringModel applied to every row, or a ModelRegistry, in which
+    case each industry is scored with its own bundle and Z-weights. An ``industry``
+    column in ``frame`` overrides ``industry`` per row; with a registry, rows whose
+    industry has no model keep that industry, are left unscored and carry the
+    ``unknown_industry`` DQ flag. Every batch passes the
+    model's QualityGate: undefined ratios are imputed from training statistics,
+    rows needing too many imputations are left unscored (NaN probability), and
+    per-rule counts are returned in ``result.attrs['quality']``. X1-X5 in the
+    result are the raw ratios; Z and the probability use the gated ones.
+
+    With ``interval_level`` (e.g. 0.90) ML_Prob_Lower/ML_Prob_Upper are added
+    from each bundle's bootstrap ensemble, also on the gated ratios; versions
+    without an ensemble, and a plain ScoringModel, get NaN bounds.
+    """
+    with stage('compute_ratios'):
+        inputs = {c: np.asarray(frame[c], dtype=float) for c in FINANCIAL_COLUMNS}
+        X = compute_ratios(inputs)
+
+    if 'industry' in frame:
+        industries = np.asarray(frame['industry'].astype(object).fillna(industry))
+    else:
+        industries = np.full(len(frame), industry, dtype=object)
+
+    ml_prob = np.full(len(frame), np.nan)
+    gated = np.full_like(X, np.nan)
+    flags = np.zeros(len(frame), dtype=np.uint8)
+    lower = np.full(len(frame), np.nan)
+    upper = np.full(len(frame), np.nan)
+    quality = {}
+
+    def gate(checker, rows):
+        with stage('quality_gate'):
+            report = checker.check(X[rows], {c: v[rows] for c, v in inputs.items()})
+        gated[rows] = report.X
+        flags[rows] = report.flags
+        merge_counts(quality, report.counts)
+
+    if isinstance(model, ModelRegistry):
+        known = set(model.industries())
+        codes, uniques = pd.factorize(industries)
+        weight_rows = np.full((len(uniques), len(FEATURES)), np.nan)
+        risk = np.full(len(frame), NOT_SCORED, dtype=object)
+        for code, name in enumerate(uniques):
+            rows = np.flatnonzero(codes == code)
+            if name not in known:
+                # Kept under its own industry and left unscored rather than scored with another model
+                flags[rows] |= np.uint8(RULE_BITS['unknown_industry'])
+                merge_counts(quality, {'rows': len(rows), 'unknown_industry': len(rows), 'rejected': len(rows)})
+                continue
+            bundle = model.get(name)
+            weight_rows[code] = [bundle.z_weights[f] for f in FEATURES]
+            gate(bundle.quality, rows)
+            _predict_chunked(bundle.model, gated, rows, ml_prob, chunk_size)
+            risk[rows] = bundle.risk.bucket(ml_prob[rows])
+            observe(bundle, X[rows], ml_prob[rows])
+            if interval_level is not None and bundle.bootstrap is not None:
+                with stage('bootstrap_intervals'):
+                    lower[rows], _, upper[rows] = bundle.bootstrap.intervals(gated[rows], interval_level)
+        z_score = z_scores(gated, weight_rows[codes])
+    else:
+        rows = np.arange(len(frame))
+        gate(QualityGate.for_model(model), rows)
+        z_score = z_scores(gated, industry_weights(industries, industry))
+        _predict_chunked(model, gated, rows, ml_prob, chunk_size)
+        risk = risk_levels(ml_prob, LEGACY_BUCKETS)
+
+    with stage('build_result_frame'):
+        result = pd.DataFrame({'tic': np.asarray(frame['tic']), 'fyear': np.asarray(frame['fyear'])})
+        result['industry'] = industries
+        result[FEATURES] = X
+        result['Z_Score'] = z_score
+        result['ML_Probability'] = ml_prob
+        result['Risk_Level'] = risk
+        result['DQ_Flags'] = flags
+        if interval_level is not None:
+            result['ML_Prob_Lower'] = lower
+            result['ML_Prob_Upper'] = upper
+        result.attrs['quality'] = quality
+    return result
+
+
+def iter_score_csv(source, model, industry='Healthcare', chunk_size=DEFAULT_CHUNK_SIZE):
+    """Stream a CSV (path or file object) and yield scored chunks."""
+    reader = pd.read_csv(source, chunksize=chunk_size)
+    while True:
+        with stage('read_csv_chunk'):
+            chunk = next(reader, None)
+        if chunk is None:
+            return
+        yield score_frame(chunk, model, industry=industry, chunk_size=chunk_size)
@@ -0,0 +1,95 @@
+"""Closed-form sensitivities of the probability and Z-score to the raw financial inputs.
+
+The probability is ``p = sigmoid(w . X + b)`` and each ratio X1-X5 is a simple
+quotient of the inputs, so by the chain rule
+
+    dp/d(input) = p (1 - p) * w . dX/d(input)
+    dZ/d(input) = z_weights . dX/d(input)
+
+with ``dX/d(input)`` the 5 x 9 Jacobian below. Grid sweeps broadcast two inputs
+over a mesh and score every point with one ``predict_proba`` call.
+"""
+import numpy as np
+import pandas as pd
+
+from .features import FEATURES, FINANCIAL_COLUMNS, compute_ratios
+
+INPUT_LABELS = {
+    'act': "Assets Current Total",
+    'lct': "Liabilities Current Total",
+    'at': "Total Assets",
+    'seq': "Retained Earnings",
+    'ebit': "EBIT",
+    'sale': "Total Sales",
+    'lt': "Total Liabilities",
+    'prcc_f': "Stock Price",
+    'csho': "Shares Outstanding",
+}
+DEFAULT_GRID = 100
+
+
+def ratio_jacobian(inputs):
+    """(5, 9) matrix of dX_i/d(input_j), columns in FINANCIAL_COLUMNS order; NaN where at or lt is 0."""
+    v = {c: float(inputs[c]) for c in FINANCIAL_COLUMNS}
+    at = v['at'] if v['at'] != 0 else np.nan
+    lt = v['lt'] if v['lt'] != 0 else np.nan
+    J = pd.DataFrame(0.0, index=FEATURES, columns=FINANCIAL_COLUMNS)
+    J.loc['X1', ['act', 'lct', 'at']] = [1 / at, -1 / at, -(v['act'] - v['lct']) / at ** 2]
+    J.loc['X2', ['seq', 'at']] = [1 / at, -v['seq'] / at ** 2]
+    J.loc['X3', ['ebit', 'at']] = [1 / at, -v['ebit'] / at ** 2]
+    J.loc['X4', ['prcc_f', 'csho', 'lt']] = [v['csho'] / lt, v['prcc_f'] / lt, -v['prcc_f'] * v['csho'] / lt ** 2]
+    J.loc['X5', ['sale', 'at']] = [1 / at, -v['sale'] / at ** 2]
+    return J.to_numpy()
+
+
+def sensitivities(folded, inputs, z_weights=None):
+    """One row per raw input: value, dProb/dInput, the probability change for a +1% move and dZ/dInput."""
+    X = compute_ratios({c: [inputs[c]] for c in FINANCIAL_COLUMNS})
+    p = float(folded.predict_proba(X)[0])
+    J = ratio_jacobian(inputs)
+    dp = p * (1 - p) * (folded.coef @ J)
+    values = np.array([float(inputs[c]) for c in FINANCIAL_COLUMNS])
+    result = pd.DataFrame({
+        'input': [INPUT_LABELS[c] for c in FINANCIAL_COLUMNS],
+        'value': values,
+        'dProb_dInput': dp,
+        'dProb_per_1pct': dp * values * 0.01,
+    }, index=FINANCIAL_COLUMNS)
+    if z_weights is not None:
+        result['dZ_dInput'] = np.array([z_weights[f] for f in FEATURES]) @ J
+    return result
+
+
+def sweep_range(value, span=0.5, n=DEFAULT_GRID):
+    """``n`` points from (1 - span) to (1 + span) times ``value``; +/-1 around zero."""
+    if value == 0:
+        return np.linspace(-1.0, 1.0, n)
+    return np.linspace(value * (1 - span), value * (1 + span), n)
+
+
+def grid_sweep(folded, inputs, x_input, x_values, y_input, y_values):
+    """Probabilities over the (len(y_values), len(x_values)) mesh of two inputs, others held fixed."""
+    x_values = np.asarray(x_values, dtype=float)
+    y_values = np.asarray(y_values, dtype=float)
+    shape = (len(y_values), len(x_values))
+    columns = {c: np.full(shape, float(inputs[c])) for c in FINANCIAL_COLUMNS}
+    columns[x_input] = np.broadcast_to(x_values[None, :], shape)
+    columns[y_input] = np.broadcast_to(y_values[:, None], shape)
+    X = compute_ratios({c: a.ravel() for c, a in columns.items()})
+    prob = np.full(X.shape[0], np.nan)
+    finite = np.isfinite(X).all(axis=1)
+    prob[finite] = folded.predict_proba(X[finite])
+    return prob.reshape(shape)
+
+
+def grid_frame(x_input, x_values, y_input, y_values, prob):
+    """Long-format frame of a ``grid_sweep`` with cell edges (``x0``/``x1``/``y0``/``y1``) for heatmaps."""
+    x_values = np.asarray(x_values, dtype=float)
+    y_values = np.asarray(y_values, dtype=float)
+    xx, yy = np.meshgrid(x_values, y_values)
+    dx = np.diff(x_values).mean() / 2 if len(x_values) > 1 else 0.5
+    dy = np.diff(y_values).mean() / 2 if len(y_values) > 1 else 0.5
+    return pd.DataFrame({
+        x_input: xx.ravel(), y_input: yy.ravel(), 'ML_Probability': prob.ravel(),
+        'x0': xx.ravel() - dx, 'x1': xx.ravel() + dx, 'y0': yy.ravel() - dy, 'y1': yy.ravel() + dy,
+    })
@@ -0,0 +1,301 @@
+"""Asyncio HTTP scoring service that coalesces concurrent requests into micro-batches.
+
+Endpoints (HTTP/1.1, keep-alive)::
+
+    POST /score    {"tic": ..., "fyear": ..., "industry": "Tech",
+                    "act": ..., "lct": ..., "at": ..., "seq": ..., "ebit": ...,
+                    "sale": ..., "lt": ..., "prcc_f": ..., "csho": ...}
+    GET  /metrics  throughput, batch-size and latency counters
+    GET  /health
+
+Requests queue up for at most ``max_wait`` seconds or until ``max_batch`` are
+waiting; each batch then makes one vectorized call per industry, the same
+X1-X5 -> scaler/LDA -> risk bucket path as ``app.py``.
+"""
+import asyncio
+import json
+import math
+import time
+from collections import deque
+
+import numpy as np
+
+from . import instrument
+from .drift import observe
+from .features import FEATURES, FINANCIAL_COLUMNS, compute_ratios, z_scores
+from .quality import RULE_BITS, describe_flags
+from .registry import ModelRegistry
+from .risk import NOT_SCORED
+
+DEFAULT_MAX_BATCH = 256
+DEFAULT_MAX_WAIT = 0.002
+LATENCY_WINDOW = 10000
+
+
+def validate_record(record):
+    """Request dict with numeric inputs as floats (missing -> NaN); ValueError on bad types or values."""
+    if not isinstance(record, dict):
+        raise ValueError("expected a JSON object")
+    clean = dict(record)
+    for c in FINANCIAL_COLUMNS:
+        value = record.get(c)
+        if value is None:
+            clean[c] = math.nan
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+            raise ValueError(f"{c!r} must be a number, got {type(value).__name__}")
+        try:
+            clean[c] = float(value)
+        except ValueError:
+            raise ValueError(f"{c!r} must be a number, got {value!r}") from None
+    industry = record.get('industry')
+    if industry is not None and not isinstance(industry, str):
+        raise ValueError(f"'industry' must be a string, got {type(industry).__name__}")
+    return clean
+
+
+class ServiceMetrics:
+    """Request/batch counters and a sliding window of request latencies."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_items = 0
+        self.max_batch_seen = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def snapshot(self):
+        uptime = time.perf_counter() - self.started
+        lat = np.sort(np.fromiter(self.latencies, dtype=float)) * 1000 if self.latencies else None
+        return {
+            'uptime_s': uptime,
+            'requests': self.requests,
+            'errors': self.errors,
+            'requests_per_s': self.requests / uptime if uptime else 0.0,
+            'batches': self.batches,
+            'mean_batch_size': self.batched_items / self.batches if self.batches else 0.0,
+            'max_batch_size': self.max_batch_seen,
+            'latency_ms': None if lat is None else {
+                'p50': float(np.percentile(lat, 50)), 'p99': float(np.percentile(lat, 99)),
+                'max': float(lat[-1]), 'window': int(len(lat)),
+            },
+        }
+
+
+class MicroBatcher:
+    """Collects single-company requests and scores them together."""
+
+    def __init__(self, registry, default_industry='Healthcare', max_batch=DEFAULT_MAX_BATCH,
+                 max_wait=DEFAULT_MAX_WAIT, metrics=None):
+        self.registry = registry
+        self.default_industry = default_industry
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.metrics = metrics or ServiceMetrics()
+        self._queue = asyncio.Queue()
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def score(self, record):
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((record, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # drain whatever else arrived without waiting
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            records = [record for record, _ in batch]
+            try:
+                results = self.score_records(records)
+            except Exception:
+                # Rescore one at a time so a bad record only fails its own request
+                results = []
+                for record in records:
+                    try:
+                        results.append(self.score_records([record])[0])
+                    except Exception as e:
+                        results.append(e)
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+            self.metrics.batches += 1
+            self.metrics.batched_items += len(batch)
+            self.metrics.max_batch_seen = max(self.metrics.max_batch_seen, len(batch))
+
+    def score_records(self, records):
+        """Vectorized scoring of a list of request dicts; one model call per industry.
+
+        Records without an industry use ``default_industry``; an industry with no
+        model is echoed back unscored with the ``unknown_industry`` flag.
+        """
+        known = set(self.registry.industries())
+        industries = np.array([r.get('industry') if r.get('industry') is not None else self.default_industry
+                               for r in records], dtype=object)
+        columns = {c: np.array([r.get(c, np.nan) for r in records], dtype=float) for c in FINANCIAL_COLUMNS}
+        X = compute_ratios(columns)
+        gated = np.full_like(X, np.nan)
+        flags = np.zeros(len(records), dtype=np.uint8)
+        probs = np.full(len(records), np.nan)
+        z = np.full(len(records), np.nan)
+        risks = np.full(len(records), NOT_SCORED, dtype=object)
+        for industry in set(industries):
+            rows = np.flatnonzero(industries == industry)
+            if industry not in known:
+                flags[rows] = RULE_BITS['unknown_industry']
+                continue
+            bundle = self.registry.get(industry)
+            report = bundle.quality.check(X[rows], {c: v[rows] for c, v in columns.items()})
+            gated[rows], flags[rows] = report.X, report.flags
+            weights = np.array([bundle.z_weights[f] for f in FEATURES])
+            z[rows] = z_scores(gated[rows], weights)
+            scored = rows[report.scored]
+            if len(scored):
+                probs[scored] = bundle.model.predict_proba(gated[scored])
+            risks[rows] = bundle.risk.bucket(probs[rows])
+            observe(bundle, X[rows], probs[rows])
+
+        def clean(v):
+            return None if not math.isfinite(v) else float(v)
+
+        return [
+            {'tic': r.get('tic'), 'fyear': r.get('fyear'), 'industry': industries[i],
+             **{f: clean(X[i, j]) for j, f in enumerate(FEATURES)},
+             'Z_Score': clean(z[i]), 'ML_Probability': clean(probs[i]), 'Risk_Level': str(risks[i]),
+             'DQ_Flags': describe_flags(flags[i])}
+            for i, r in enumerate(records)
+        ]
+
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            413: 'Payload Too Large', 500: 'Internal Server Error'}
+MAX_BODY = 1 << 20
+
+
+class ScoringServer:
+    """Minimal HTTP/1.1 front end over a MicroBatcher."""
+
+    def __init__(self, batcher):
+        self.batcher = batcher
+        self.metrics = batcher.metrics
+        self._server = None
+
+    async def start(self, host='127.0.0.1', port=8000):
+        self.batcher.start()
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+        await self.batcher.stop()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode('latin-1').split(' ', 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get('content-length', 0))
+                if length > MAX_BODY:
+                    await self._respond(writer, 413, {'error': 'body too large'}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+                status, payload = await self._route(method, path, body)
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method, path, body):
+        if path == '/health':
+            return 200, {'status': 'ok'}
+        if path == '/metrics':
+            payload = {**self.metrics.snapshot(), 'registry': self.batcher.registry.stats()}
+            if instrument.enabled():
+                payload['instrument'] = instrument.snapshot()
+            return 200, payload
+        if path != '/score':
+            return 404, {'error': f'unknown path {path}'}
+        if method != 'POST':
+            return 405, {'error': 'use POST'}
+
+        t0 = time.perf_counter()
+        self.metrics.requests += 1
+        try:
+            record = validate_record(json.loads(body))
+            result = await self.batcher.score(record)
+        except ValueError as e:
+            self.metrics.errors += 1
+            return 400, {'error': str(e)}
+        except Exception as e:
+            self.metrics.errors += 1
+            return 500, {'error': str(e)}
+        self.metrics.latencies.append(time.perf_counter() - t0)
+        return 200, result
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive=True):
+        body = json.dumps(payload).encode()
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode() + body)
+        await writer.drain()
+
+
+async def serve(host='127.0.0.1', port=8000, registry=None, default_industry='Healthcare',
+                max_batch=DEFAULT_MAX_BATCH, max_wait=DEFAULT_MAX_WAIT):
+    registry = registry or ModelRegistry()
+    registry.get(default_industry)  # load before the first request arrives
+    server = ScoringServer(MicroBatcher(registry, default_industry, max_batch, max_wait))
+    bound = await server.start(host, port)
+    print(f"scoring service on http://{bound[0]}:{bound[1]}", flush=True)
+    await server.serve_forever()
@@ -0,0 +1,214 @@
+"""Per-industry training pipeline, one industry per worker process.
+
+For each industry this reproduces the notebook's "Final Model" section: sample as
+many non-bankrupt companies as there are bankrupt ones, match companies by
+row count, fit StandardScaler + LDA on the balanced set, then derive the
+Youden's J threshold and the q25/q50/q75 risk buckets. Artifacts are written in
+the layout ``ModelRegistry`` reads.
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from .artifact import ARTIFACT_FILE, ModelArtifact
+from .drift import DRIFT_FILE, DriftBaseline
+from .features import FEATURES, engineer_features
+from .industries import INDUSTRIES
+from .incremental import SufficientStats
+from .instrument import collect, enabled, stage, worker_call
+from .ingest import COLUMNS_TO_KEEP, READ_DTYPES, clean_chunk, read_store
+from .matching import match_row_counts
+from .registry import DEFAULT_MODELS_DIR, industry_slug
+
+DEFAULT_SEED = 42
+MIN_COMPANIES = 2
+
+
+def new_version():
+    """Timestamped version name; sorts chronologically in the registry."""
+    return datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')
+
+
+def load_bankrupt(path, last_fyear=None):
+    """The WRDS export (``industry_wise_bankrupt_financials.csv``) with X1-X5.
+
+    ``last_fyear`` is an optional CSV with ``tic`` and ``last_fyear`` columns;
+    firm-years after a company's final fiscal year are dropped.
+    """
+    frame = pd.read_csv(path)
+    cutoff = pd.read_csv(last_fyear) if last_fyear is not None else None
+    return engineer_features(frame, last_fyear=cutoff)
+
+
+def load_non_bankrupt(path):
+    """A Parquet store written by ``ingest_csv`` or a raw funda CSV, with X1-X5."""
+    if os.path.isdir(path):
+        frame = read_store(path)
+    else:
+        frame = clean_chunk(pd.read_csv(path, usecols=COLUMNS_TO_KEEP, dtype=READ_DTYPES))
+    return engineer_features(frame)
+
+
+def balanced_sample(bankrupt, non_bankrupt, seed=DEFAULT_SEED, match_seed=None):
+    """Equal company counts, then equal row counts per company, shuffled.
+
+    ``match_seed`` draws the row-count matches at random instead of taking the
+    first companies per count.
+    """
+    bankrupt_tics = bankrupt['tic'].unique()
+    non_bankrupt_tics = non_bankrupt['tic'].unique()
+    n_companies = min(len(bankrupt_tics), len(non_bankrupt_tics))
+
+    selected = np.random.RandomState(seed).choice(non_bankrupt_tics, size=n_companies, replace=False)
+    sampled_non_bankrupt = non_bankrupt[non_bankrupt['tic'].isin(selected)]
+
+    balanced = match_row_counts(bankrupt, sampled_non_bankrupt, seed=match_seed)
+    return balanced.sample(frac=1, random_state=seed).reset_index(drop=True)
+
+
+def youden_threshold(y, y_proba):
+    from sklearn.metrics import roc_curve
+
+    fpr, tpr, thresholds = roc_curve(y, y_proba)
+    return float(thresholds[(tpr - fpr).argmax()])
+
+
+def fit_industry(industry, bankrupt, non_bankrupt, seed=DEFAULT_SEED, match_seed=None):
+    """Fit one industry; returns (scaler, lda, report, stats) or raises ValueError if it can't be trained.
+
+    ``stats`` are the sufficient statistics of the training rows, which
+    ``bankruptcy.incremental`` extends when new fiscal years arrive.
+    """
+    from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
+    from sklearn.metrics import accuracy_score, roc_auc_score
+    from sklearn.preprocessing import StandardScaler
+
+    if bankrupt['tic'].nunique() < MIN_COMPANIES or non_bankrupt['tic'].nunique() < MIN_COMPANIES:
+        raise ValueError(
+            f"{industry}: need at least {MIN_COMPANIES} bankrupt and non-bankrupt companies, "
+            f"got {bankrupt['tic'].nunique()} and {non_bankrupt['tic'].nunique()}"
+        )
+    balanced = balanced_sample(bankrupt.assign(label=1), non_bankrupt.assign(label=0),
+                               seed=seed, match_seed=match_seed)
+    y = balanced['label'].astype(int)
+    if y.nunique() < 2:
+        raise ValueError(f"{industry}: no row-count matches between bankrupt and non-bankrupt companies")
+
+    # Replace inf and NaNs (very important)
+    X = balanced[FEATURES].replace([np.inf, -np.inf], np.nan)
+    fill_means = X.mean()
+    X = X.fillna(fill_means)
+
+    with stage('lda_fit'):
+        scaler = StandardScaler()
+        X_scaled = scaler.fit_transform(X)
+        lda = LinearDiscriminantAnalysis()
+        lda.fit(X_scaled, y)
+
+    y_proba = lda.predict_proba(X_scaled)[:, 1]
+    q25, q50, q75 = np.quantile(y_proba, [0.25, 0.50, 0.75])
+    report = {
+        'industry': industry,
+        'rows': int(len(balanced)),
+        'companies': {'bankrupt': int(balanced.loc[y == 1, 'tic'].nunique()),
+                      'non_bankrupt': int(balanced.loc[y == 0, 'tic'].nunique())},
+        'accuracy': float(accuracy_score(y, lda.predict(X_scaled))),
+        'auc': float(roc_auc_score(y, y_proba)),
+        'thresholds': {'youden': youden_threshold(y, y_proba),
+                       'q25': float(q25), 'q50': float(q50), 'q75': float(q75)},
+        'fill_means': {f: float(v) for f, v in fill_means.items()},
+        'seed': seed,
+        'match_seed': match_seed,
+    }
+    return scaler, lda, report, SufficientStats().update(X.to_numpy(), y.to_numpy())
+
+
+def artifact_metadata(industry, version, trained_at):
+    import sklearn
+
+    return {'industry': industry, 'version': version, 'trained_at': trained_at,
+            'sklearn_version': sklearn.__version__}
+
+
+def write_artifacts(out_dir, version, scaler, lda, report, stats=None):
+    path = os.path.join(out_dir, industry_slug(report['industry']), version)
+    os.makedirs(path, exist_ok=True)
+    joblib.dump(lda, os.path.join(path, 'lda_model.pkl'))
+    joblib.dump(scaler, os.path.join(path, 'scaler.pkl'))
+    z_weights = dict(zip(FEATURES, lda.coef_[0].tolist()))
+    with open(os.path.join(path, 'z_weights.json'), 'w') as f:
+        json.dump(z_weights, f, indent=2)
+    trained_at = datetime.now(timezone.utc).isoformat()
+    with open(os.path.join(path, 'training.json'), 'w') as f:
+        json.dump({**report, 'version': version, 'trained_at': trained_at}, f, indent=2)
+    artifact = ModelArtifact.from_sklearn(
+        lda, scaler, z_weights=z_weights, thresholds=report.get('thresholds'), fill_means=report.get('fill_means'),
+        metadata=artifact_metadata(report['industry'], version, trained_at),
+    )
+    artifact.save(os.path.join(path, ARTIFACT_FILE))
+    if stats is not None:
+        stats.save(os.path.join(path, 'stats.npz'))
+        DriftBaseline.from_sample(artifact, stats.reservoir()[0], artifact.scaler_mean,
+                                  artifact.scaler_scale).save(os.path.join(path, DRIFT_FILE))
+    return path
+
+
+def _train_worker(industry, bankrupt, non_bankrupt, out_dir, version, seed, match_seed):
+    try:
+        scaler, lda, report, stats = fit_industry(industry, bankrupt, non_bankrupt, seed=seed, match_seed=match_seed)
+    except ValueError as e:
+        return {'industry': industry, 'status': 'skipped', 'reason': str(e)}
+    path = write_artifacts(out_dir, version, scaler, lda, report, stats=stats)
+    return {**report, 'status': 'trained', 'path': path}
+
+
+def train_all(bankrupt, non_bankrupt, out_dir=DEFAULT_MODELS_DIR, industries=None, version=None,
+              max_workers=None, seed=DEFAULT_SEED, match_seed=None):
+    """Train every industry in parallel and return one summary dict per industry.
+
+    ``bankrupt`` and ``non_bankrupt`` are engineered frames (``tic``, ``industry``,
+    X1-X5). Industries without enough companies on both sides are reported as
+    skipped rather than failing the run.
+    """
+    industries = list(industries or INDUSTRIES)
+    version = version or new_version()
+    bankrupt_groups = dict(tuple(bankrupt.groupby('industry', observed=True)))
+    non_bankrupt_groups = dict(tuple(non_bankrupt.groupby('industry', observed=True)))
+    empty = bankrupt.iloc[:0]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                worker_call, enabled(), _train_worker, industry,
+                bankrupt_groups.get(industry, empty), non_bankrupt_groups.get(industry, empty),
+                out_dir, version, seed, match_seed,
+            )
+            for industry in industries
+        ]
+        return [collect(f) for f in futures]
+
+
+def _store_worker(industry, store_path, out_dir, version, seed, match_seed):
+    from .feature_store import FeatureStore
+
+    bankrupt, non_bankrupt = FeatureStore(store_path).training_frames(industry)
+    return _train_worker(industry, bankrupt, non_bankrupt, out_dir, version, seed, match_seed)
+
+
+def train_store(store_path, out_dir=DEFAULT_MODELS_DIR, industries=None, version=None,
+                max_workers=None, seed=DEFAULT_SEED, match_seed=None):
+    """``train_all`` over a feature store; each worker memory-maps its own industry slice."""
+    industries = list(industries or INDUSTRIES)
+    version = version or new_version()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(worker_call, enabled(), _store_worker, industry, store_path, out_dir, version,
+                            seed, match_seed)
+            for industry in industries
+        ]
+        return [collect(f) for f in futures]
@@ -0,0 +1,115 @@
+"""Per-ticker risk trajectories over multi-year histories.
+
+Rows are sorted once by (tic, fyear); group starts are found from the sorted
+keys, and year-over-year deltas, trailing rolling means and per-ticker trend
+statistics are computed with shifted arrays, cumulative sums and
+``np.add.reduceat`` -- no per-ticker Python loop.
+"""
+import numpy as np
+import pandas as pd
+
+from .features import FEATURES
+from .risk import risk_levels
+
+DEFAULT_WINDOW = 3
+FLAT_SLOPE = 0.001  # probability change per year treated as flat
+
+
+def _sorted_groups(tic, fyear):
+    """Sort order plus, for every sorted row, whether it starts a ticker and where its group starts."""
+    tic_codes, tickers = pd.factorize(np.asarray(tic))
+    order = np.lexsort((np.asarray(fyear), tic_codes))
+    codes = tic_codes[order]
+    is_start = np.empty(len(codes), dtype=bool)
+    is_start[:1] = True
+    is_start[1:] = codes[1:] != codes[:-1]
+    group_start = np.maximum.accumulate(np.where(is_start, np.arange(len(codes)), 0))
+    return order, codes, tickers, is_start, group_start
+
+
+def _deltas(values, is_start):
+    out = np.empty_like(values)
+    out[1:] = values[1:] - values[:-1]
+    out[is_start] = np.nan
+    return out
+
+
+def _rolling_mean(values, group_start, window):
+    """Trailing mean over the last ``window`` rows of the same ticker, ignoring NaN."""
+    valid = ~np.isnan(values)
+    sums = np.concatenate([np.zeros((1,) + values.shape[1:]), np.cumsum(np.where(valid, values, 0.0), axis=0)])
+    counts = np.concatenate([np.zeros((1,) + values.shape[1:]), np.cumsum(valid, axis=0)])
+    i = np.arange(len(values))
+    lo = np.maximum(i - window + 1, group_start)
+    total = sums[i + 1] - sums[lo]
+    n = counts[i + 1] - counts[lo]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(n > 0, total / n, np.nan)
+
+
+def trajectory_features(tic, fyear, X, prob, window=DEFAULT_WINDOW):
+    """Firm-year frame sorted by (tic, fyear) with deltas and trailing means of X1-X5 and probability."""
+    order, _, _, is_start, group_start = _sorted_groups(tic, fyear)
+    X = np.asarray(X, dtype=float)[order]
+    prob = np.asarray(prob, dtype=float)[order]
+    values = np.column_stack([X, prob])
+    deltas = _deltas(values, is_start)
+    rolling = _rolling_mean(values, group_start, window)
+
+    names = FEATURES + ['ML_Probability']
+    columns = {'tic': np.asarray(tic)[order], 'fyear': np.asarray(fyear)[order]}
+    for j, name in enumerate(names):
+        columns[name] = values[:, j]
+    for j, name in enumerate(names):
+        columns[f'd_{name}'] = deltas[:, j]
+    for j, name in enumerate(names):
+        columns[f'roll{window}_{name}'] = rolling[:, j]
+    columns['years_on_record'] = np.arange(len(order)) - group_start + 1
+    frame = pd.DataFrame(columns)
+    return frame
+
+
+def risk_trajectories(tic, fyear, prob, window=DEFAULT_WINDOW, risk=None):
+    """One row per ticker: history span, latest and trailing probability, OLS trend and risk bucket.
+
+    ``risk`` is the per-row bucket from the scorer (e.g. ``score_frame``'s
+    Risk_Level); without it the latest probability is bucketed with the legacy cuts.
+    """
+    order, codes, tickers, is_start, group_start = _sorted_groups(tic, fyear)
+    years = np.asarray(fyear, dtype=float)[order]
+    prob = np.asarray(prob, dtype=float)[order]
+    starts = np.flatnonzero(is_start)
+    stops = np.append(starts[1:], len(order))
+    last = stops - 1
+
+    # OLS slope of probability on fyear per ticker from grouped sums
+    valid = ~np.isnan(prob)
+    x = np.where(valid, years - years[group_start], 0.0)
+    y = np.where(valid, prob, 0.0)
+    n = np.add.reduceat(valid.astype(float), starts)
+    sx, sy = np.add.reduceat(x, starts), np.add.reduceat(y, starts)
+    sxx, sxy = np.add.reduceat(x * x, starts), np.add.reduceat(x * y, starts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        denom = n * sxx - sx * sx
+        slope = np.where(denom > 0, (n * sxy - sx * sy) / denom, np.nan)
+        mean_prob = np.where(n > 0, sy / n, np.nan)
+    min_prob = np.fmin.reduceat(prob, starts)
+    rolling = _rolling_mean(prob, group_start, window)[last]
+    change = prob[last] - prob[np.maximum(last - window + 1, starts)]
+
+    trend = np.select([np.isnan(slope), slope > FLAT_SLOPE, slope < -FLAT_SLOPE],
+                      ['insufficient history', 'rising', 'falling'], default='flat')
+    return pd.DataFrame({
+        'tic': tickers[codes[starts]],
+        'first_fyear': years[starts].astype(int),
+        'last_fyear': years[last].astype(int),
+        'n_years': stops - starts,
+        'latest_probability': prob[last],
+        f'roll{window}_probability': rolling,
+        f'change_{window}y': change,
+        'mean_probability': mean_prob,
+        'min_probability': min_prob,
+        'probability_slope': slope,
+        'probability_trend': trend,
+        'latest_risk': risk_levels(prob[last]) if risk is None else np.asarray(risk)[order][last],
+    })
@@ -0,0 +1,211 @@
+"""Scale-out scoring of every firm-year in an ingested Parquet store.
+
+The store written by ``ingest_csv`` is already partitioned by industry and
+fyear, so each (industry, fyear) directory is one task: a worker reads only
+that partition's files, scores it with the industry's registry bundle through
+``score_frame`` (quality gate included) and writes the result under the same
+``industry=/fyear=`` layout in the output directory. Nothing is gathered in
+the parent except one small summary dict per partition.
+
+Tasks run on a pluggable backend: ``process`` (a local ``ProcessPoolExecutor``,
+the default) or ``dask`` (a ``dask.distributed`` local cluster, or an existing
+scheduler via ``address``). ``scaling_sweep`` reruns the job per worker count
+and reports throughput, speedup and parallel efficiency.
+"""
+import os
+import shutil
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from .industries import INDUSTRIES
+from .ingest import _require_pyarrow
+from .instrument import collect, count, enabled, stage, worker_call
+from .quality import merge_counts
+from .registry import DEFAULT_MODELS_DIR, ModelRegistry
+
+DEFAULT_BACKEND = 'process'
+
+# One registry per worker process and models directory, so bundles are loaded
+# once per worker rather than once per partition
+_REGISTRIES = {}
+
+
+def store_partitions(store_dir, industries=None, years=None):
+    """{(industry, fyear): [parquet file paths]} for the store's hive partitions."""
+    _require_pyarrow()
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(store_dir, format='parquet', partitioning='hive')
+    partitions = defaultdict(list)
+    for fragment in dataset.get_fragments():
+        keys = ds.get_partition_keys(fragment.partition_expression)
+        industry, fyear = keys['industry'], int(keys['fyear'])
+        if industries is not None and industry not in industries:
+            continue
+        if years is not None and fyear not in years:
+            continue
+        partitions[industry, fyear].append(fragment.path)
+    order = {name: i for i, name in enumerate(INDUSTRIES)}
+    return dict(sorted(partitions.items(), key=lambda item: (order.get(item[0][0], len(order)), item[0])))
+
+
+def score_partition(paths, industry, fyear, models_dir, out_dir, run_id):
+    """Score one (industry, fyear) partition and write it to ``out_dir``; returns its summary."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from .scoring import score_frame
+
+    t0 = time.perf_counter()
+    registry = _REGISTRIES.get(models_dir)
+    if registry is None:
+        registry = _REGISTRIES[models_dir] = ModelRegistry(models_dir)
+    with stage('universe_read_partition'):
+        frame = pd.read_parquet(paths)
+    frame['industry'] = industry
+    frame['fyear'] = np.int16(fyear)
+    scored = score_frame(frame, registry, industry=industry)
+    # Recorded so the peer index knows which version its probabilities came from
+    scored['Model_Version'] = registry.get(industry).version
+    with stage('universe_write_partition'):
+        table = pa.Table.from_pandas(scored, preserve_index=False)
+        pq.write_to_dataset(table, out_dir, partition_cols=['industry', 'fyear'],
+                            basename_template=f'part-{run_id}-{{i}}.parquet')
+    count('universe_rows', len(scored))
+    return {
+        'industry': industry, 'fyear': int(fyear), 'rows': len(scored),
+        'scored': int(scored['ML_Probability'].notna().sum()),
+        'quality': scored.attrs['quality'], 'seconds': time.perf_counter() - t0,
+    }
+
+
+class ProcessBackend:
+    """Local process pool; worker instrumentation is merged into the parent."""
+
+    name = 'process'
+
+    def __init__(self, max_workers=None):
+        self.workers = max_workers or os.cpu_count() or 1
+
+    def map(self, func, tasks):
+        """Yield ``func(*task)`` results in completion order."""
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(worker_call, enabled(), func, *task) for task in tasks]
+            for future in as_completed(futures):
+                yield collect(future)
+
+
+class DaskBackend:
+    """``dask.distributed`` cluster: a local one with ``max_workers`` single-threaded workers, or ``address``."""
+
+    name = 'dask'
+
+    def __init__(self, max_workers=None, address=None):
+        try:
+            import dask.distributed  # noqa: F401
+        except ImportError as exc:
+            raise ImportError("the dask backend requires dask.distributed (pip install 'dask[distributed]')") from exc
+        self.workers = max_workers or os.cpu_count() or 1
+        self.address = address
+
+    def map(self, func, tasks):
+        from dask.distributed import Client, LocalCluster, as_completed as dask_completed
+
+        if self.address:
+            client = Client(self.address)
+        else:
+            cluster = LocalCluster(n_workers=self.workers, threads_per_worker=1, processes=True)
+            client = Client(cluster)
+        try:
+            if self.address:
+                self.workers = len(client.scheduler_info()['workers'])
+            futures = [client.submit(worker_call, enabled(), func, *task, pure=False) for task in tasks]
+            for future in dask_completed(futures):
+                yield collect(future)
+        finally:
+            client.close()
+            if not self.address:
+                cluster.close()
+
+
+BACKENDS = {'process': ProcessBackend, 'dask': DaskBackend}
+
+
+def get_backend(name=DEFAULT_BACKEND, max_workers=None, **options):
+    if name not in BACKENDS:
+        raise ValueError(f"unknown backend {name!r}; choose from {sorted(BACKENDS)}")
+    return BACKENDS[name](max_workers=max_workers, **options)
+
+
+def score_universe(store_dir, out_dir, models_dir=DEFAULT_MODELS_DIR, backend=DEFAULT_BACKEND, max_workers=None,
+                   industries=None, years=None, overwrite=False):
+    """Score every (industry, fyear) partition of ``store_dir`` in parallel into ``out_dir``.
+
+    ``backend`` is a backend name or instance. Returns a summary with row
+    counts, merged data-quality counts, wall-clock seconds and throughput.
+    """
+    _require_pyarrow()
+    if os.path.isdir(out_dir) and os.listdir(out_dir):
+        if not overwrite:
+            raise FileExistsError(f"{out_dir} is not empty; pass overwrite=True to replace it")
+        shutil.rmtree(out_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    if isinstance(backend, str):
+        backend = get_backend(backend, max_workers)
+
+    partitions = store_partitions(store_dir, industries=industries, years=years)
+    # Industries without a model (trained or legacy) are reported, not scored
+    available = set(ModelRegistry(models_dir).industries())
+    skipped = defaultdict(int)
+    for industry, fyear in [key for key in partitions if key[0] not in available]:
+        skipped[industry] += 1
+        del partitions[industry, fyear]
+    run_id = uuid.uuid4().hex[:8]
+    models_dir = os.path.abspath(models_dir)
+    tasks = [(paths, industry, fyear, models_dir, out_dir, run_id)
+             for (industry, fyear), paths in partitions.items()]
+
+    rows = scored = 0
+    quality = {}
+    per_industry = defaultdict(int)
+    busy = 0.0
+    t0 = time.perf_counter()
+    for result in backend.map(score_partition, tasks):
+        rows += result['rows']
+        scored += result['scored']
+        busy += result['seconds']
+        per_industry[result['industry']] += result['rows']
+        merge_counts(quality, result['quality'])
+    seconds = time.perf_counter() - t0
+
+    return {
+        'backend': backend.name, 'workers': backend.workers, 'partitions': len(tasks),
+        'rows': rows, 'scored': scored, 'seconds': seconds,
+        'rows_per_second': rows / seconds if seconds else 0.0,
+        # Share of the workers' wall-clock time spent inside tasks
+        'utilization': busy / (seconds * backend.workers) if seconds else 0.0,
+        'industries': dict(per_industry), 'skipped_partitions': dict(skipped), 'quality': quality,
+    }
+
+
+def scaling_sweep(store_dir, out_dir, worker_counts, models_dir=DEFAULT_MODELS_DIR, backend=DEFAULT_BACKEND,
+                  **options):
+    """Run ``score_universe`` once per worker count; adds speedup/efficiency against the first run.
+
+    Every run overwrites ``out_dir``, so it ends up holding the last run's output.
+    """
+    results = []
+    for workers in worker_counts:
+        summary = score_universe(store_dir, out_dir, models_dir, backend=get_backend(backend, workers),
+                                 overwrite=True, **options)
+        base = results[0] if results else summary
+        speedup = summary['rows_per_second'] / base['rows_per_second'] if base['rows_per_second'] else 0.0
+        summary['speedup'] = speedup
+        summary['efficiency'] = speedup * base['workers'] / workers
+        results.append(summary)
+    return results
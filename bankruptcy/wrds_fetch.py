@@ -0,0 +1,183 @@
+"""Bulk fetching of Compustat funda rows for the bankrupt-company ticker lists.
+
+Tickers are batched into parameterized ``tic IN (...)`` queries that run
+concurrently over a small connection pool, and the results are concatenated
+once. ``SQLiteSource``/``DuckDBSource`` stand in for WRDS's ``comp.funda`` so
+the fetch can be tested and benchmarked offline.
+"""
+import queue
+import sqlite3
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import pandas as pd
+
+from .instrument import count, stage
+
+# Required Z-score variables
+FUNDA_VARIABLES = ['tic', 'fyear', 'datadate', 'act', 'lct', 'at', 'seq', 'ebit', 'sale', 'lt', 'prcc_f', 'csho']
+FUNDA_FILTERS = "indfmt = 'INDL' AND datafmt = 'STD' AND popsrc = 'D' AND consol = 'C'"
+
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_POOL_SIZE = 4
+
+
+def build_query(n_tickers, placeholder=':'):
+    """SQL for ``n_tickers`` bound tickers named ``tic0 .. tic{n-1}``."""
+    names = [f'tic{i}' for i in range(n_tickers)]
+    sql = (
+        f"SELECT {', '.join(FUNDA_VARIABLES)} FROM comp.funda "
+        f"WHERE tic IN ({', '.join(placeholder + n for n in names)}) AND {FUNDA_FILTERS}"
+    )
+    return sql, names
+
+
+class WRDSSource:
+    """Live WRDS connections; ``raw_sql`` binds ``:name`` parameters."""
+
+    placeholder = ':'
+
+    def __init__(self, **connect_kwargs):
+        self.connect_kwargs = connect_kwargs
+
+    def connect(self):
+        import wrds
+        return wrds.Connection(**self.connect_kwargs)
+
+    def query(self, conn, sql, params):
+        return conn.raw_sql(sql, params=params)
+
+    def close(self, conn):
+        conn.close()
+
+
+class SQLiteSource:
+    """A local SQLite file with a ``funda`` table, attached as schema ``comp``."""
+
+    placeholder = ':'
+
+    def __init__(self, path):
+        self.path = path
+
+    def connect(self):
+        conn = sqlite3.connect(':memory:', check_same_thread=False)
+        conn.execute("ATTACH DATABASE ? AS comp", (self.path,))
+        return conn
+
+    def query(self, conn, sql, params):
+        return pd.read_sql_query(sql, conn, params=params)
+
+    def close(self, conn):
+        conn.close()
+
+
+class DuckDBSource:
+    """A local DuckDB file with a ``comp.funda`` table."""
+
+    placeholder = '$'
+
+    def __init__(self, path):
+        self.path = path
+
+    def connect(self):
+        import duckdb
+        return duckdb.connect(self.path, read_only=True)
+
+    def query(self, conn, sql, params):
+        return conn.execute(sql, params).df()
+
+    def close(self, conn):
+        conn.close()
+
+
+def write_standin(frame, path, kind='sqlite'):
+    """Write ``frame`` as a local ``comp.funda`` stand-in (``kind`` is sqlite or duckdb)."""
+    if kind == 'sqlite':
+        with sqlite3.connect(path) as conn:
+            frame.to_sql('funda', conn, if_exists='replace', index=False)
+            conn.execute("CREATE INDEX IF NOT EXISTS funda_tic ON funda (tic)")
+        return SQLiteSource(path)
+    if kind == 'duckdb':
+        import duckdb
+        with duckdb.connect(path) as conn:
+            conn.execute("CREATE SCHEMA IF NOT EXISTS comp")
+            conn.register('frame', frame)
+            conn.execute("CREATE OR REPLACE TABLE comp.funda AS SELECT * FROM frame")
+        return DuckDBSource(path)
+    raise ValueError(f"unknown stand-in kind {kind!r}")
+
+
+class ConnectionPool:
+    """At most ``size`` connections from ``source``, opened on demand and reused."""
+
+    def __init__(self, source, size=DEFAULT_POOL_SIZE):
+        self.source = source
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._opened = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self):
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                conn = self.source.connect() if len(self._opened) < self.size else None
+                if conn is not None:
+                    self._opened.append(conn)
+            if conn is None:
+                conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self):
+        with self._lock:
+            for conn in self._opened:
+                self.source.close(conn)
+            self._opened.clear()
+        self._idle = queue.LifoQueue()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def fetch_funda(bankrupt_companies, source, batch_size=DEFAULT_BATCH_SIZE, pool_size=DEFAULT_POOL_SIZE):
+    """Fetch funda rows for every ``tic`` in ``bankrupt_companies`` and tag them with ``industry``.
+
+    Like the notebook loop, a ticker listed under several industries appears once
+    per listing and a failing batch is reported and skipped; the skipped tickers
+    are stored in ``result.attrs['failed_tickers']``.
+    """
+    tickers = pd.unique(bankrupt_companies['tic'].dropna().astype(str))
+    batches = [list(tickers[i:i + batch_size]) for i in range(0, len(tickers), batch_size)]
+
+    def fetch(pool, batch):
+        sql, names = build_query(len(batch), source.placeholder)
+        with stage('wrds_batch_query'), pool.connection() as conn:
+            return source.query(conn, sql, dict(zip(names, batch)))
+
+    frames, failed = [], []
+    with ConnectionPool(source, pool_size) as pool, ThreadPoolExecutor(max_workers=pool_size) as executor:
+        futures = [(batch, executor.submit(fetch, pool, batch)) for batch in batches]
+        for batch, future in futures:
+            try:
+                frames.append(future.result())
+                count('wrds_rows_fetched', len(frames[-1]))
+            except Exception as e:
+                print(f"Error fetching {len(batch)} tickers ({batch[0]}..{batch[-1]}): {e}", file=sys.stderr)
+                failed.extend(batch)
+                count('wrds_failed_batches')
+
+    all_data = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=FUNDA_VARIABLES)
+    listings = bankrupt_companies[['tic', 'industry']].astype({'tic': str})
+    all_data = listings.merge(all_data, on='tic', how='inner')[FUNDA_VARIABLES + ['industry']]
+    all_data.attrs['failed_tickers'] = failed
+    return all_data
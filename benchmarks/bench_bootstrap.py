@@ -0,0 +1,47 @@
+"""Bootstrap ensemble: parallel fit time per worker count and interval scoring throughput.
+
+    python benchmarks/bench_bootstrap.py [--models 200] [--train-rows 2000] [--score-rows 100000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bankruptcy.bootstrap import fit_bootstrap  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--models', type=int, default=200)
+    parser.add_argument('--train-rows', type=int, default=2000)
+    parser.add_argument('--score-rows', type=int, default=100_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, os.cpu_count()])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    y = np.arange(args.train_rows) % 2
+    X = rng.normal(size=(args.train_rows, 5)) + y[:, None] * 0.3
+
+    print(f"fit {args.models} bootstrap LDAs on {args.train_rows:,} rows")
+    for workers in sorted(set(args.workers)):
+        t0 = time.perf_counter()
+        ensemble = fit_bootstrap(X, y, n_models=args.models, max_workers=workers)
+        print(f"  {workers:>3} workers: {time.perf_counter() - t0:6.2f} s")
+
+    X_score = rng.normal(size=(args.score_rows, 5))
+    t0 = time.perf_counter()
+    ensemble.intervals(X_score[:1])
+    single = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    ensemble.intervals(X_score)
+    batch = time.perf_counter() - t0
+    print(f"intervals: 1 row {single * 1000:.2f} ms, {args.score_rows:,} rows {batch:.2f} s "
+          f"({args.score_rows / batch:,.0f} rows/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Cost of the instrumentation hooks on ``score_frame``, disabled and enabled.
+
+    python benchmarks/bench_instrument.py [--rows 200000] [--chunksize 10000] [--repeat 7]
+"""
+import argparse
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bankruptcy import instrument, load_model, score_frame  # noqa: E402
+from bench_features import synthetic_panel  # noqa: E402
+
+
+def best_of(func, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--chunksize', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=7)
+    args = parser.parse_args()
+
+    frame, _ = synthetic_panel(args.rows)
+    model = load_model()
+    run = lambda: score_frame(frame, model, chunk_size=args.chunksize)  # noqa: E731
+    calls = 3 + 2 * -(-args.rows // args.chunksize)  # stage/count hooks hit per score_frame
+
+    instrument.enable(False)
+    hook = min(timeit.repeat(lambda: instrument.stage('x').__enter__(), number=100_000, repeat=5)) / 100_000
+    off = best_of(run, args.repeat)
+    instrument.enable()
+    on = best_of(run, args.repeat)
+    instrument.enable(False)
+
+    print(f"score_frame on {args.rows:,} rows, chunksize {args.chunksize:,} ({calls} hook calls)")
+    print(f"  disabled hook:  {hook * 1e9:6.0f} ns/call -> {calls * hook / off:.4%} of a disabled run")
+    print(f"  disabled run:   {off * 1000:8.1f} ms")
+    print(f"  enabled run:    {on * 1000:8.1f} ms ({on / off - 1:+.2%})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Per-call latency of sklearn predict_proba versus the folded LDA scorer.
+
+    python benchmarks/bench_lda.py [--calls 20000]
+"""
+import argparse
+import os
+import sys
+import timeit
+import warnings
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bankruptcy import check_parity, load_model  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=20000)
+    parser.add_argument('--batch', type=int, default=100000)
+    args = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    model = load_model()
+    diff = check_parity(model.folded, model.model, model.scaler)
+    print(f"parity: max |diff| = {diff:.2e}")
+
+    row = [0.05, 0.4, 0.08, 2.0, 0.9]
+    X = np.random.default_rng(0).standard_normal((args.batch, 5))
+    cases = {
+        'sklearn single row': (lambda: model.sklearn_predict_proba([row]), args.calls // 10),
+        'folded single row': (lambda: model.folded.predict_proba(row), args.calls),
+        'folded score_one': (lambda: model.folded.score_one(*row), args.calls),
+        f'sklearn {args.batch:,} rows': (lambda: model.sklearn_predict_proba(X), 20),
+        f'folded {args.batch:,} rows': (lambda: model.folded.predict_proba(X), 20),
+    }
+    for name, (fn, number) in cases.items():
+        per_call = min(timeit.repeat(fn, number=number, repeat=3)) / number
+        print(f"{name:>24}: {per_call * 1e6:10.2f} us/call")
+
+
+if __name__ == '__main__':
+    main()
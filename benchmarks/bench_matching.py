@@ -0,0 +1,76 @@
+"""Notebook ``invert_counts`` matching versus the vectorized ``match_row_counts``.
+
+    python benchmarks/bench_matching.py [--sizes 1000 10000 100000]
+"""
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bankruptcy.matching import match_row_counts  # noqa: E402
+
+
+def synthetic_side(n_tickers, prefix, rng):
+    rows = rng.integers(1, 30, n_tickers)
+    return pd.DataFrame({'tic': np.repeat([f'{prefix}{i}' for i in range(n_tickers)], rows)})
+
+
+def notebook_matching(sampled_bankrupt_df, sampled_non_bankrupt_df):
+    bankrupt_counts = sampled_bankrupt_df['tic'].value_counts()
+    non_bankrupt_counts = sampled_non_bankrupt_df['tic'].value_counts()
+
+    def invert_counts(counts):
+        grouped = defaultdict(list)
+        for tic, count in counts.items():
+            grouped[count].append(tic)
+        return grouped
+
+    grouped_bankrupt = invert_counts(bankrupt_counts)
+    grouped_non_bankrupt = invert_counts(non_bankrupt_counts)
+    matching_tics = []
+    for row_count in grouped_bankrupt:
+        if row_count in grouped_non_bankrupt:
+            n = min(len(grouped_bankrupt[row_count]), len(grouped_non_bankrupt[row_count]))
+            bankrupt_subset = grouped_bankrupt[row_count][:n]
+            non_bankrupt_subset = grouped_non_bankrupt[row_count][:n]
+            matching_tics.extend([(b, nb, row_count) for b, nb in zip(bankrupt_subset, non_bankrupt_subset)])
+
+    bankrupt_final = sampled_bankrupt_df[sampled_bankrupt_df['tic'].isin([b for b, _, _ in matching_tics])]
+    non_bankrupt_final = sampled_non_bankrupt_df[sampled_non_bankrupt_df['tic'].isin([nb for _, nb, _ in matching_tics])]
+    return pd.concat([bankrupt_final, non_bankrupt_final], ignore_index=True)
+
+
+def best_of(fn, repeat=3):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - t0)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'tickers':>9} {'rows':>10} {'notebook':>10} {'vectorized':>11} {'seeded':>8}")
+    for n in args.sizes:
+        bankrupt = synthetic_side(n // 10, 'B', rng)
+        non_bankrupt = synthetic_side(n, 'N', rng)
+        t_old, old = best_of(lambda: notebook_matching(bankrupt, non_bankrupt))
+        t_new, new = best_of(lambda: match_row_counts(bankrupt, non_bankrupt))
+        t_seed, _ = best_of(lambda: match_row_counts(bankrupt, non_bankrupt, seed=42))
+        pd.testing.assert_frame_equal(old, new)
+        print(f"{n:>9,} {len(bankrupt) + len(non_bankrupt):>10,} {t_old:>9.3f}s {t_new:>10.3f}s {t_seed:>7.3f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Load generator against a localhost ``bankruptcy serve`` instance.
+
+Starts the service in a subprocess, opens ``--connections`` keep-alive
+connections that each send ``--requests`` single-company POSTs back to back,
+and reports client-side throughput and latency next to the server's batch
+counters. Runs once without batching (``--max-batch 1``) and once with it.
+
+    python benchmarks/bench_service.py [--connections 64] [--requests 200]
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def start_server(max_batch, max_wait_ms):
+    proc = subprocess.Popen(
+        [sys.executable, '-W', 'ignore', '-m', 'bankruptcy', 'serve', '--port', '0',
+         '--max-batch', str(max_batch), '--max-wait-ms', str(max_wait_ms)],
+        cwd=REPO_ROOT, stdout=subprocess.PIPE, text=True,
+    )
+    line = proc.stdout.readline()
+    host, port = line.strip().rsplit('/', 1)[-1].split(':')
+    return proc, host, int(port)
+
+
+async def request(reader, writer, method, path, payload=None):
+    body = json.dumps(payload).encode() if payload is not None else b''
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: x\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    await reader.readline()
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line == b'\r\n':
+            break
+        if line.lower().startswith(b'content-length'):
+            length = int(line.split(b':')[1])
+    return json.loads(await reader.readexactly(length))
+
+
+async def client(host, port, n_requests, seed, latencies):
+    rng = np.random.default_rng(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    for i in range(n_requests):
+        record = {'tic': f'C{seed}', 'fyear': 2024, 'industry': ['Healthcare', 'Tech'][i % 2],
+                  **{c: float(v) for c, v in zip(['act', 'lct', 'at', 'seq', 'ebit', 'sale', 'lt', 'prcc_f', 'csho'],
+                                                 rng.uniform(1, 1000, 9))}}
+        t0 = time.perf_counter()
+        await request(reader, writer, 'POST', '/score', record)
+        latencies.append(time.perf_counter() - t0)
+    writer.close()
+
+
+async def load(host, port, connections, n_requests):
+    latencies = []
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client(host, port, n_requests, s, latencies) for s in range(connections)))
+    elapsed = time.perf_counter() - t0
+    reader, writer = await asyncio.open_connection(host, port)
+    metrics = await request(reader, writer, 'GET', '/metrics')
+    writer.close()
+    return elapsed, np.array(latencies) * 1000, metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--connections', type=int, default=64)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--max-wait-ms', type=float, default=2.0)
+    args = parser.parse_args()
+
+    for label, max_batch in [('unbatched', 1), ('micro-batched', 256)]:
+        proc, host, port = start_server(max_batch, args.max_wait_ms)
+        try:
+            elapsed, lat, metrics = asyncio.run(load(host, port, args.connections, args.requests))
+        finally:
+            proc.terminate()
+            proc.wait()
+        total = args.connections * args.requests
+        print(f"{label:>14}: {total / elapsed:9.0f} req/s   p50 {np.percentile(lat, 50):6.2f} ms   "
+              f"p99 {np.percentile(lat, 99):6.2f} ms   mean batch {metrics['mean_batch_size']:6.1f}")
+
+
+if __name__ == '__main__':
+    main()
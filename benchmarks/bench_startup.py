@@ -0,0 +1,58 @@
+"""Cold-start cost of the headless scoring package.
+
+Each measurement runs in a fresh interpreter so nothing is already imported.
+``load_artifact`` is the registry's legacy bundle from ``lda_model.json``;
+``load_pickles`` is ``load_model()`` on the joblib pickles, for comparison.
+"Heavy imports" are checked before the pickles are loaded.
+
+    python benchmarks/bench_startup.py [--repeat 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r"""
+import json, sys, time
+t0 = time.perf_counter()
+import bankruptcy
+t1 = time.perf_counter()
+bundle = bankruptcy.ModelRegistry(root='/nonexistent').get('Healthcare')
+t2 = time.perf_counter()
+bundle.model.predict_proba([[0.1, 0.2, 0.05, 1.5, 0.9]])
+t3 = time.perf_counter()
+heavy = sorted(m for m in ('streamlit', 'matplotlib', 'sklearn') if m in sys.modules)
+bankruptcy.load_model()
+t4 = time.perf_counter()
+print(json.dumps({'import': t1 - t0, 'load_artifact': t2 - t1, 'first_predict': t3 - t2, 'load_pickles': t4 - t3,
+                  'heavy_modules': heavy}))
+"""
+
+
+def run_probe():
+    out = subprocess.run(
+        [sys.executable, '-W', 'ignore', '-c', PROBE],
+        cwd=REPO_ROOT, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [run_probe() for _ in range(args.repeat)]
+    for stage in ('import', 'load_artifact', 'first_predict', 'load_pickles'):
+        times = [r[stage] * 1000 for r in runs]
+        print(f"{stage:>14}: median {statistics.median(times):8.1f} ms   min {min(times):8.1f} ms")
+    heavy = sorted({m for r in runs for m in r['heavy_modules']})
+    print(f"{'heavy imports':>14}: {', '.join(heavy) if heavy else 'none'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""Throughput of trajectory features and per-ticker summaries on a synthetic panel.
+
+    python benchmarks/bench_trajectory.py [--rows 3000000] [--years 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bankruptcy.trajectory import risk_trajectories, trajectory_features  # noqa: E402
+
+
+def synthetic_panel(n_rows, n_years, seed=0):
+    rng = np.random.default_rng(seed)
+    n_tickers = n_rows // n_years
+    tic = np.repeat(np.arange(n_tickers), n_years)
+    fyear = np.tile(np.arange(2024 - n_years + 1, 2025), n_tickers)
+    shuffle = rng.permutation(len(tic))
+    X = rng.normal(size=(len(tic), 5))
+    prob = rng.uniform(0.4, 0.6, len(tic))
+    return tic[shuffle], fyear[shuffle], X, prob
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=3_000_000)
+    parser.add_argument('--years', type=int, default=20)
+    args = parser.parse_args()
+
+    tic, fyear, X, prob = synthetic_panel(args.rows, args.years)
+    t0 = time.perf_counter()
+    features = trajectory_features(tic, fyear, X, prob)
+    t1 = time.perf_counter()
+    summary = risk_trajectories(tic, fyear, prob)
+    t2 = time.perf_counter()
+    print(f"{len(features):,} firm-years, {len(summary):,} tickers")
+    print(f"  trajectory_features: {t1 - t0:7.2f} s  ({len(features) / (t1 - t0) / 1e6:5.2f} M rows/s)")
+    print(f"  risk_trajectories:   {t2 - t1:7.2f} s  ({len(features) / (t2 - t1) / 1e6:5.2f} M rows/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""Scale-out scoring: throughput, speedup and efficiency per worker count on a synthetic store.
+
+    python benchmarks/bench_universe.py [--rows 2000000] [--workers 1 2 4 8] [--backend dask]
+
+The panel is ingested into a Parquet store under .cache/bench once per size.
+Without trained artifacts only the legacy industries (Healthcare, Tech) are
+scored; point --models-dir at a trained registry to score all of them.
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bankruptcy.ingest import ingest_csv  # noqa: E402
+from bankruptcy.universe import BACKENDS, scaling_sweep  # noqa: E402
+from suite import DATA_DIR, compustat_panel, panel_csv  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, os.cpu_count()])
+    parser.add_argument('--backend', default='process', choices=sorted(BACKENDS))
+    parser.add_argument('--models-dir', default=os.path.join(REPO_ROOT, 'models'))
+    args = parser.parse_args()
+
+    store = os.path.join(DATA_DIR, f'store_{args.rows}')
+    if not os.path.isdir(store):
+        ingest_csv(panel_csv(args.rows, compustat_panel(args.rows)), store)
+
+    with tempfile.TemporaryDirectory() as out:
+        results = scaling_sweep(store, out, sorted(set(args.workers)), args.models_dir, backend=args.backend)
+    first = results[0]
+    print(f"{first['rows']:,} rows in {first['partitions']} (industry, fyear) partitions, backend {args.backend}")
+    print(f"{'workers':>8}{'seconds':>10}{'rows/s':>14}{'speedup':>9}{'efficiency':>12}")
+    for r in results:
+        print(f"{r['workers']:>8}{r['seconds']:>10.2f}{r['rows_per_second']:>14,.0f}"
+              f"{r['speedup']:>9.2f}{r['efficiency']:>12.0%}")
+
+
+if __name__ == '__main__':
+    main()
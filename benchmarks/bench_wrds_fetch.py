@@ -0,0 +1,77 @@
+"""Per-ticker WRDS loop (as in the notebook) versus batched, pooled fetching.
+
+Runs against a synthetic SQLite stand-in for ``comp.funda``:
+
+    python benchmarks/bench_wrds_fetch.py [--tickers 2000] [--years 30]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bankruptcy.wrds_fetch import FUNDA_FILTERS, FUNDA_VARIABLES, fetch_funda, write_standin  # noqa: E402
+
+
+def synthetic_funda(n_tickers, n_years, seed=0):
+    rng = np.random.default_rng(seed)
+    n = n_tickers * n_years
+    frame = pd.DataFrame({
+        'tic': np.repeat([f'T{i:05d}' for i in range(n_tickers)], n_years),
+        'fyear': np.tile(np.arange(2024 - n_years + 1, 2025), n_tickers),
+        'datadate': '2024-12-31',
+        **{c: rng.normal(100, 50, n) for c in FUNDA_VARIABLES[3:]},
+        'indfmt': 'INDL', 'datafmt': 'STD', 'popsrc': 'D', 'consol': 'C',
+    })
+    return frame
+
+
+def notebook_loop(bankrupt_companies, source):
+    conn = source.connect()
+    all_data = pd.DataFrame()
+    for _, row in bankrupt_companies.iterrows():
+        query = f"""
+            SELECT {', '.join(FUNDA_VARIABLES)}
+            FROM comp.funda
+            WHERE tic = '{row['tic']}'
+            AND {FUNDA_FILTERS}
+        """
+        df = pd.read_sql_query(query, conn)
+        df['industry'] = row['industry']
+        all_data = pd.concat([all_data, df], ignore_index=True)
+    conn.close()
+    return all_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tickers', type=int, default=2000)
+    parser.add_argument('--years', type=int, default=30)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = write_standin(synthetic_funda(args.tickers, args.years), os.path.join(tmp, 'funda.db'))
+        bankrupt_companies = pd.DataFrame({
+            'tic': [f'T{i:05d}' for i in range(0, args.tickers, 2)],
+            'industry': 'Healthcare',
+        })
+
+        t0 = time.perf_counter()
+        looped = notebook_loop(bankrupt_companies, source)
+        t1 = time.perf_counter()
+        bulk = fetch_funda(bankrupt_companies, source)
+        t2 = time.perf_counter()
+
+    assert len(looped) == len(bulk), (len(looped), len(bulk))
+    print(f"{len(bankrupt_companies):,} tickers, {len(bulk):,} rows")
+    print(f"  per-ticker loop: {t1 - t0:8.2f} s")
+    print(f"  batched + pool:  {t2 - t1:8.2f} s   ({(t1 - t0) / (t2 - t1):.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""Simulated analyst sessions against app.py, reporting p50/p99 rerun latency.
+
+Each session is a ``streamlit.testing`` AppTest that edits inputs and clicks
+Predict repeatedly; analysts share a small pool of companies, so many reruns
+repeat an earlier query. Sessions run on separate threads and share the
+process-wide Streamlit caches, as sessions on one server do. AppTest's runtime
+is not thread-safe, so the reruns themselves are serialized and each latency is
+the time one rerun takes to execute.
+
+The "before" pass clears Streamlit's resource and data caches ahead of every
+rerun, which reproduces the uncached app: pickles reloaded and the company
+rescored on each interaction.
+
+    python benchmarks/load_app.py [--sessions 8] [--reruns 20]
+"""
+import argparse
+import logging
+import os
+import statistics
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app.py')
+
+_run_lock = threading.Lock()
+
+
+def _timed_run(app, clear_caches=False):
+    import streamlit as st
+
+    with _run_lock:
+        if clear_caches:
+            st.cache_resource.clear()
+            st.cache_data.clear()
+        t0 = time.perf_counter()
+        app.run()
+        elapsed = time.perf_counter() - t0
+    if app.exception:
+        raise RuntimeError(app.exception[0].message)
+    return elapsed
+
+
+def run_session(seed, reruns, clear_caches, companies):
+    from streamlit.testing.v1 import AppTest
+
+    rng = np.random.default_rng(seed)
+    app = AppTest.from_file(APP_PATH, default_timeout=120)
+    _timed_run(app)
+    latencies = []
+    for _ in range(reruns):
+        total_assets, ebit = companies[rng.integers(len(companies))]
+        inputs = {w.label: w for w in app.number_input}
+        inputs["Total Assets"].set_value(float(total_assets))
+        inputs["EBIT (Earnings Before Interest & Tax)"].set_value(float(ebit))
+        app.button[0].click()
+        latencies.append(_timed_run(app, clear_caches))
+    return latencies
+
+
+def run(sessions, reruns, clear_caches, n_companies=10):
+    companies = np.random.default_rng(0).uniform(1, 1000, size=(n_companies, 2))
+    with ThreadPoolExecutor(max_workers=sessions) as executor:
+        results = executor.map(
+            run_session, range(sessions), [reruns] * sessions, [clear_caches] * sessions, [companies] * sessions
+        )
+        latencies = sorted(t for session in results for t in session)
+    return {
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p99_ms': latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))] * 1000,
+        'reruns': len(latencies),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=8)
+    parser.add_argument('--reruns', type=int, default=20)
+    args = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    logging.disable(logging.WARNING)
+    for name, clear_caches in [('before (no cache)', True), ('after (cached)', False)]:
+        r = run(args.sessions, args.reruns, clear_caches)
+        print(f"{name:>18}: p50 {r['p50_ms']:8.1f} ms   p99 {r['p99_ms']:8.1f} ms   ({r['reruns']} reruns)")
+
+
+if __name__ == '__main__':
+    main()
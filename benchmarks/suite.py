@@ -0,0 +1,351 @@
+"""Benchmark suite over synthetic Compustat-shaped panels, compared against stored baselines.
+
+    python benchmarks/suite.py                         # 10k and 1M rows, compare to baseline.json
+    python benchmarks/suite.py --sizes 10k,1m,10m --case ratios --case lda_fit
+    python benchmarks/suite.py --save-baseline         # record this machine's timings
+    python benchmarks/suite.py --case risk_buckets --save-baseline   # add one case
+
+Each case reports the median of ``--repeat`` runs. A case regresses when it is
+both ``--tolerance`` (relative) and ``--min-delta`` seconds slower than its
+baseline; any regression makes the run exit with status 1. Baselines are
+machine-specific, so re-record them with ``--save-baseline`` on new hardware.
+
+Only timings live here: they depend on the machine, so they are kept out of
+the pytest run under ``tests/``, which checks correctness (e.g. that the
+folded scorer the ``*_folded`` cases time matches sklearn's predict_proba).
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from bankruptcy.drift import DriftMonitor, channel_edges  # noqa: E402
+from bankruptcy.features import compute_ratios, filter_post_bankruptcy  # noqa: E402
+from bankruptcy.industries import SIC_TO_INDUSTRY  # noqa: E402
+from bankruptcy.ingest import COLUMNS_TO_KEEP, READ_DTYPES, clean_chunk  # noqa: E402
+from bankruptcy.matching import match_row_counts  # noqa: E402
+from bankruptcy.model import load_model  # noqa: E402
+from bankruptcy.peers import PeerIndex  # noqa: E402
+from bankruptcy.quality import QualityGate  # noqa: E402
+from bankruptcy.risk import LEGACY_BUCKETS  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DATA_DIR = os.path.join(REPO_ROOT, '.cache', 'bench')
+SIZES = {'10k': 10_000, '1m': 1_000_000, '10m': 10_000_000}
+SINGLE_ROWS = 1000  # rows scored one call at a time in the single-row cases
+
+
+def compustat_panel(n_rows, seed=0):
+    """Funda-shaped frame: ~20 filings per ticker, mapped and unmapped SICs, a few gaps and zero assets."""
+    rng = np.random.default_rng(seed)
+    n_tickers = max(n_rows // 20, 1)
+    tic_codes = rng.integers(0, n_tickers, n_rows)
+    sics = np.array(sorted(SIC_TO_INDUSTRY) + [100, 4911, 6500], dtype=float)
+    frame = pd.DataFrame({
+        # columns of the raw extract that COLUMNS_TO_KEEP drops
+        'gvkey': tic_codes + 1000,
+        'datadate': '20201231',
+        'conm': 'COMPANY',
+        'indfmt': 'INDL', 'consol': 'C', 'popsrc': 'D', 'datafmt': 'STD', 'curcd': 'USD', 'costat': 'A',
+        'tic': pd.Categorical.from_codes(tic_codes, [f'T{i:07d}' for i in range(n_tickers)]),
+        'fyear': rng.integers(1990, 2025, n_rows).astype(float),
+        'act': rng.lognormal(4, 1, n_rows), 'lct': rng.lognormal(4, 1, n_rows),
+        'at': rng.lognormal(5, 1, n_rows), 'seq': rng.normal(50, 100, n_rows),
+        'ebit': rng.normal(10, 30, n_rows), 'sale': rng.lognormal(5, 1, n_rows),
+        'lt': rng.lognormal(4.5, 1, n_rows), 'prcc_f': rng.lognormal(3, 1, n_rows),
+        'csho': rng.lognormal(3, 1, n_rows),
+        'sic': sics[(tic_codes * 7919) % len(sics)],
+    })
+    frame.loc[rng.random(n_rows) < 0.01, 'at'] = 0.0
+    frame.loc[rng.random(n_rows) < 0.02, 'ebit'] = np.nan
+    return frame
+
+
+def panel_csv(n_rows, frame):
+    """Write (once) and return the CSV extract for ``n_rows``."""
+    os.makedirs(DATA_DIR, exist_ok=True)
+    path = os.path.join(DATA_DIR, f'compustat_{n_rows}.csv')
+    if not os.path.isfile(path):
+        frame.to_csv(path + '.tmp', index=False)
+        os.replace(path + '.tmp', path)
+    return path
+
+
+class Data:
+    """Inputs shared by all cases at one size, built lazily."""
+
+    def __init__(self, n_rows):
+        self.n_rows = n_rows
+        self.frame = compustat_panel(n_rows)
+        self._cache = {}
+
+    def get(self, name, build):
+        if name not in self._cache:
+            self._cache[name] = build()
+        return self._cache[name]
+
+    @property
+    def csv(self):
+        return self.get('csv', lambda: panel_csv(self.n_rows, self.frame))
+
+    @property
+    def X(self):
+        return self.get('X', lambda: compute_ratios(self.frame))
+
+    @property
+    def labelled(self):
+        def build():
+            X = self.X
+            finite = np.isfinite(X).all(axis=1)
+            y = (self.frame['tic'].cat.codes.to_numpy() % 2)[finite]
+            return X[finite], y
+        return self.get('labelled', build)
+
+    @property
+    def last_fyear(self):
+        def build():
+            tickers = self.frame['tic'].cat.categories
+            rng = np.random.default_rng(1)
+            return pd.DataFrame({'tic': tickers, 'last_fyear': rng.integers(1995, 2025, len(tickers))})
+        return self.get('last_fyear', build)
+
+    @property
+    def sides(self):
+        def build():
+            odd = (self.frame['tic'].cat.codes % 2).astype(bool)
+            tic = self.frame['tic'].astype(str)
+            return pd.DataFrame({'tic': tic[odd]}), pd.DataFrame({'tic': tic[~odd]})
+        return self.get('sides', build)
+
+    @property
+    def model(self):
+        def build():
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')  # pickles predate the installed sklearn
+                return load_model()
+        return self.get('model', build)
+
+
+def case_ingest_csv(data):
+    path = data.csv
+
+    def run():
+        reader = pd.read_csv(path, usecols=COLUMNS_TO_KEEP, dtype=READ_DTYPES, chunksize=500_000)
+        return pd.concat([clean_chunk(chunk) for chunk in reader], ignore_index=True)
+    return run
+
+
+def case_sic_map(data):
+    sic = data.frame['sic']
+    return lambda: sic.map(SIC_TO_INDUSTRY)
+
+
+def case_ratios(data):
+    frame = data.frame
+    return lambda: compute_ratios(frame)
+
+
+def case_last_fyear_filter(data):
+    frame, last_fyear = data.frame, data.last_fyear
+    return lambda: filter_post_bankruptcy(frame, last_fyear)
+
+
+def case_balancing(data):
+    bankrupt, non_bankrupt = data.sides
+    return lambda: match_row_counts(bankrupt, non_bankrupt)
+
+
+def case_lda_fit(data):
+    from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
+    from sklearn.preprocessing import StandardScaler
+
+    X, y = data.labelled
+    return lambda: LinearDiscriminantAnalysis().fit(StandardScaler().fit_transform(X), y)
+
+
+def case_predict_single_sklearn(data):
+    model, X = data.model, data.labelled[0][:SINGLE_ROWS]
+
+    def run():
+        for i in range(len(X)):
+            model.sklearn_predict_proba(X[i:i + 1])
+    return run
+
+
+def case_predict_single_folded(data):
+    folded, rows = data.model.folded, data.labelled[0][:SINGLE_ROWS].tolist()
+
+    def run():
+        for row in rows:
+            folded.score_one(*row)
+    return run
+
+
+def case_predict_batch_sklearn(data):
+    model, X = data.model, data.labelled[0]
+    return lambda: model.sklearn_predict_proba(X)
+
+
+def case_predict_batch_folded(data):
+    model, X = data.model, data.labelled[0]
+    return lambda: model.predict_proba(X)
+
+
+def case_risk_buckets(data):
+    probs = data.get('probs', lambda: np.random.default_rng(2).uniform(0.45, 0.55, data.n_rows))
+    return lambda: LEGACY_BUCKETS.bucket(probs)
+
+
+def case_quality_gate(data):
+    gate, X, frame = QualityGate.for_model(data.model), data.X, data.frame
+    return lambda: gate.check(X, frame)
+
+
+def case_drift_update(data):
+    gate, X = QualityGate.for_model(data.model), data.X
+    probs = data.get('probs', lambda: np.random.default_rng(2).uniform(0.45, 0.55, data.n_rows))
+    monitor = DriftMonitor('Tech', 'bench', channel_edges(gate.mean, gate.scale))
+    return lambda: monitor.update(X, probs)
+
+
+def scored_universe(data):
+    def build():
+        frame = data.frame
+        industry = frame['sic'].map(SIC_TO_INDUSTRY)
+        probs = np.random.default_rng(3).uniform(0, 1, data.n_rows)
+        return pd.DataFrame({'tic': frame['tic'], 'industry': industry, 'fyear': frame['fyear'],
+                             'ML_Probability': probs})
+    return data.get('scored_universe', build)
+
+
+def case_peer_index_build(data):
+    scored = scored_universe(data)
+    return lambda: PeerIndex.from_frame(scored)
+
+
+def case_peer_rank(data):
+    index = data.get('peer_index', lambda: PeerIndex.from_frame(scored_universe(data)))
+    queries = np.random.default_rng(4).uniform(0, 1, SINGLE_ROWS).tolist()
+
+    def run():
+        for prob in queries:
+            index.rank('Tech', 2010, prob)
+    return run
+
+
+def case_peer_rank_exclude(data):
+    index = data.get('peer_index', lambda: PeerIndex.from_frame(scored_universe(data)))
+    _, tickers = index.peers('Tech', 2010)
+    rng = np.random.default_rng(4)
+    queries = list(zip(rng.uniform(0, 1, SINGLE_ROWS).tolist(), rng.choice(tickers, SINGLE_ROWS).tolist()))
+
+    def run():
+        for prob, tic in queries:
+            index.rank('Tech', 2010, prob, exclude=tic)
+    return run
+
+
+CASES = {
+    'ingest_csv': case_ingest_csv,
+    'sic_map': case_sic_map,
+    'ratios': case_ratios,
+    'last_fyear_filter': case_last_fyear_filter,
+    'balancing': case_balancing,
+    'lda_fit': case_lda_fit,
+    'predict_single_sklearn': case_predict_single_sklearn,
+    'predict_single_folded': case_predict_single_folded,
+    'predict_batch_sklearn': case_predict_batch_sklearn,
+    'predict_batch_folded': case_predict_batch_folded,
+    'risk_buckets': case_risk_buckets,
+    'quality_gate': case_quality_gate,
+    'peer_index_build': case_peer_index_build,
+    'peer_rank': case_peer_rank,
+    'peer_rank_exclude': case_peer_rank_exclude,
+    'drift_update': case_drift_update,
+}
+
+
+def measure(run, repeat):
+    run()  # warm-up
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times)
+
+
+def load_baseline(path):
+    if not os.path.isfile(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)['results']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='10k,1m', help="comma-separated from: " + ", ".join(SIZES))
+    parser.add_argument('--case', action='append', choices=sorted(CASES), help="repeatable; default: all")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true', help="merge these timings into --baseline")
+    parser.add_argument('--tolerance', type=float, default=0.30, help="allowed relative slowdown")
+    parser.add_argument('--min-delta', type=float, default=0.005, help="ignore slowdowns below this many seconds")
+    args = parser.parse_args(argv)
+
+    sizes = [s.strip().lower() for s in args.sizes.split(',')]
+    unknown = [s for s in sizes if s not in SIZES]
+    if unknown:
+        parser.error(f"unknown sizes {unknown}; choose from {list(SIZES)}")
+    cases = args.case or list(CASES)
+    baseline = load_baseline(args.baseline)
+
+    results, regressions = {}, []
+    print(f"{'case':<24}{'size':>6}{'median s':>12}{'baseline s':>12}{'change':>9}")
+    for size in sizes:
+        data = Data(SIZES[size])
+        for name in cases:
+            key = f'{name}@{size}'
+            seconds = measure(CASES[name](data), args.repeat)
+            results[key] = seconds
+            base = baseline.get(key)
+            status, change = '', ''
+            if base is not None:
+                change = f'{seconds / base - 1:+.0%}'
+                if seconds > base * (1 + args.tolerance) and seconds - base > args.min_delta:
+                    status = '  REGRESSION'
+                    regressions.append(key)
+            print(f"{name:<24}{size:>6}{seconds:>12.4f}{'' if base is None else f'{base:.4f}':>12}{change:>9}{status}",
+                  flush=True)
+
+    if args.save_baseline:
+        merged = {**baseline, **results}
+        payload = {'machine': f'{platform.machine()} / {platform.processor() or platform.system()}',
+                   'python': platform.python_version(), 'numpy': np.__version__, 'pandas': pd.__version__,
+                   'results': dict(sorted(merged.items()))}
+        with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(os.path.abspath(args.baseline)),
+                                         delete=False, suffix='.tmp') as f:
+            json.dump(payload, f, indent=2)
+            f.write('\n')
+        os.replace(f.name, args.baseline)
+        print(f"saved {len(results)} timings to {args.baseline}")
+        return 0
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,66 @@
+import numpy as np
+
+from bankruptcy.drift import (
+    CHANNELS, DriftBaseline, DriftMonitor, channel_edges, histograms, ks, psi
+)
+
+
+def test_psi_and_ks_known_values():
+    expected = np.array([[50, 50], [10, 30]])
+    actual = np.array([[25, 75], [10, 30]])
+    np.testing.assert_allclose(psi(expected, actual), [0.25 * np.log(3), 0.0])
+    np.testing.assert_allclose(ks(expected, actual), [0.25, 0.0])
+    # Empty bins are floored, so PSI stays finite
+    assert np.isfinite(psi(np.array([[100, 0]]), np.array([[0, 100]]))).all()
+
+
+def test_histograms_match_searchsorted():
+    rng = np.random.default_rng(0)
+    edges = channel_edges(rng.normal(size=5), rng.uniform(0.5, 2, size=5))
+    X = rng.normal(0, 3, size=(1000, 5))
+    X[:20, 0] = np.nan
+    X[20:30, 1] = np.inf
+    X[30:40, 2] = -np.inf
+    prob = rng.uniform(size=1000)
+    counts = histograms(edges, X, prob)
+
+    columns = np.column_stack([X, prob])
+    bins = edges.shape[1] + 1
+    for i in range(len(CHANNELS)):
+        values = columns[:, i][~np.isnan(columns[:, i])]
+        expected = np.bincount(np.searchsorted(edges[i], values, side='right'), minlength=bins)
+        np.testing.assert_array_equal(counts[i], expected)
+    assert counts[0].sum() == 980 and counts[1, -1] >= 10 and counts[2, 0] >= 10
+
+
+def test_baseline_round_trip(tmp_path):
+    rng = np.random.default_rng(1)
+    edges = channel_edges(np.zeros(5), np.ones(5))
+    baseline = DriftBaseline(edges, histograms(edges, rng.normal(size=(300, 5)), rng.uniform(size=300)))
+    loaded = DriftBaseline.load(baseline.save(str(tmp_path / 'drift.npz')))
+    np.testing.assert_array_equal(loaded.edges, baseline.edges)
+    np.testing.assert_array_equal(loaded.counts, baseline.counts)
+    assert loaded.rows == 300
+
+
+def test_monitor_statuses():
+    rng = np.random.default_rng(2)
+    edges = channel_edges(np.zeros(5), np.ones(5))
+    baseline = DriftBaseline(edges, histograms(edges, rng.normal(size=(5000, 5)), rng.uniform(size=5000)))
+    assert DriftMonitor('Tech', 'v1', edges).report()['status'] == 'no_baseline'
+
+    monitor = DriftMonitor('Tech', 'v1', edges, baseline)
+    monitor.update(rng.normal(size=(100, 5)), rng.uniform(size=100))
+    assert monitor.report()['status'] == 'insufficient'
+    monitor.update(rng.normal(size=(4900, 5)), rng.uniform(size=4900))
+    report = monitor.report()
+    assert report['status'] == 'ok' and report['rows'] == 5000 and not report['alerts']
+
+    shifted = DriftMonitor('Tech', 'v1', edges, baseline)
+    X = rng.normal(size=(1000, 5))
+    X[:, 3] += 1.5
+    shifted.update(X, rng.uniform(size=1000))
+    report = shifted.report()
+    assert report['status'] == 'alert' and report['channels']['X4']['status'] == 'alert'
+    assert report['channels']['X1']['status'] == 'ok'
+    assert len(report['alerts']) == 1 and report['alerts'][0].startswith('Tech@v1 X4:')
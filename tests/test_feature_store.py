@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+from bankruptcy.feature_store import score_store, write_feature_store
+from bankruptcy.features import FEATURES
+from bankruptcy.registry import ModelRegistry
+
+
+def test_score_store_matches_bundle_models(tmp_path):
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(rng.normal([0.1, 0.2, 0.05, 1.5, 1.0], 0.2, size=(60, 5)), columns=FEATURES)
+    frame['tic'] = [f'T{i % 20}' for i in range(60)]
+    frame['fyear'] = 2018 + np.arange(60) // 20
+    frame['industry'] = ['Healthcare', 'Tech', 'Chemicals'] * 20
+    frame.loc[0, 'X1'] = np.nan
+    store = write_feature_store(frame, tmp_path / 'features')
+
+    registry = ModelRegistry()
+    quality = {}
+    probs = score_store(store, registry, quality=quality)
+    assert probs.dtype == np.float32 and len(probs) == 60
+    assert quality['rows'] == 40 and quality['imputed'] == 1
+
+    industries = np.asarray(store.industries)[store.industry]
+    for industry in ('Healthcare', 'Tech'):
+        rows = industries == industry
+        bundle = registry.get(industry)
+        expected = bundle.model.predict_proba(bundle.quality.check(store.X[rows]).X)
+        np.testing.assert_allclose(probs[rows], expected, rtol=1e-6)
+    # No legacy model for Chemicals
+    assert np.isnan(probs[industries == 'Chemicals']).all()
+
+
+def test_select_years_missing_from_the_store(tmp_path):
+    frame = pd.DataFrame(np.arange(40, dtype=float).reshape(8, 5), columns=FEATURES)
+    frame['tic'] = ['A', 'B'] * 4
+    frame['industry'] = ['Healthcare'] * 2 + ['Tech'] * 6
+    frame['fyear'] = [2000, 2000, 2001, 2001, 2002, 2002, 2004, 2004]
+    store = write_feature_store(frame, tmp_path / 'features')
+
+    def years(industry, wanted):
+        return sorted(store.select(industry, wanted)['fyear'].tolist())
+
+    # First requested year not stored for Tech (2000 is Healthcare only)
+    assert years('Tech', [2000, 2001, 2002]) == [2001, 2001, 2002, 2002]
+    # Last requested year not stored
+    assert years('Tech', [2001, 2002, 2003]) == [2001, 2001, 2002, 2002]
+    # A gap inside the range is not filled in
+    assert years('Tech', [2001, 2004]) == [2001, 2001, 2004, 2004]
+    assert years('Tech', [1999, 2003]) == []
+    assert set(store.select('Tech', [2000, 2001])['industry']) == {store.industry_code('Tech')}
+    assert years('Tech', None) == [2001, 2001, 2002, 2002, 2004, 2004]
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
+from sklearn.preprocessing import StandardScaler
+
+from bankruptcy.artifact import ModelArtifact
+from bankruptcy.features import FEATURES
+from bankruptcy.folded import FoldedLDA, check_parity
+
+
+@pytest.fixture(scope='module')
+def fitted():
+    rng = np.random.default_rng(0)
+    X = rng.normal(loc=[0.1, 0.2, 0.05, 1.5, 1.0], scale=[0.3, 0.5, 0.1, 2.0, 0.8], size=(400, 5))
+    y = (X @ [1.0, 0.5, 3.0, 0.2, -0.4] + rng.normal(size=400) > 0.6).astype(int)
+    frame = pd.DataFrame(X, columns=FEATURES)
+    scaler = StandardScaler().fit(frame)
+    model = LinearDiscriminantAnalysis().fit(scaler.transform(frame), y)
+    X_test = rng.normal(loc=scaler.mean_, scale=3 * scaler.scale_, size=(1000, 5))
+    expected = model.predict_proba(scaler.transform(pd.DataFrame(X_test, columns=FEATURES)))[:, 1]
+    return model, scaler, X_test, expected
+
+
+def test_folded_matches_sklearn(fitted):
+    model, scaler, X, expected = fitted
+    folded = FoldedLDA.from_sklearn(model, scaler)
+    np.testing.assert_allclose(folded.predict_proba(X), expected, rtol=0, atol=1e-12)
+    assert check_parity(folded, model, scaler, X, atol=1e-12) <= 1e-12
+    single = [folded.score_one(*row) for row in X[:50]]
+    np.testing.assert_allclose(single, expected[:50], rtol=0, atol=1e-12)
+
+
+def test_round_trips_keep_parity(fitted, tmp_path):
+    model, scaler, X, expected = fitted
+    artifact = ModelArtifact.from_sklearn(model, scaler)
+    loaded = ModelArtifact.load(artifact.save(tmp_path / 'model.json'))
+    np.testing.assert_array_equal(loaded.folded.coef, artifact.folded.coef)
+    assert loaded.folded.intercept == artifact.folded.intercept
+    np.testing.assert_allclose(loaded.predict_proba(X), expected, rtol=0, atol=1e-12)
+
+    path = tmp_path / 'folded.npz'
+    artifact.folded.save(path)
+    np.testing.assert_allclose(FoldedLDA.load(path).predict_proba(X), expected, rtol=0, atol=1e-12)
+
+
+def test_parity_failure_raises(fitted):
+    model, scaler, X, _ = fitted
+    folded = FoldedLDA.from_sklearn(model, scaler)
+    off = FoldedLDA(folded.coef, folded.intercept + 1e-3)
+    with pytest.raises(ValueError):
+        check_parity(off, model, scaler, X, atol=1e-12)
@@ -0,0 +1,28 @@
+import pandas as pd
+import pytest
+
+from bankruptcy.ingest import COLUMNS_TO_KEEP, ingest_csv, read_store
+
+pytest.importorskip('pyarrow')
+
+
+def write_funda(path, tickers):
+    rows = [{'tic': tic, 'fyear': 2020, 'act': 50, 'lct': 30, 'at': 100, 'seq': 20, 'ebit': 8, 'sale': 120,
+             'lt': 60, 'prcc_f': 12, 'csho': 5, 'sic': 8011} for tic in tickers]
+    pd.DataFrame(rows, columns=COLUMNS_TO_KEEP).to_csv(path, index=False)
+
+
+def test_chunks_with_different_ticker_counts_read_back(tmp_path):
+    # A one-ticker chunk and a 300-ticker chunk in the same partition
+    source = tmp_path / 'funda.csv'
+    write_funda(source, ['A'] * 300 + [f'T{i}' for i in range(300)])
+    store = tmp_path / 'store'
+    summary = ingest_csv(source, store, chunk_size=300)
+    assert summary['rows_written'] == 600
+
+    frame = read_store(store)
+    assert len(frame) == 600 and frame['tic'].nunique() == 301
+    files = sorted(store.rglob('*.parquet'))
+    assert len(files) > 1
+    for paths in (files, files[::-1]):
+        assert len(pd.read_parquet(paths)) == 600
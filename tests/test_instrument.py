@@ -0,0 +1,52 @@
+import numpy as np
+
+from bankruptcy import drift, instrument
+from bankruptcy.registry import ModelRegistry
+
+
+def test_disabled_records_nothing():
+    instrument.reset()
+    instrument.count('rows', 5)
+    with instrument.stage('load'):
+        pass
+    drift.observe(ModelRegistry().get('Tech'), np.zeros((3, 5)), np.zeros(3))
+    snap = instrument.snapshot()
+    assert not snap['enabled'] and not snap['stages'] and not snap['counters'] and not snap['drift']
+
+
+def test_merge_and_prometheus():
+    rng = np.random.default_rng(0)
+    bundle = ModelRegistry().get('Tech')
+    edges = drift.channel_edges(bundle.quality.mean, bundle.quality.scale)
+    bundle.drift = drift.DriftBaseline(edges, drift.histograms(edges, rng.normal(size=(100, 5)), rng.uniform(size=100)))
+    instrument.enable()
+    try:
+        instrument.reset()
+        instrument.count('rows', 5)
+        with instrument.stage('load'):
+            pass
+        drift.observe(bundle, rng.normal(size=(10, 5)), rng.uniform(size=10))
+        # What a worker process would send back
+        worker = instrument.snapshot()
+
+        instrument.reset()
+        instrument.count('rows', 2)
+        instrument.merge(worker)
+        instrument.merge(worker)
+        snap = instrument.snapshot()
+        assert snap['counters'] == {'rows': 12}
+        assert snap['stages']['load']['calls'] == 2
+        assert snap['drift']['Tech@legacy']['rows'] == 20
+
+        text = instrument.to_prometheus()
+        lines = text.splitlines()
+        assert '# TYPE bankruptcy_rows_total counter' in lines and 'bankruptcy_rows_total 12' in lines
+        assert 'bankruptcy_stage_calls_total{stage="load"} 2' in lines
+        assert 'bankruptcy_drift_rows{industry="Tech",version="legacy"} 20' in lines
+        for metric in ('psi', 'ks', 'status'):
+            assert f'# TYPE bankruptcy_drift_{metric} gauge' in lines
+        # 20 rows are too few for a verdict
+        assert 'bankruptcy_drift_status{industry="Tech",version="legacy",channel="X1"} -1' in lines
+    finally:
+        instrument.reset()
+        instrument.enable(False)
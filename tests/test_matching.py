@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from bankruptcy.matching import match_pairs, match_row_counts
+from benchmarks.bench_matching import notebook_matching, synthetic_side
+
+
+@pytest.fixture(scope='module')
+def sides():
+    rng = np.random.default_rng(0)
+    return synthetic_side(200, 'B', rng), synthetic_side(2000, 'N', rng)
+
+
+@pytest.mark.parametrize('shuffle', [False, True])
+def test_matches_notebook(sides, shuffle):
+    bankrupt, non_bankrupt = sides
+    if shuffle:
+        bankrupt = bankrupt.sample(frac=1, random_state=1)
+        non_bankrupt = non_bankrupt.sample(frac=1, random_state=2)
+    pd.testing.assert_frame_equal(match_row_counts(bankrupt, non_bankrupt), notebook_matching(bankrupt, non_bankrupt))
+
+
+@pytest.mark.parametrize('seed', [None, 42])
+def test_pairs_have_equal_row_counts(sides, seed):
+    bankrupt, non_bankrupt = sides
+    pairs = match_pairs(bankrupt, non_bankrupt, seed=seed)
+    b_counts, n_counts = bankrupt['tic'].value_counts(), non_bankrupt['tic'].value_counts()
+    assert (b_counts[pairs['tic_bankrupt']].to_numpy() == pairs['rows'].to_numpy()).all()
+    assert (n_counts[pairs['tic_non_bankrupt']].to_numpy() == pairs['rows'].to_numpy()).all()
+    assert pairs['tic_bankrupt'].is_unique and pairs['tic_non_bankrupt'].is_unique
+    # min(n_bankrupt, n_non_bankrupt) companies per row count
+    expected = pd.concat([b_counts.value_counts(), n_counts.value_counts()], axis=1).min(axis=1).dropna()
+    assert pairs['rows'].value_counts().sort_index().to_dict() == expected[expected > 0].astype(int).to_dict()
+
+
+def test_seeded_draw_is_reproducible(sides):
+    bankrupt, non_bankrupt = sides
+    first = match_pairs(bankrupt, non_bankrupt, seed=7)
+    pd.testing.assert_frame_equal(first, match_pairs(bankrupt, non_bankrupt, seed=7))
+    assert not first.equals(match_pairs(bankrupt, non_bankrupt, seed=None))
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from bankruptcy.peers import PeerIndex
+
+SCORED = pd.DataFrame({
+    'tic': ['A', 'B', 'C', 'D', 'E', 'F'],
+    'industry': ['Tech'] * 5 + ['Healthcare'],
+    'fyear': [2020] * 6,
+    'ML_Probability': [0.1, 0.2, 0.3, 0.4, 0.5, 0.6],
+    'Model_Version': ['v2'] * 5 + ['v1'],
+})
+
+
+def test_exclude_drops_the_company_from_percentile_and_count():
+    index = PeerIndex.from_frame(SCORED)
+    everyone = index.rank('Tech', 2020, 0.3)
+    assert everyone['peers'] == 5 and everyone['percentile'] == pytest.approx(50.0)
+
+    rank = index.rank('Tech', 2020, 0.3, nearest=2, exclude='C')
+    assert rank['peers'] == 4
+    # Two of the four other peers are below 0.3
+    assert rank['percentile'] == pytest.approx(50.0)
+    assert [p['tic'] for p in rank['nearest']] == ['B', 'D']
+
+    rank = index.rank('Tech', 2020, 0.45, exclude='E')
+    assert rank['peers'] == 4 and rank['percentile'] == pytest.approx(100.0)
+    assert index.rank('Healthcare', 2020, 0.6, exclude='F') is None
+
+
+def test_versions_round_trip(tmp_path):
+    index = PeerIndex.from_frame(SCORED)
+    assert index.versions == {'Tech': 'v2', 'Healthcare': 'v1'}
+    loaded = PeerIndex.load(index.save(str(tmp_path / 'peers.npz')))
+    assert loaded.versions == index.versions
+    np.testing.assert_array_equal(loaded.prob, index.prob)
+    assert loaded.rank('Tech', 2020, 0.3, exclude='C') == index.rank('Tech', 2020, 0.3, exclude='C')
+
+
+def test_mixed_versions_are_rejected():
+    with pytest.raises(ValueError):
+        PeerIndex.from_frame(SCORED.assign(Model_Version=['v1'] + ['v2'] * 5))
+
+
+def test_excluded_rows_found_without_scanning_the_group(tmp_path):
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({'tic': rng.choice([f'T{i}' for i in range(40)], 300), 'industry': 'Tech',
+                          'fyear': rng.choice([2019, 2020], 300), 'ML_Probability': rng.uniform(size=300)})
+    index = PeerIndex.from_frame(frame)
+    loaded = PeerIndex.load(index.save(str(tmp_path / 'peers.npz')))
+    np.testing.assert_array_equal(loaded.tic_rows, index.tic_rows)
+    for (industry, year), (start, stop) in index.groups.items():
+        for tic in ['T0', 'T7', 'T39', 'missing']:
+            group = index.tickers[index.tic[start:stop]]
+            expected = start + np.flatnonzero(group == tic)
+            np.testing.assert_array_equal(np.sort(loaded._ticker_rows(tic, start, stop)), expected)
+            rank = loaded.rank(industry, year, 0.5, exclude=tic)
+            assert rank['peers'] == stop - start - len(expected)
+            assert tic not in [p['tic'] for p in rank['nearest']]
@@ -0,0 +1,29 @@
+from bankruptcy.registry import ModelRegistry
+
+
+def test_lru_counters(tmp_path):
+    # An empty root leaves only the legacy Healthcare and Tech bundles
+    registry = ModelRegistry(str(tmp_path), maxsize=1)
+    tech = registry.get('Tech')
+    assert registry.get('Tech') is tech
+    assert registry.stats()['hits'] == 1 and registry.stats()['misses'] == 1
+
+    registry.get('Healthcare')
+    stats = registry.stats()
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (1, 2, 1)
+    assert stats['size'] == 1 and stats['cached'] == ['Healthcare@legacy']
+
+    # Tech was evicted, so it is loaded again as a new bundle
+    assert registry.get('Tech') is not tech
+    stats = registry.stats()
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (1, 3, 2)
+
+
+def test_get_refreshes_recency(tmp_path):
+    registry = ModelRegistry(str(tmp_path), maxsize=2)
+    registry.get('Tech')
+    registry.get('Healthcare')
+    registry.get('Tech')
+    assert registry.stats()['cached'] == ['Healthcare@legacy', 'Tech@legacy']
+    registry.clear()
+    assert registry.stats()['size'] == 0 and registry.stats()['evictions'] == 0
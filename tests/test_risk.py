@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from bankruptcy.risk import LEGACY_BUCKETS, NOT_SCORED, RiskBuckets, get_risk, risk_levels
+
+
+def app_get_risk(prob):
+    # The app's original per-row function
+    if prob < 0.49:
+        return "🔴 Very High Risk"
+    elif prob < 0.50:
+        return "🟧 High Risk"
+    elif prob <= 0.50:
+        return "🟨 Medium Risk"
+    else:
+        return "🟩 Very Low Risk"
+
+
+def per_row(prob, c1, c2, c3):
+    labels = ("🔴 Very High Risk", "🟧 High Risk", "🟨 Medium Risk", "🟩 Very Low Risk")
+    return labels[0] if prob < c1 else labels[1] if prob < c2 else labels[2] if prob <= c3 else labels[3]
+
+
+PROBS = np.concatenate([np.random.default_rng(0).uniform(0.4, 0.6, 2000),
+                        [0.0, 0.48, 0.49, 0.4999, 0.5, 0.5001, 0.51, 0.54, 1.0]])
+
+
+def test_legacy_buckets_match_app_get_risk():
+    expected = [app_get_risk(p) for p in PROBS]
+    assert risk_levels(PROBS).tolist() == expected
+    assert [get_risk(p) for p in PROBS] == expected
+    assert [LEGACY_BUCKETS.label(p) for p in PROBS] == expected
+
+
+def test_artifact_thresholds():
+    buckets = RiskBuckets.from_thresholds({'q25': 0.48, 'q50': 0.51, 'q75': 0.54, 'youden': 0.5})
+    assert buckets.bucket(PROBS).tolist() == [per_row(p, 0.48, 0.51, 0.54) for p in PROBS]
+    # Scalar and array paths agree, as the app and batch scorers rely on
+    assert [buckets.label(p) for p in PROBS] == buckets.bucket(PROBS).tolist()
+    assert RiskBuckets.from_thresholds({'q25': 0.48}).cuts.tolist() == LEGACY_BUCKETS.cuts.tolist()
+
+
+def test_nan_is_not_scored_and_cuts_are_validated():
+    assert risk_levels([np.nan, 0.3]).tolist() == [NOT_SCORED, "🔴 Very High Risk"]
+    for cuts in [(0.5, 0.4, 0.6), (0.1, 0.2), (0.1, np.nan, 0.3)]:
+        with pytest.raises(ValueError):
+            RiskBuckets(cuts)
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from bankruptcy.bootstrap import fit_bootstrap
+from bankruptcy.features import FINANCIAL_COLUMNS, compute_ratios
+from bankruptcy.quality import describe_flags
+from bankruptcy.registry import ModelRegistry
+from bankruptcy.risk import NOT_SCORED
+from bankruptcy.scoring import score_frame
+
+FILINGS = pd.DataFrame({
+    'tic': ['A', 'B'], 'fyear': [2020, 2020], 'industry': ['Tech', 'Tech'],
+    'act': [50.0, 40.0], 'lct': [30.0, 35.0], 'at': [100.0, 90.0], 'seq': [20.0, np.nan],
+    'ebit': [8.0, 3.0], 'sale': [120.0, 80.0], 'lt': [60.0, 70.0], 'prcc_f': [12.0, 4.0], 'csho': [5.0, 6.0],
+})
+
+
+def test_intervals_use_gated_ratios():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 5))
+    registry = ModelRegistry()
+    bundle = registry.get('Tech')
+    bundle.bootstrap = fit_bootstrap(X, (X[:, 0] > 0).astype(int), n_models=20, max_workers=1)
+
+    scored = score_frame(FILINGS, registry, interval_level=0.9)
+    # Row B has a missing input: its raw X2 is NaN but it is imputed and scored
+    assert np.isnan(scored.loc[1, 'X2']) and np.isfinite(scored.loc[1, 'ML_Probability'])
+    inputs = {c: FILINGS[c].to_numpy() for c in FINANCIAL_COLUMNS}
+    gated = bundle.quality.check(compute_ratios(inputs), inputs).X
+    lower, _, upper = bundle.bootstrap.intervals(gated, 0.9)
+    np.testing.assert_allclose(scored['ML_Prob_Lower'], lower)
+    np.testing.assert_allclose(scored['ML_Prob_Upper'], upper)
+    assert np.isfinite(scored[['ML_Prob_Lower', 'ML_Prob_Upper']].to_numpy()).all()
+
+
+def test_unknown_industry_is_kept_and_left_unscored():
+    filings = FILINGS.assign(industry=['Retail', None])
+    scored = score_frame(filings, ModelRegistry(), industry='Healthcare')
+    # No legacy Retail model: the row keeps its industry and is not scored
+    assert scored['industry'].tolist() == ['Retail', 'Healthcare']
+    assert np.isnan(scored.loc[0, ['Z_Score', 'ML_Probability']].astype(float)).all()
+    assert scored.loc[0, 'Risk_Level'] == NOT_SCORED
+    assert describe_flags(scored.loc[0, 'DQ_Flags']) == ['unknown_industry']
+    assert np.isfinite(scored.loc[1, 'ML_Probability'])
+    quality = scored.attrs['quality']
+    assert quality['unknown_industry'] == 1 and quality['rows'] == 2 and quality['rejected'] == 1
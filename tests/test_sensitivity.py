@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from bankruptcy.features import FEATURES, FINANCIAL_COLUMNS, compute_ratios
+from bankruptcy.folded import FoldedLDA
+from bankruptcy.sensitivity import grid_sweep, ratio_jacobian, sensitivities, sweep_range
+
+FOLDED = FoldedLDA([1.2, 0.8, 3.0, 0.05, 0.4], -0.6)
+Z_WEIGHTS = dict(zip(FEATURES, [1.2, 1.4, 3.3, 0.6, 1.0]))
+INPUTS = {'act': 50.0, 'lct': 30.0, 'at': 100.0, 'seq': 20.0, 'ebit': 8.0, 'sale': 120.0,
+          'lt': 60.0, 'prcc_f': 12.0, 'csho': 5.0}
+
+
+def ratios(inputs):
+    return compute_ratios({c: [inputs[c]] for c in FINANCIAL_COLUMNS})
+
+
+def central_difference(f, c):
+    h = 1e-6 * max(abs(INPUTS[c]), 1.0)
+    return (f({**INPUTS, c: INPUTS[c] + h}) - f({**INPUTS, c: INPUTS[c] - h})) / (2 * h)
+
+
+def test_analytic_gradients_match_finite_differences():
+    result = sensitivities(FOLDED, INPUTS, Z_WEIGHTS)
+    weights = np.array([Z_WEIGHTS[f] for f in FEATURES])
+    for c in FINANCIAL_COLUMNS:
+        dp = central_difference(lambda v: FOLDED.predict_proba(ratios(v))[0], c)
+        dz = central_difference(lambda v: float(ratios(v)[0] @ weights), c)
+        assert result.loc[c, 'dProb_dInput'] == pytest.approx(dp, rel=1e-6, abs=1e-10)
+        assert result.loc[c, 'dZ_dInput'] == pytest.approx(dz, rel=1e-6, abs=1e-10)
+    assert result.loc['at', 'dProb_per_1pct'] == pytest.approx(result.loc['at', 'dProb_dInput'])
+
+
+def test_zero_denominators_give_nan():
+    J = ratio_jacobian({**INPUTS, 'at': 0.0})
+    assert np.isnan(J[[0, 1, 2, 4]][:, FINANCIAL_COLUMNS.index('at')]).all()
+    assert np.isfinite(J[3]).all()
+
+
+def test_grid_sweep_matches_pointwise_scoring():
+    xs, ys = sweep_range(INPUTS['at'], n=7), sweep_range(INPUTS['ebit'], n=5)
+    grid = grid_sweep(FOLDED, INPUTS, 'at', xs, 'ebit', ys)
+    assert grid.shape == (5, 7)
+    for i, y in enumerate(ys):
+        for j, x in enumerate(xs):
+            assert grid[i, j] == pytest.approx(FOLDED.predict_proba(ratios({**INPUTS, 'at': x, 'ebit': y}))[0],
+                                               abs=1e-15)
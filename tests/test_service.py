@@ -0,0 +1,53 @@
+import asyncio
+import json
+
+import pytest
+
+from bankruptcy.registry import ModelRegistry
+from bankruptcy.risk import NOT_SCORED
+from bankruptcy.service import MicroBatcher, ScoringServer, validate_record
+
+GOOD = {'tic': 'A', 'fyear': 2020, 'industry': 'Tech', 'act': 50, 'lct': 30, 'at': 100, 'seq': 20,
+        'ebit': 8, 'sale': 120, 'lt': 60, 'prcc_f': 12, 'csho': 5}
+
+
+def test_validate_record_converts_numbers():
+    record = validate_record({**GOOD, 'at': '100', 'ebit': None})
+    assert record['at'] == 100.0
+    assert record['ebit'] != record['ebit']  # NaN
+
+
+@pytest.mark.parametrize('bad', [{'at': 'n/a'}, {'at': [1]}, {'at': True}, {'industry': ['Tech']}])
+def test_validate_record_rejects(bad):
+    with pytest.raises(ValueError):
+        validate_record({**GOOD, **bad})
+
+
+def test_bad_request_does_not_fail_its_batch():
+    async def run():
+        batcher = MicroBatcher(ModelRegistry(), max_wait=0.05)
+        server = ScoringServer(batcher)
+        batcher.start()
+        bodies = [json.dumps(GOOD)] * 5 + [json.dumps({**GOOD, 'at': 'n/a'}),
+                                           json.dumps({**GOOD, 'industry': ['x']})]
+        routed = await asyncio.gather(*(server._route('POST', '/score', body) for body in bodies))
+        # Unvalidated records reaching the batcher only fail their own future
+        direct = await asyncio.gather(batcher.score(GOOD), batcher.score({**GOOD, 'at': [1, 2]}),
+                                      return_exceptions=True)
+        await batcher.stop()
+        return routed, direct
+
+    routed, direct = asyncio.run(run())
+    assert [status for status, _ in routed] == [200] * 5 + [400, 400]
+    assert 0.0 <= direct[0]['ML_Probability'] <= 1.0
+    assert isinstance(direct[1], Exception)
+
+
+def test_unknown_industry_is_echoed_unscored():
+    batcher = MicroBatcher(ModelRegistry(), default_industry='Healthcare')
+    retail, default, tech = batcher.score_records([{**GOOD, 'industry': 'Retail'}, {**GOOD, 'industry': None}, GOOD])
+    assert retail['industry'] == 'Retail'
+    assert retail['ML_Probability'] is None and retail['Z_Score'] is None
+    assert retail['Risk_Level'] == NOT_SCORED and retail['DQ_Flags'] == ['unknown_industry']
+    assert default['industry'] == 'Healthcare' and default['ML_Probability'] is not None
+    assert tech['industry'] == 'Tech' and tech['ML_Probability'] is not None
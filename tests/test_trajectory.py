@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from bankruptcy.features import FEATURES
+from bankruptcy.trajectory import risk_trajectories, trajectory_features
+
+
+@pytest.fixture(scope='module')
+def panel():
+    rng = np.random.default_rng(0)
+    rows = [(f'T{t}', year) for t in range(40) for year in range(2000, 2000 + rng.integers(1, 9))]
+    frame = pd.DataFrame(rows, columns=['tic', 'fyear']).sample(frac=1, random_state=0)
+    X = rng.normal(size=(len(frame), 5))
+    X[rng.random(X.shape) < 0.05] = np.nan
+    frame[FEATURES] = X
+    frame['ML_Probability'] = rng.uniform(size=len(frame))
+    return frame
+
+
+def test_features_match_groupby(panel):
+    result = trajectory_features(panel['tic'], panel['fyear'], panel[FEATURES], panel['ML_Probability'], window=3)
+    # Tickers come out in order of first appearance, years ascending within each
+    result = result.sort_values(['tic', 'fyear']).reset_index(drop=True)
+    expected = panel.sort_values(['tic', 'fyear']).reset_index(drop=True)
+    grouped = expected.groupby('tic', sort=False)
+    assert result[['tic', 'fyear']].equals(expected[['tic', 'fyear']])
+    for name in FEATURES + ['ML_Probability']:
+        np.testing.assert_allclose(result[f'd_{name}'], grouped[name].diff(), atol=1e-12)
+        rolling = grouped[name].rolling(3, min_periods=1).mean().reset_index(level=0, drop=True)
+        np.testing.assert_allclose(result[f'roll3_{name}'], rolling, atol=1e-12)
+    np.testing.assert_array_equal(result['years_on_record'], grouped.cumcount() + 1)
+
+
+def test_summaries_match_per_ticker_fits(panel):
+    result = risk_trajectories(panel['tic'], panel['fyear'], panel['ML_Probability'], window=3).set_index('tic')
+    for tic, group in panel.sort_values('fyear').groupby('tic'):
+        row = result.loc[tic]
+        prob = group['ML_Probability'].to_numpy()
+        assert row['n_years'] == len(group) and row['last_fyear'] == group['fyear'].max()
+        assert row['latest_probability'] == prob[-1] and row['min_probability'] == prob.min()
+        assert row['mean_probability'] == pytest.approx(prob.mean())
+        assert row['change_3y'] == pytest.approx(prob[-1] - prob[max(len(prob) - 3, 0)])
+        if len(group) > 1:
+            assert row['probability_slope'] == pytest.approx(np.polyfit(group['fyear'], prob, 1)[0])
+        else:
+            assert row['probability_trend'] == 'insufficient history'
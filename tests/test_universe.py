@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from bankruptcy import instrument
+from bankruptcy.ingest import COLUMNS_TO_KEEP, ingest_csv, read_store
+from bankruptcy.registry import ModelRegistry
+from bankruptcy.scoring import score_frame
+from bankruptcy.universe import score_universe, store_partitions
+
+pytest.importorskip('pyarrow')
+
+# Healthcare and Tech have models in the default registry, Retail does not
+SICS = {'Healthcare': 8011, 'Tech': 7372, 'Retail': 5411}
+
+
+def write_funda(path, rng):
+    rows = []
+    for industry, sic in SICS.items():
+        for fyear in (2019, 2020):
+            for i in range(25):
+                rows.append({'tic': f'{industry[:2].upper()}{i}', 'fyear': fyear, 'sic': sic,
+                             **{c: v for c, v in zip(COLUMNS_TO_KEEP[2:11], rng.uniform(1, 100, size=9))}})
+    pd.DataFrame(rows, columns=COLUMNS_TO_KEEP).to_csv(path, index=False)
+
+
+def test_universe_matches_score_frame(tmp_path):
+    source = tmp_path / 'funda.csv'
+    write_funda(source, np.random.default_rng(0))
+    store, out = tmp_path / 'store', tmp_path / 'scored'
+    ingest_csv(source, store)
+    assert len(store_partitions(store)) == 6
+
+    instrument.enable()
+    try:
+        summary = score_universe(str(store), str(out), backend='process', max_workers=2)
+        counters = instrument.snapshot()['counters']
+    finally:
+        instrument.reset()
+        instrument.enable(False)
+
+    assert summary['partitions'] == 4 and summary['skipped_partitions'] == {'Retail': 2}
+    assert summary['rows'] == summary['scored'] == 100
+    assert summary['industries'] == {'Healthcare': 50, 'Tech': 50}
+    # Each worker's counter is merged back into the parent
+    assert counters['universe_rows'] == 100
+
+    registry = ModelRegistry()
+    scored = pd.read_parquet(out)
+    for industry in ('Healthcare', 'Tech'):
+        frame = read_store(store, industries=[industry])
+        frame['industry'] = industry
+        expected = score_frame(frame, registry, industry=industry).sort_values(['fyear', 'tic'])
+        got = scored[scored['industry'] == industry].sort_values(['fyear', 'tic'])
+        assert (got['Model_Version'] == registry.get(industry).version).all()
+        np.testing.assert_allclose(got['ML_Probability'].to_numpy(), expected['ML_Probability'].to_numpy())
+        assert got['Risk_Level'].tolist() == expected['Risk_Level'].tolist()